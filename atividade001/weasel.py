@@ -1,52 +1,62 @@
-import random
+# Interface em português do pacote compartilhado `weaselcore` (uma pasta
+# acima): os motores e as otimizações ficam lá, aqui só os nomes e as mensagens
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from weaselcore import CHARACTERS, reference  # noqa: E402
+from weaselcore.runner import ConsoleSink, NullSink, evolve, generations  # noqa: E402
 
 FRASE_ALVO = "METHINKS IT IS LIKE A WEASEL"
 TAMANHO_POPULACAO = 100
 TAXA_MUTACAO = 0.05
-CARACTERES = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+CARACTERES = CHARACTERS
 
 def caractere_aleatorio():
-    return random.choice(CARACTERES)
+    return reference.random_character()
 
 def frase_aleatoria(tamanho):
     # Etapa 1: Gera uma frase aleatória do mesmo tamanho da frase alvo
-    return ''.join(caractere_aleatorio() for _ in range(tamanho))
+    return reference.random_phrase(tamanho)
 
 def mutar(frase):
     # Etapa 3: Aplica mutações em cada caractere da frase, com 5% de chance
-    return ''.join(
-        caractere_aleatorio() if random.random() < TAXA_MUTACAO else c
-        for c in frase
-    )
+    return reference.mutate(frase, TAXA_MUTACAO)
 
 def pontuacao(frase):
     # Etapa 4: Pontua cada cópia comparando com a frase alvo
-    return sum(1 for a, b in zip(frase, FRASE_ALVO) if a == b)
-
-def main():
-    # Etapa 1: Gera a frase inicial aleatória
-    frase = frase_aleatoria(len(FRASE_ALVO))
-    geracao = 0
-
-    while True:
-        geracao += 1
-        # Etapa 2: Cria 100 cópias da frase (com mutações)
-        populacao = [mutar(frase) for _ in range(TAMANHO_POPULACAO)]
-        # Etapa 4: Pontua cada cópia
-        pontuacoes = [pontuacao(f) for f in populacao]
-        # Etapa 5: Seleciona a melhor cópia para próxima geração
-        melhor_pontuacao = max(pontuacoes)
-        melhor_frase = populacao[pontuacoes.index(melhor_pontuacao)]
-
-        print(f"Geração {geracao}: {melhor_frase} (Pontuação: {melhor_pontuacao})")
-
-        # Etapa 6: Verifica se encontrou a frase alvo
-        if melhor_pontuacao == len(FRASE_ALVO):
-            print(f"Frase alvo encontrada em {geracao} gerações!")
-            break
-
-        # Etapa 5: Usa a melhor frase como base para próxima geração
-        frase = melhor_frase
+    return reference.score(frase, FRASE_ALVO)
+
+def geracoes(max_geracoes=None, motor="loop", semente=None):
+    # Gera (geração, melhor frase, pontuação) uma geração por vez, sob demanda,
+    # até encontrar a frase alvo (último item) ou após `max_geracoes`.
+    # `motor` é um dos motores de weaselcore.ENGINES
+    for registro in generations(
+        motor, TAMANHO_POPULACAO, semente, TAXA_MUTACAO, FRASE_ALVO, max_geracoes
+    ):
+        yield registro.generation, registro.best, registro.score
+
+def main(exibir=True, max_geracoes=None, a_cada=1, motor="loop", semente=None):
+    # `exibir=False` desliga as mensagens (para benchmarks); retorna
+    # (gerações, encontrou) — para após `max_geracoes`, se informado.
+    # `a_cada` mostra só uma geração a cada N (a última sempre aparece)
+    saida = NullSink()
+    if exibir:
+        saida = ConsoleSink(
+            a_cada,
+            line="Geração {generation}: {best} (Pontuação: {score})",
+            done="Frase alvo encontrada em {generation} gerações!",
+        )
+    return evolve(
+        motor,
+        TAMANHO_POPULACAO,
+        semente,
+        rate=TAXA_MUTACAO,
+        target=FRASE_ALVO,
+        max_generations=max_geracoes,
+        sink=saida,
+    )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
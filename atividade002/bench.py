@@ -0,0 +1,179 @@
+import argparse
+import csv
+import importlib.util
+import itertools
+import json
+import os
+import random
+import time
+
+import weasel
+
+FIELDS = [
+    "engine",
+    "population",
+    "mutation_rate",
+    "length",
+    "seed",
+    "generations",
+    "found",
+    "seconds",
+    "generations_per_second",
+]
+ENGINES = ("atividade001",) + tuple(weasel.ENGINES)
+NUMPY_ENGINES = tuple(
+    name for name, engine in weasel.ENGINES.items() if engine.uses_numpy
+)
+
+
+def target_of_length(length):
+    # Target phrase of any length: TARGET_PHRASE repeated and cut
+    repeats = length // len(weasel.TARGET_PHRASE) + 1
+    return (weasel.TARGET_PHRASE * repeats)[:length]
+
+
+def load_atividade001():
+    # atividade001/weasel.py is loaded under its own name (both files are "weasel")
+    path = os.path.join(os.path.dirname(__file__), "..", "atividade001", "weasel.py")
+    spec = importlib.util.spec_from_file_location("atividade001_weasel", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_once(engine, population, rate, target, seed, max_generations, original=None):
+    # One silent run to convergence (or max_generations); returns a report row
+    start = time.perf_counter()
+    if engine == "atividade001":
+        # the original program reads its settings from module globals
+        original.FRASE_ALVO = target
+        original.TAMANHO_POPULACAO = population
+        original.TAXA_MUTACAO = rate
+        random.seed(seed)
+        generations, found = original.main(exibir=False, max_geracoes=max_generations)
+    else:
+        generations, found = weasel.evolve(
+            engine,
+            population,
+            seed,
+            verbose=False,
+            rate=rate,
+            target=target,
+            max_generations=max_generations,
+        )
+    seconds = time.perf_counter() - start
+    return {
+        "engine": engine,
+        "population": population,
+        "mutation_rate": rate,
+        "length": len(target),
+        "seed": seed,
+        "generations": generations,
+        "found": found,
+        "seconds": seconds,
+        "generations_per_second": generations / seconds if seconds > 0 else 0.0,
+    }
+
+
+def run_grid(engines, populations, rates, lengths, seeds, max_generations=2_000):
+    # Every engine on every (population, rate, length, seed) combination
+    original = load_atividade001() if "atividade001" in engines else None
+    rows = []
+    for population, rate, length, seed in itertools.product(
+        populations, rates, lengths, seeds
+    ):
+        target = target_of_length(length)
+        for engine in engines:
+            rows.append(
+                run_once(
+                    engine, population, rate, target, seed, max_generations, original
+                )
+            )
+    return rows
+
+
+def summarize(rows):
+    # Per engine: runs, share converged, mean generations and generations/second
+    summary = {}
+    for engine in dict.fromkeys(row["engine"] for row in rows):
+        mine = [row for row in rows if row["engine"] == engine]
+        generations = sum(row["generations"] for row in mine)
+        seconds = sum(row["seconds"] for row in mine)
+        summary[engine] = {
+            "runs": len(mine),
+            "found_rate": sum(row["found"] for row in mine) / len(mine),
+            "mean_generations": generations / len(mine),
+            "seconds": seconds,
+            "generations_per_second": generations / seconds if seconds > 0 else 0.0,
+        }
+    return summary
+
+
+def write_csv(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, path):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"summary": summarize(rows), "runs": rows}, fh, indent=2)
+
+
+def number_list(kind):
+    # argparse type for comma-separated lists, e.g. "50,100,200"
+    def parse(text):
+        return [kind(item) for item in text.split(",") if item]
+
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the weasel engines")
+    parser.add_argument(
+        "--engines",
+        type=lambda text: [e for e in text.split(",") if e],
+        default=[e for e in ENGINES if e not in NUMPY_ENGINES or weasel.np is not None],
+        help="comma-separated, from: " + ", ".join(ENGINES),
+    )
+    parser.add_argument("--populations", type=number_list(int), default=[50, 100, 200])
+    parser.add_argument("--rates", type=number_list(float), default=[0.01, 0.05, 0.1])
+    parser.add_argument("--lengths", type=number_list(int), default=[14, 28, 56])
+    parser.add_argument("--seeds", type=number_list(int), default=[0, 1, 2])
+    parser.add_argument(
+        "--max-generations",
+        type=int,
+        default=2_000,
+        help="stop a run that has not converged after this many generations",
+    )
+    parser.add_argument("--csv", metavar="PATH", help="write one row per run here")
+    parser.add_argument("--json", metavar="PATH", help="write summary + runs here")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.engines) - set(ENGINES))
+    if unknown:
+        parser.error(f"unknown engines: {', '.join(unknown)}")
+    if set(NUMPY_ENGINES) & set(args.engines) and weasel.np is None:
+        parser.error(f"the {', '.join(NUMPY_ENGINES)} engines need NumPy installed")
+    rows = run_grid(
+        args.engines,
+        args.populations,
+        args.rates,
+        args.lengths,
+        args.seeds,
+        args.max_generations,
+    )
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.json:
+        write_json(rows, args.json)
+    print(f"{'engine':>12}  {'runs':>5}  {'found':>6}  {'mean gens':>9}  {'gens/s':>10}")
+    for engine, s in summarize(rows).items():
+        print(
+            f"{engine:>12}  {s['runs']:>5}  {s['found_rate']:>6.0%}"
+            f"  {s['mean_generations']:>9.1f}  {s['generations_per_second']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
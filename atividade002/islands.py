@@ -0,0 +1,10 @@
+# Front-end of the island model in the shared weasel package (`weaselcore`)
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from weaselcore.islands import *  # noqa: E402,F401,F403
+
+if __name__ == "__main__":
+    main()
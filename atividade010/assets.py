@@ -65,3 +65,92 @@ def mask_from_surface(surf: pg.Surface) -> pg.mask.Mask:
     mask = pg.mask.from_surface(surf)
     _cache[key] = mask
     return mask
+
+
+# Palette-indexed frames: an 8-bit Surface plus palette where some entries are
+# "swap slots" (by default the near-white pixels). Recolouring a frame only
+# rewrites those palette entries, so effects such as the ship's blink become
+# a cached lookup instead of a per-pixel loop. Index 0 is the transparent key.
+
+
+# Function `is_light(col)` — default swap-slot test: (near) white pixels.
+def is_light(col) -> bool:
+    r, g, b = col[:3]
+    return r >= 220 and g >= 220 and b >= 220
+
+
+class PaletteFrame:
+    # Function `__init__(frame, scale, swap)` — index `frame` at integer `scale`.
+    # `swap(col)` decides which colours become swap slots (None: no slots).
+    def __init__(self, frame: dict, scale: int = 1, swap=is_light):
+        if not isinstance(frame, dict) or "pixels" not in frame:
+            raise ValueError("Invalid frame dict")
+        w = int(frame["w"])
+        h = int(frame["h"])
+        index: Dict[Tuple[int, int, int], int] = {}
+        palette: List[Tuple[int, int, int]] = [(255, 0, 255)]
+        surf0 = pg.Surface((w, h), 0, 8)
+        rows = []
+        for row in frame["pixels"]:
+            out = bytearray(w)
+            for x, (r, g, b, a) in enumerate(row):
+                if a == 0:
+                    continue
+                if a != 255:
+                    raise ValueError("Translucent pixels need a 32-bit surface")
+                col = (r, g, b)
+                i = index.get(col)
+                if i is None:
+                    if len(palette) == 256:
+                        raise ValueError("Frame has more than 255 colours")
+                    i = index[col] = len(palette)
+                    palette.append(col)
+                out[x] = i
+            rows.append(bytes(out))
+        surf0.set_palette(palette)
+        surf0.get_buffer().write(b"".join(self._pad(rows, surf0.get_pitch())))
+        scale = max(1, int(scale))
+        if scale != 1:
+            surf0 = pg.transform.scale(surf0, (w * scale, h * scale))
+        surf0.set_colorkey(0)
+        self.surface = surf0
+        self.palette = palette
+        self.slots = [
+            i for col, i in index.items() if swap is not None and swap(col)
+        ]
+        self._variants: Dict[Tuple[int, ...], pg.Surface] = {}
+
+    # Function `_pad(rows, pitch)` — pad each row of indices to the surface pitch.
+    @staticmethod
+    def _pad(rows, pitch: int):
+        for row in rows:
+            yield row + bytes(pitch - len(row))
+
+    # Function `recolor(color)` — Surface with every swap slot set to `color` (cached).
+    def recolor(self, color) -> pg.Surface:
+        key = tuple(color[:3])
+        surf = self._variants.get(key)
+        if surf is None:
+            palette = list(self.palette)
+            for i in self.slots:
+                palette[i] = key
+            surf = self.surface.copy()
+            surf.set_palette(palette)
+            surf.set_colorkey(0)
+            self._variants[key] = surf
+        return surf
+
+    # Function `bake(colors)` — pre-render one variant per colour, in order.
+    def bake(self, colors) -> List[pg.Surface]:
+        return [self.recolor(col) for col in colors]
+
+
+# Function `palette_frame(frame, scale, swap)` — cached PaletteFrame for an embedded frame.
+
+
+def palette_frame(frame: dict, scale: int = 1, swap=is_light) -> PaletteFrame:
+    key = ("_palette_", id(frame), int(scale), swap)
+    pf = _cache.get(key)
+    if pf is None:
+        pf = _cache[key] = PaletteFrame(frame, scale, swap)
+    return pf
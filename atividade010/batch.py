@@ -0,0 +1,278 @@
+# Module `batch.py` — play out many seeded headless games across a process pool.
+# Used to balance the difficulty constants in config.py: every game runs a
+# fresh `World` with a scripted or random input policy until the player runs
+# out of lives (or a time cap), and the results are merged into one report.
+import argparse
+import json
+import math
+import multiprocessing as mp
+import os
+import random
+import statistics
+import time
+
+import settings
+
+# Frame cost histogram: 50 µs buckets up to 100 ms; the last one collects the rest
+_BUCKET_US = 50
+_BUCKETS = 2000
+
+
+class GameOver(Exception):
+    pass
+
+
+# Function `_make_world()` — World subclass that stops instead of resetting on game over.
+def _make_world():
+    from systems import World
+
+    class BatchWorld(World):
+        def ship_die(self):
+            if self.lives - 1 < 0:
+                raise GameOver()
+            super().ship_die()
+
+    return BatchWorld()
+
+
+# Function `random_policy(world, rng, state)` — hold a random direction/aim for ~0.5 s.
+# Policies return (WASD flags, fire, aim point, hyperspace).
+def random_policy(world, rng, state):
+    if state.get("until", -1.0) <= state["t"]:
+        state["until"] = state["t"] + 0.5
+        state["flags"] = rng.randrange(16)
+        state["aim"] = (
+            rng.uniform(0, settings.S.WIDTH),
+            rng.uniform(0, settings.S.HEIGHT),
+        )
+        state["fire"] = rng.random() < 0.7
+    return state["flags"], state["fire"], state["aim"], False
+
+
+# Function `scripted_policy(world, rng, state)` — flee the nearest threat and shoot at it.
+def scripted_policy(world, rng, state):
+    import replay
+
+    ship = world.ship.pos
+    nearest = None
+    best = math.inf
+    for group in (world.asteroids, world.ufos):
+        for spr in group:
+            d = (spr.pos - ship).length_squared()
+            if d < best:
+                best, nearest = d, spr
+    if nearest is None:
+        return 0, False, None, False
+    away = ship - nearest.pos
+    flags = 0
+    if abs(away.x) > 1:
+        flags |= replay.FLAG_D if away.x > 0 else replay.FLAG_A
+    if abs(away.y) > 1:
+        flags |= replay.FLAG_S if away.y > 0 else replay.FLAG_W
+    # `try_fire` takes screen coordinates, like the mouse
+    aim = world.camera.to_screen(nearest.pos)
+    return flags, True, (aim.x, aim.y), False
+
+
+POLICIES = {
+    "random": random_policy,
+    "scripted": scripted_policy,
+}
+
+
+# Function `_init_worker(config_path, assignments)` — per-process setup.
+# Batch games are silent, so the sound synthesis is switched off before
+# the game modules can start it.
+def _init_worker(config_path, assignments):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import sounds
+
+    sounds.disable()
+    settings.configure(config_path, assignments)
+
+
+# Function `simulate(job)` — play one game; `job` is (seed, policy, max_seconds).
+def simulate(job) -> dict:
+    import replay
+
+    seed, policy_name, max_seconds = job
+    policy = POLICIES[policy_name]
+    random.seed(seed)
+    rng = random.Random(seed ^ 0x5EED)
+    world = _make_world()
+    dt = 1.0 / settings.S.FPS
+    # time is counted in whole frames so a float sum of `dt` cannot drift
+    # past `max_seconds`
+    max_frames = round(max_seconds * settings.S.FPS)
+    state = {"t": 0.0}
+    hist = [0] * _BUCKETS
+    frames = 0
+    over = False
+    clock = time.perf_counter
+    try:
+        while frames < max_frames:
+            flags, fire, aim, shift = policy(world, rng, state)
+            start = clock()
+            if shift:
+                world.hyperspace()
+            if fire:
+                world.try_fire(aim)
+            world.update(dt, replay.InputKeys(flags))
+            cost_us = (clock() - start) * 1e6
+            hist[min(_BUCKETS - 1, int(cost_us / _BUCKET_US))] += 1
+            frames += 1
+            state["t"] = frames * dt
+    except GameOver:
+        over = True
+    return {
+        "seed": seed,
+        "survival": frames * dt,
+        "score": world.score,
+        "game_over": over,
+        "frames": frames,
+        "frame_hist": hist,
+    }
+
+
+# Function `_summary(values)` — min/mean/percentiles/max of a list of numbers.
+def _summary(values) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "min": ordered[0],
+        "mean": statistics.fmean(ordered),
+        "p50": pct(0.50),
+        "p90": pct(0.90),
+        "p99": pct(0.99),
+        "max": ordered[-1],
+    }
+
+
+# Function `_hist_summary(hist)` — percentiles (in ms) from the merged frame-cost histogram.
+def _hist_summary(hist) -> dict:
+    total = sum(hist)
+    if total == 0:
+        return {}
+    out = {}
+    for name, p in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99)):
+        target = p * total
+        acc = 0
+        for i, n in enumerate(hist):
+            acc += n
+            if acc >= target:
+                out[name] = (i + 1) * _BUCKET_US / 1000.0
+                break
+    mean_us = sum((i + 0.5) * _BUCKET_US * n for i, n in enumerate(hist)) / total
+    out["mean"] = mean_us / 1000.0
+    return out
+
+
+# Function `run_batch(games, workers, policy, seed, max_seconds, ...)` — run and aggregate.
+def run_batch(
+    games: int,
+    workers: int | None = None,
+    policy: str = "random",
+    seed: int = 0,
+    max_seconds: float = 300.0,
+    config_path: str | None = None,
+    assignments=(),
+) -> dict:
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; choose from {sorted(POLICIES)}")
+    workers = workers or os.cpu_count() or 1
+    jobs = [(seed + i, policy, max_seconds) for i in range(games)]
+    chunk = max(1, games // (workers * 4))
+    start = time.perf_counter()
+    pool = mp.Pool(
+        workers, initializer=_init_worker, initargs=(config_path, list(assignments))
+    )
+    try:
+        results = list(pool.imap_unordered(simulate, jobs, chunksize=chunk))
+    finally:
+        # close/join rather than terminate: SDL (pulled in by the mixer)
+        # traps SIGTERM in the workers, so Pool.terminate() would hang
+        pool.close()
+        pool.join()
+    wall = time.perf_counter() - start
+    hist = [0] * _BUCKETS
+    for r in results:
+        for i, n in enumerate(r.pop("frame_hist")):
+            hist[i] += n
+    frames = sum(r["frames"] for r in results)
+    return {
+        "games": games,
+        "workers": workers,
+        "policy": policy,
+        "seed": seed,
+        "max_seconds": max_seconds,
+        "settings": settings.parse_assignments(assignments),
+        "wall_seconds": wall,
+        "games_per_second": games / wall if wall > 0 else 0.0,
+        "frames_per_second": frames / wall if wall > 0 else 0.0,
+        "game_over_rate": sum(r["game_over"] for r in results) / max(1, games),
+        "survival_seconds": _summary([r["survival"] for r in results]),
+        "score": _summary([r["score"] for r in results]),
+        "frame_cost_ms": _hist_summary(hist),
+        "runs": sorted(results, key=lambda r: r["seed"]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch headless game simulation")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=300.0,
+        help="simulated time cap per game",
+    )
+    parser.add_argument("--out", metavar="PATH", help="write the JSON report here")
+    settings.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    settings.configure_from_args(parser, args)
+    report = run_batch(
+        args.games,
+        args.workers,
+        args.policy,
+        args.seed,
+        args.max_seconds,
+        args.config,
+        args.set,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    surv = report["survival_seconds"]
+    score = report["score"]
+    cost = report["frame_cost_ms"]
+    print(
+        f"{report['games']} games on {report['workers']} workers in "
+        f"{report['wall_seconds']:.1f}s ({report['games_per_second']:.1f} games/s)"
+    )
+    print(
+        f"survival s: mean {surv['mean']:.1f}  p50 {surv['p50']:.1f}  "
+        f"p90 {surv['p90']:.1f}  max {surv['max']:.1f}"
+    )
+    print(
+        f"score:      mean {score['mean']:.0f}  p50 {score['p50']}  "
+        f"p90 {score['p90']}  max {score['max']}"
+    )
+    print(
+        f"frame ms:   mean {cost['mean']:.3f}  p50 {cost['p50']:.2f}  "
+        f"p90 {cost['p90']:.2f}  p99 {cost['p99']:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Module `bench.py` — headless update/draw cost as the world grows.
+# Populates worlds of increasing size with seeded asteroids and UFOs and
+# times `World.update` and `World.draw` per frame, along with how many
+# entities the level-of-detail tiers skipped. Two sweeps are run:
+#   fixed   the same population in every world (cost should stay flat)
+#   density population grows with the area (cost per entity should stay flat)
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+import settings
+
+
+# Function `_populate(world, asteroids, ufos, rng)` — scatter entities over the whole world.
+def _populate(world, asteroids: int, ufos: int, rng):
+    from sprites import UFO
+    from utils import Vec, world_size
+
+    width, height = world_size()
+    for _ in range(asteroids):
+        ang = rng.uniform(0, math.tau)
+        speed = rng.uniform(settings.S.AST_VEL_MIN, settings.S.AST_VEL_MAX)
+        world.spawn_asteroid(
+            Vec(rng.uniform(0, width), rng.uniform(0, height)),
+            Vec(math.cos(ang), math.sin(ang)) * speed,
+            rng.choice("SML"),
+        )
+    for _ in range(ufos):
+        ufo = UFO(Vec(rng.uniform(0, width), rng.uniform(0, height)), rng.random() < 0.5)
+        world.ufos.add(ufo)
+        world.all_sprites.add(ufo)
+
+
+# Function `measure(scale, asteroids, ufos, frames, seed, config_path, assignments)` — time one world size.
+# `scale` multiplies both world dimensions relative to the screen; the
+# settings overrides (e.g. LOD_FAR_EVERY=1) apply on top, except the world size.
+def measure(
+    scale: int,
+    asteroids: int,
+    ufos: int,
+    frames: int,
+    seed: int,
+    config_path: str | None = None,
+    assignments=(),
+) -> dict:
+    import pygame as pg
+
+    import replay
+    import spawner
+    from systems import World
+
+    settings.configure(
+        config_path,
+        [
+            *assignments,
+            f"WORLD_WIDTH={settings.S.WIDTH * scale}",
+            f"WORLD_HEIGHT={settings.S.HEIGHT * scale}",
+        ],
+    )
+    random.seed(seed)
+    world = World()
+    # no timed spawns and a permanently safe ship: only the seeded population runs
+    world.spawns = spawner.SpawnScheduler()
+    world.safe = math.inf
+    _populate(world, asteroids, ufos, random.Random(seed))
+    surf = pg.Surface((settings.S.WIDTH, settings.S.HEIGHT))
+    font = pg.font.Font(None, 20)
+    keys = replay.InputKeys(replay.FLAG_D | replay.FLAG_S)
+    dt = 1.0 / settings.S.FPS
+    clock = time.perf_counter
+    update_s = draw_s = 0.0
+    drawn = culled = entities = skipped = 0
+    for _ in range(frames):
+        start = clock()
+        world.update(dt, keys)
+        mid = clock()
+        world.draw(surf, font)
+        update_s += mid - start
+        draw_s += clock() - mid
+        drawn += world.render_stats["drawn"]
+        culled += world.render_stats["culled"]
+        skipped += world.lod.stats["skipped"]
+        entities += len(world.all_sprites)
+    return {
+        "scale": scale,
+        "world": [settings.S.WIDTH * scale, settings.S.HEIGHT * scale],
+        "entities": entities / frames,
+        "update_ms": update_s / frames * 1000.0,
+        "draw_ms": draw_s / frames * 1000.0,
+        "update_us_per_entity": update_s / max(1, entities) * 1e6,
+        "drawn": drawn / frames,
+        "culled": culled / frames,
+        "lod_skipped": skipped / frames,
+    }
+
+
+# Function `run(scales, asteroids, ufos, frames, seed, config_path, assignments)` — both sweeps.
+def run(
+    scales,
+    asteroids: int = 60,
+    ufos: int = 4,
+    frames: int = 300,
+    seed: int = 0,
+    config_path: str | None = None,
+    assignments=(),
+) -> dict:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame as pg
+
+    pg.init()
+    report = {"fixed": [], "density": []}
+    for scale in scales:
+        report["fixed"].append(
+            measure(scale, asteroids, ufos, frames, seed, config_path, assignments)
+        )
+        area = scale * scale
+        report["density"].append(
+            measure(
+                scale,
+                asteroids * area,
+                ufos * area,
+                frames,
+                seed,
+                config_path,
+                assignments,
+            )
+        )
+    settings.configure(config_path, assignments)
+    pg.quit()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="World update/draw cost vs map size")
+    parser.add_argument(
+        "--scales",
+        default="1,2,4,8",
+        help="comma-separated world size multipliers (per axis)",
+    )
+    parser.add_argument("--asteroids", type=int, default=60, help="per screen area")
+    parser.add_argument("--ufos", type=int, default=4, help="per screen area")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", metavar="PATH", help="write the JSON report here")
+    settings.add_arguments(parser)
+    args = parser.parse_args(argv)
+    # validate the overrides up front; `run` reapplies them per scale
+    settings.configure_from_args(parser, args)
+    scales = [int(s) for s in args.scales.split(",") if s]
+    report = run(
+        scales,
+        args.asteroids,
+        args.ufos,
+        args.frames,
+        args.seed,
+        args.config,
+        args.set,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    for sweep in ("fixed", "density"):
+        print(f"{sweep}:")
+        print(
+            "  scale  entities  update ms  us/entity  draw ms  drawn  culled  skipped"
+        )
+        for r in report[sweep]:
+            print(
+                f"  {r['scale']:>5}  {r['entities']:>8.0f}  {r['update_ms']:>9.3f}"
+                f"  {r['update_us_per_entity']:>9.2f}  {r['draw_ms']:>7.3f}"
+                f"  {r['drawn']:>5.0f}  {r['culled']:>6.0f}  {r['lod_skipped']:>7.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Module `camera.py` — screen-sized view onto the toroidal world.
+# When the world is larger than the screen the camera centres on a target
+# (the ship) and converts between world and screen coordinates; when both
+# sizes match it stays at the origin and every conversion is the identity.
+import pygame as pg
+
+import settings
+from utils import Vec, world_size
+
+
+class Camera:
+    def __init__(self, width: int | None = None, height: int | None = None):
+        width = settings.S.WIDTH if width is None else width
+        height = settings.S.HEIGHT if height is None else height
+        self.world_w, self.world_h = world_size()
+        # view rectangle in world coordinates (its top-left is kept inside the world)
+        self.rect = pg.Rect(0, 0, width, height)
+        self.scroll_x = self.world_w > width
+        self.scroll_y = self.world_h > height
+        self.scrolling = self.scroll_x or self.scroll_y
+
+    # Function `follow(pos)` — centre the view on `pos` along each scrolling axis.
+    def follow(self, pos: Vec):
+        if self.scroll_x:
+            self.rect.left = int(pos.x - self.rect.width / 2) % self.world_w
+        if self.scroll_y:
+            self.rect.top = int(pos.y - self.rect.height / 2) % self.world_h
+
+    # Function `to_screen(pos)` — screen position of world point `pos`.
+    def to_screen(self, pos):
+        if not self.scrolling:
+            return pos
+        return Vec(
+            (pos[0] - self.rect.left) % self.world_w,
+            (pos[1] - self.rect.top) % self.world_h,
+        )
+
+    # Function `to_world(point, near)` — world point under screen `point`.
+    # The result is unwrapped around `near` (normally the ship) so that
+    # `result - near` matches what the player sees on screen.
+    def to_world(self, point, near: Vec):
+        if not self.scrolling:
+            return point
+        seen = self.to_screen(near)
+        return Vec(near.x + point[0] - seen.x, near.y + point[1] - seen.y)
@@ -5,6 +5,19 @@ WIDTH = 920
 HEIGHT = 700
 FPS = 60
 
+# Playfield (toroidal world) size; None = same as the screen. When larger,
+# the camera follows the ship and the view scrolls.
+# World
+WORLD_WIDTH = None
+WORLD_HEIGHT = None
+# Cell size (pixels) of the spatial grid used for collision queries
+GRID_CELL_SIZE = 128
+# Level of detail: asteroids/UFOs farther than LOD_NEAR_DIST (px along either
+# axis, around the wrap) from the ship only update every LOD_FAR_EVERY
+# frames, with the skipped time applied in one step. 1 = every frame.
+LOD_NEAR_DIST = 800.0
+LOD_FAR_EVERY = 4
+
 # General game parameters such as lives and timing between events
 # Game
 START_LIVES = 3
@@ -62,12 +75,22 @@ UFO_ORBIT_TANGENTIAL = (
 )
 UFO_ORBIT_RADIAL = 0.15  # how much UFO moves inward/outward toward player
 UFO_ORBIT_MAX_TURN = 3.0  # how quickly UFO can change direction (smoothing)
+# UFOs farther than this (px) from the ship fly straight instead of orbiting.
+# The default is beyond any distance on a screen-sized world.
+UFO_STEER_DIST = 1200.0
 # Per-UFO random variation (fractional). e.g. 0.25 => +/-25% variation
 UFO_ORBIT_VARIANCE = 0.25
 # How many UFOs to spawn each time the UFO spawn timer fires.
 # Increase this to have multiple UFOs appear at once.
 UFO_SPAWN_COUNT = 1
 
+# Particles: debris and sparks from explosions, trails behind player bullets.
+# PARTICLE_BUDGET caps the live particles (the oldest are recycled); 0 disables them.
+PARTICLE_BUDGET = 1024
+PARTICLE_LIFE = 0.6  # seconds, longest life of a burst particle
+PARTICLE_SPEED = 140.0  # px/s, fastest burst particle
+PARTICLE_TRAILS = True
+
 # Barrel settings
 BARREL_SPAWN_INTERVAL_MIN = 4.0
 BARREL_SPAWN_INTERVAL_MAX = 12.0
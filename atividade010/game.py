@@ -4,7 +4,9 @@ from dataclasses import dataclass
 
 import pygame as pg
 
-import config as C
+import settings
+import replay
+import sounds
 from systems import World
 from utils import text
 
@@ -24,46 +26,60 @@ class Scene:
 
 class Game:
     # Initialize pygame, fonts, window and the game world
-    def __init__(self):
+    # `record` is an optional replay file path that captures the play session
+    def __init__(self, record: str | None = None):
         pg.init()
-        if C.RANDOM_SEED is not None:
-            random.seed(C.RANDOM_SEED)
+        if settings.S.RANDOM_SEED is not None:
+            random.seed(settings.S.RANDOM_SEED)
         # Open the window at the resolution defined in config
-        self.screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
+        self.screen = pg.display.set_mode((settings.S.WIDTH, settings.S.HEIGHT))
         pg.display.set_caption("Asteroids")
         self.clock = pg.time.Clock()
         self.font = pg.font.SysFont("consolas", 20)
         self.big = pg.font.SysFont("consolas", 48)
+        # synthesize the sound effects in the background while the menu shows
+        sounds.start()
         self.scene = Scene("menu")
         self.world = World()
+        self.record = record
+        self.recorder = None
 
     # Main game loop that processes events and updates the scene
     def run(self):
         while True:
-            dt = self.clock.tick(C.FPS) / 1000.0
+            dt_ms = self.clock.tick(settings.S.FPS)
+            dt = dt_ms / 1000.0
+            shift = False
             for e in pg.event.get():
                 if e.type == pg.QUIT:
-                    pg.quit()
-                    sys.exit(0)
+                    self.quit()
                 if e.type == pg.KEYDOWN and e.key == pg.K_ESCAPE:
-                    pg.quit()
-                    sys.exit(0)
+                    self.quit()
                 # Inputs depend on the current scene
                 if self.scene.name == "play":
                     # Hyperspace via Shift key (event)
                     if e.type == pg.KEYDOWN and e.key == pg.K_LSHIFT:
                         self.world.hyperspace()
+                        shift = True
                 elif self.scene.name == "menu":
                     if e.type == pg.KEYDOWN:
-                        self.scene = Scene("play")
+                        self.start_play()
 
             keys = pg.key.get_pressed()
             # Allow shooting while the left mouse button is held
             mouse_buttons = pg.mouse.get_pressed()
             if self.scene.name == "play" and mouse_buttons[0]:
                 self.world.try_fire()
+            if self.scene.name == "play" and self.recorder is not None:
+                self.recorder.write(
+                    dt_ms,
+                    replay.key_flags(keys),
+                    mouse_buttons[0],
+                    shift,
+                    pg.mouse.get_pos(),
+                )
 
-            self.screen.fill(C.BLACK)
+            self.screen.fill(settings.S.BLACK)
 
             if self.scene.name == "menu":
                 self.draw_menu()
@@ -74,23 +90,40 @@ class Game:
 
             pg.display.flip()
 
+    # Switch to the play scene; when recording, reseed and start a fresh world
+    # so the replay can rebuild the exact same session from its seed
+    def start_play(self):
+        if self.record and self.recorder is None:
+            self.recorder = replay.Recorder(self.record, settings.S.RANDOM_SEED)
+            random.seed(self.recorder.seed)
+            self.world = World()
+        self.scene = Scene("play")
+
+    # Close the replay file (if any) and exit
+    def quit(self):
+        if self.recorder is not None:
+            self.recorder.close()
+        sounds.shutdown()
+        pg.quit()
+        sys.exit(0)
+
     # Draw the initial menu
     def draw_menu(self):
         # Centered menu layout
-        title_surf = self.big.render("SPACE ROBOT", True, C.WHITE)
-        title_rect = title_surf.get_rect(center=(C.WIDTH // 2, 160))
+        title_surf = self.big.render("SPACE ROBOT", True, settings.S.WHITE)
+        title_rect = title_surf.get_rect(center=(settings.S.WIDTH // 2, 160))
         self.screen.blit(title_surf, title_rect)
         info = (
             "WASD: move; Right-click: shoot; Mouse: rotate aim; Shift: hyperspace"
         )
-        info_surf = self.font.render(info, True, C.WHITE)
-        info_rect = info_surf.get_rect(center=(C.WIDTH // 2, 260))
+        info_surf = self.font.render(info, True, settings.S.WHITE)
+        info_rect = info_surf.get_rect(center=(settings.S.WIDTH // 2, 260))
         self.screen.blit(info_surf, info_rect)
 
-        dev_surf = self.font.render("DEVS: Holanda, Clewerton", True, C.WHITE)
-        dev_rect = dev_surf.get_rect(center=(C.WIDTH // 2, 300))
+        dev_surf = self.font.render("DEVS: Holanda, Clewerton", True, settings.S.WHITE)
+        dev_rect = dev_surf.get_rect(center=(settings.S.WIDTH // 2, 300))
         self.screen.blit(dev_surf, dev_rect)
 
-        prompt_surf = self.font.render("Press any key...", True, C.WHITE)
-        prompt_rect = prompt_surf.get_rect(center=(C.WIDTH // 2, 360))
+        prompt_surf = self.font.render("Press any key...", True, settings.S.WHITE)
+        prompt_rect = prompt_surf.get_rect(center=(settings.S.WIDTH // 2, 360))
         self.screen.blit(prompt_surf, prompt_rect)
@@ -0,0 +1,60 @@
+# Module `lod.py` — level-of-detail tiers for entities far from the ship.
+# Near entities (within LOD_NEAR_DIST of the ship along both axes, measured
+# around the wrap) update every frame. Far ones update every LOD_FAR_EVERY
+# frames and carry the skipped time over into that one step. Each far entity
+# gets a phase so their updates are spread evenly instead of bunching up.
+# Tiers are re-tested every frame from plain coordinate math, so an entity
+# that comes close catches up on its owed time at once.
+import settings
+from utils import Vec, world_size
+
+
+class LODTiers:
+    def __init__(self, near: float | None = None, every: int | None = None):
+        # defaults are read here, not at import, so `settings.configure` applies
+        self.near = settings.S.LOD_NEAR_DIST if near is None else near
+        self.every = max(1, int(settings.S.LOD_FAR_EVERY if every is None else every))
+        self.frame = 0
+        self._next_phase = 0
+        self._box = (0.0, 0.0, 1, 1, 2.0 * self.near)
+        # per-frame tier counts (near updates, far updates, far skipped)
+        self.stats = {"near": 0, "far": 0, "skipped": 0}
+
+    # Function `begin(center)` — start a frame; tiers are measured from `center`.
+    def begin(self, center: Vec):
+        self.frame += 1
+        width, height = world_size()
+        near = self.near
+        # near box: [left, left + span) on each axis, wrapping with the world
+        self._box = (center.x - near, center.y - near, width, height, 2.0 * near)
+        stats = self.stats
+        stats["near"] = stats["far"] = stats["skipped"] = 0
+
+    # Function `step(spr, dt)` — time to integrate `spr` by this frame (0.0 = skip it).
+    # `spr` needs `pos` plus the `lod_dt` (owed time) and `lod_phase` attributes.
+    # The near tier is the square box of half-size LOD_NEAR_DIST around the
+    # centre: two modulo tests per entity, no square roots.
+    def step(self, spr, dt: float) -> float:
+        left, top, width, height, span = self._box
+        pos = spr.pos
+        if self.every == 1 or (
+            (pos.x - left) % width < span and (pos.y - top) % height < span
+        ):
+            self.stats["near"] += 1
+            owed = spr.lod_dt
+            if owed:
+                spr.lod_dt = 0.0
+                return owed + dt
+            return dt
+        phase = spr.lod_phase
+        if phase < 0:
+            phase = spr.lod_phase = self._next_phase
+            self._next_phase = (phase + 1) % self.every
+        if (self.frame + phase) % self.every:
+            spr.lod_dt += dt
+            self.stats["skipped"] += 1
+            return 0.0
+        self.stats["far"] += 1
+        owed = spr.lod_dt + dt
+        spr.lod_dt = 0.0
+        return owed
@@ -1,11 +1,26 @@
 # Module `main.py` — short description of this module.
-from game import Game
+import argparse
+
+import settings
 
 
 # Function `main` — describe purpose and behavior.
 # Ponto de entrada simples que inicia o jogo
-def main():
-    Game().run()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Asteroids (atividade010)")
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record the play session to a replay file",
+    )
+    settings.add_arguments(parser)
+    args = parser.parse_args(argv)
+    # Apply overrides before the game modules read any setting
+    settings.configure_from_args(parser, args)
+
+    from game import Game
+
+    Game(record=args.record).run()
 
 
 if __name__ == "__main__":
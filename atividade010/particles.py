@@ -0,0 +1,161 @@
+# Module `particles.py` — array-backed particles for debris, sparks and trails.
+# Particles are not sprites: they live in fixed-size arrays (PARTICLE_BUDGET
+# slots) that are integrated and faded in one vectorized step per frame and
+# drawn as one batch of small blits. New particles reuse the oldest slots once
+# the budget is full, so the cost per frame is capped whatever is emitted.
+# Emission uses its own seeded generator and never touches `random`, so the
+# game simulation (and recorded replays) do not depend on the effects.
+# Without NumPy the system stays empty and every call is a no-op.
+import math
+
+import pygame as pg
+
+import settings
+import render
+from utils import world_size
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Palette indices for `burst(..., color)`
+DEBRIS = 0
+SPARK = 1
+FIRE = 2
+WOOD = 3
+TRAIL = 4
+PALETTE = (
+    (200, 200, 200),
+    (0, 200, 255),
+    (255, 160, 40),
+    (150, 100, 50),
+    (0, 120, 200),
+)
+# Brightness steps used for fading; one pre-rendered dot per colour and step
+FADE_STEPS = 4
+DOT_SIZE = 2
+# Velocity kept per second (drag)
+DRAG = 0.35
+
+
+class ParticleSystem:
+    def __init__(self, budget: int | None = None, seed: int = 0):
+        budget = settings.S.PARTICLE_BUDGET if budget is None else budget
+        self.capacity = budget if np is not None else 0
+        self.live = 0
+        self._cursor = 0
+        if not self.capacity:
+            return
+        n = self.capacity
+        self.pos = np.zeros((n, 2))
+        self.vel = np.zeros((n, 2))
+        self.life = np.zeros(n)
+        self.span = np.ones(n)
+        self.color = np.zeros(n, dtype=np.intp)
+        self._rng = np.random.default_rng(seed)
+        self._dots = _dots()
+
+    # Function `_slots(count)` — next `count` ring slots (oldest first), capped at capacity.
+    def _slots(self, count: int):
+        count = min(count, self.capacity)
+        idx = (self._cursor + np.arange(count)) % self.capacity
+        self._cursor = (self._cursor + count) % self.capacity
+        return idx
+
+    # Function `burst(pos, count, color, speed, life)` — spray `count` particles from `pos`.
+    # Directions are uniform; speed and life vary per particle up to the maxima.
+    def burst(
+        self,
+        pos,
+        count: int,
+        color: int,
+        speed: float | None = None,
+        life: float | None = None,
+    ):
+        if not self.capacity or count <= 0:
+            return
+        speed = settings.S.PARTICLE_SPEED if speed is None else speed
+        life = settings.S.PARTICLE_LIFE if life is None else life
+        idx = self._slots(count)
+        n = len(idx)
+        rng = self._rng
+        ang = rng.uniform(0.0, math.tau, n)
+        mag = rng.uniform(0.2, 1.0, n) * speed
+        self.pos[idx] = (pos[0], pos[1])
+        self.vel[idx, 0] = np.cos(ang) * mag
+        self.vel[idx, 1] = np.sin(ang) * mag
+        span = rng.uniform(0.5, 1.0, n) * life
+        self.life[idx] = span
+        self.span[idx] = span
+        self.color[idx] = color
+        self.live = min(self.capacity, self.live + n)
+
+    # Function `trail(sprites, life)` — one still particle at each sprite's position.
+    def trail(self, sprites, life: float = 0.15):
+        if not self.capacity:
+            return
+        members = sprites.sprites()
+        if not members:
+            return
+        idx = self._slots(len(members))
+        n = len(idx)
+        self.pos[idx] = [(s.pos.x, s.pos.y) for s in members[:n]]
+        self.vel[idx] = 0.0
+        self.life[idx] = life
+        self.span[idx] = life
+        self.color[idx] = TRAIL
+        self.live = min(self.capacity, self.live + n)
+
+    # Function `update(dt)` — move, slow down, wrap and age every live particle.
+    def update(self, dt: float):
+        if not self.live:
+            return
+        life = self.life
+        life -= dt
+        alive = life > 0
+        self.live = int(np.count_nonzero(alive))
+        if not self.live:
+            return
+        pos = self.pos
+        pos += self.vel * dt
+        self.vel *= DRAG**dt
+        width, height = world_size()
+        np.remainder(pos[:, 0], width, out=pos[:, 0])
+        np.remainder(pos[:, 1], height, out=pos[:, 1])
+
+    # Function `queue(renderer, view)` — queue the particles inside `view` as one batch of blits.
+    def queue(self, renderer, view: pg.Rect):
+        if not self.live:
+            return
+        idx = np.flatnonzero(self.life > 0)
+        width, height = world_size()
+        x = (self.pos[idx, 0] - view.left) % width
+        y = (self.pos[idx, 1] - view.top) % height
+        seen = (x < view.width) & (y < view.height)
+        if not seen.any():
+            return
+        idx = idx[seen]
+        # fade: brightness step from the remaining share of life (1..FADE_STEPS)
+        step = np.ceil(self.life[idx] / self.span[idx] * FADE_STEPS).astype(np.intp)
+        np.clip(step, 1, FADE_STEPS, out=step)
+        key = self.color[idx] * FADE_STEPS + (step - 1)
+        dots = self._dots
+        renderer.add_blits(
+            render.PARTICLES,
+            zip(
+                [dots[k] for k in key.tolist()],
+                zip(x[seen].astype(int).tolist(), y[seen].astype(int).tolist()),
+            ),
+        )
+
+
+# Function `_dots()` — one small square per palette colour and fade step (dimmest first).
+def _dots() -> list:
+    dots = []
+    for color in PALETTE:
+        for step in range(1, FADE_STEPS + 1):
+            dot = pg.Surface((DOT_SIZE, DOT_SIZE))
+            dot.fill(tuple(c * step // FADE_STEPS for c in color))
+            dots.append(dot)
+    return dots
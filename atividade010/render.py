@@ -0,0 +1,63 @@
+# Module `render.py` — layered renderer with one batched blit per layer.
+# Sprites declare a `layer` and offer `blit_args()`: a (surface, dest) pair
+# that is queued and submitted with `Surface.blits`, or None when the sprite
+# has to draw itself (vector outlines, blinking rings). Layers are flushed in
+# a fixed order, so draw order no longer depends on sprite insertion order.
+from functools import partial
+
+import pygame as pg
+
+# Layers, back to front
+BACKGROUND = 0
+BARRELS = 1
+ASTEROIDS = 2
+UFOS = 3
+PARTICLES = 4
+PROJECTILES = 5
+SHIP = 6
+HUD = 7
+LAYERS = (BACKGROUND, BARRELS, ASTEROIDS, UFOS, PARTICLES, PROJECTILES, SHIP, HUD)
+
+
+class LayeredRenderer:
+    def __init__(self):
+        # per layer: queued (surface, dest) pairs and queued draw callables
+        self._blits = [[] for _ in LAYERS]
+        self._draws = [[] for _ in LAYERS]
+
+    # Function `add_sprite(spr, offset)` — queue a sprite on its layer.
+    # `offset` shifts world coordinates to the screen (None: no shift).
+    def add_sprite(self, spr, offset=None):
+        args = spr.blit_args()
+        if args is None:
+            if offset is None:
+                self._draws[spr.layer].append(spr.draw)
+            else:
+                self._draws[spr.layer].append(partial(spr.draw, offset=offset))
+        elif offset is None:
+            self._blits[spr.layer].append(args)
+        else:
+            self._blits[spr.layer].append((args[0], args[1].move(offset)))
+
+    # Function `add_blit(layer, surface, dest)` — queue a plain blit.
+    def add_blit(self, layer: int, surface: pg.Surface, dest):
+        self._blits[layer].append((surface, dest))
+
+    # Function `add_blits(layer, pairs)` — queue many (surface, dest) pairs at once.
+    def add_blits(self, layer: int, pairs):
+        self._blits[layer].extend(pairs)
+
+    # Function `add_draw(layer, fn)` — queue `fn(surf)` for shapes that cannot be blitted.
+    def add_draw(self, layer: int, fn):
+        self._draws[layer].append(fn)
+
+    # Function `flush(surf)` — render every layer back to front and clear the queues.
+    # Within a layer the batched blits go first, then the queued draw calls.
+    def flush(self, surf: pg.Surface):
+        for blits, draws in zip(self._blits, self._draws):
+            if blits:
+                surf.blits(blits, doreturn=False)
+                blits.clear()
+            for fn in draws:
+                fn(surf)
+            draws.clear()
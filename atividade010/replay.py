@@ -0,0 +1,210 @@
+# Module `replay.py` — record a play session's inputs and play them back.
+# A replay file holds the RNG seed plus one small record per frame:
+#   flags (u8)  W/A/S/D held, left mouse held, shift pressed, mouse moved
+#   dt    (u16) frame time in milliseconds (what `Clock.tick` returned)
+#   x, y  (i16) mouse position, only present when the "moved" flag is set
+# Feeding the same seed and records into a fresh `World` reproduces the run,
+# so sessions can be fast-forwarded headless as benchmarks or fixtures.
+import argparse
+import os
+import random
+import struct
+import time
+
+import settings
+
+MAGIC = b"A10R"
+VERSION = 1
+_HEADER = struct.Struct("<4sBq")
+_FRAME = struct.Struct("<BH")
+_MOUSE = struct.Struct("<hh")
+
+FLAG_W = 0x01
+FLAG_A = 0x02
+FLAG_S = 0x04
+FLAG_D = 0x08
+FLAG_FIRE = 0x10
+FLAG_SHIFT = 0x20
+FLAG_MOVED = 0x40
+
+
+# Stand-in for `pg.key.get_pressed()` built from a frame's flag byte.
+class InputKeys:
+    __slots__ = ("bits",)
+
+    # pygame key code -> flag bit, filled lazily so this module imports without pygame
+    _KEY_BITS = None
+
+    def __init__(self, bits: int):
+        self.bits = bits
+
+    def __getitem__(self, key) -> bool:
+        table = InputKeys._KEY_BITS
+        if table is None:
+            import pygame as pg
+
+            table = InputKeys._KEY_BITS = {
+                pg.K_w: FLAG_W,
+                pg.K_a: FLAG_A,
+                pg.K_s: FLAG_S,
+                pg.K_d: FLAG_D,
+            }
+        return bool(self.bits & table.get(key, 0))
+
+
+# Function `key_flags(keys)` — pack the WASD state of a key array into flag bits.
+def key_flags(keys) -> int:
+    import pygame as pg
+
+    flags = 0
+    if keys[pg.K_w]:
+        flags |= FLAG_W
+    if keys[pg.K_a]:
+        flags |= FLAG_A
+    if keys[pg.K_s]:
+        flags |= FLAG_S
+    if keys[pg.K_d]:
+        flags |= FLAG_D
+    return flags
+
+
+# Writes the seed header and one delta-encoded record per played frame.
+class Recorder:
+    def __init__(self, path: str, seed: int | None = None):
+        self.path = path
+        self.seed = random.randrange(2**62) if seed is None else int(seed)
+        self.frames = 0
+        self._mouse = None
+        self._fh = open(path, "wb")
+        self._fh.write(_HEADER.pack(MAGIC, VERSION, self.seed))
+
+    # Function `write(dt_ms, keys_bits, fire, shift, mouse)` — append one frame.
+    def write(self, dt_ms: int, keys_bits: int, fire: bool, shift: bool, mouse):
+        flags = keys_bits
+        if fire:
+            flags |= FLAG_FIRE
+        if shift:
+            flags |= FLAG_SHIFT
+        mouse = (int(mouse[0]), int(mouse[1]))
+        moved = mouse != self._mouse
+        if moved:
+            flags |= FLAG_MOVED
+            self._mouse = mouse
+        self._fh.write(_FRAME.pack(flags, max(0, min(0xFFFF, int(dt_ms)))))
+        if moved:
+            self._fh.write(_MOUSE.pack(*mouse))
+        self.frames += 1
+
+    def close(self):
+        if not self._fh.closed:
+            self._fh.close()
+
+
+# Function `read(path)` — return (seed, frames) where frames are (dt_ms, flags, mouse).
+def read(path: str):
+    with open(path, "rb") as fh:
+        data = fh.read()
+    magic, version, seed = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay file")
+    frames = []
+    mouse = (0, 0)
+    offset = _HEADER.size
+    end = len(data)
+    while offset < end:
+        flags, dt_ms = _FRAME.unpack_from(data, offset)
+        offset += _FRAME.size
+        if flags & FLAG_MOVED:
+            mouse = _MOUSE.unpack_from(data, offset)
+            offset += _MOUSE.size
+        frames.append((dt_ms, flags, mouse))
+    return seed, frames
+
+
+# Function `step(world, dt_ms, flags, mouse)` — apply one recorded frame to `world`.
+# Mirrors the order used by `Game.run`: hyperspace event, firing, then update.
+def step(world, dt_ms: int, flags: int, mouse):
+    if flags & FLAG_SHIFT:
+        world.hyperspace()
+    if flags & FLAG_FIRE:
+        world.try_fire(mouse)
+    world.update(dt_ms / 1000.0, InputKeys(flags))
+
+
+# Function `play(path, speed, headless)` — re-run a recorded session.
+# `speed` multiplies the frame rate cap; 0 runs uncapped. Headless runs
+# never draw and return once the recording ends.
+def play(path: str, speed: float = 1.0, headless: bool = False) -> dict:
+    if headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame as pg
+
+    from systems import World
+
+    seed, frames = read(path)
+    pg.init()
+    screen = (
+        None
+        if headless
+        else pg.display.set_mode((settings.S.WIDTH, settings.S.HEIGHT))
+    )
+    font = None if headless else pg.font.SysFont("consolas", 20)
+    clock = pg.time.Clock()
+    random.seed(seed)
+    world = World()
+    start = time.perf_counter()
+    for dt_ms, flags, mouse in frames:
+        step(world, dt_ms, flags, mouse)
+        if screen is not None:
+            for e in pg.event.get():
+                if e.type == pg.QUIT:
+                    pg.quit()
+                    return {}
+            screen.fill(settings.S.BLACK)
+            world.draw(screen, font)
+            pg.display.flip()
+        if speed > 0:
+            clock.tick(settings.S.FPS * speed)
+    elapsed = time.perf_counter() - start
+    pg.quit()
+    return {
+        "frames": len(frames),
+        "seconds": elapsed,
+        "fps": len(frames) / elapsed if elapsed > 0 else 0.0,
+        "score": world.score,
+        "lives": world.lives,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play back a recorded session")
+    parser.add_argument("path", help="replay file written by main.py --record")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="playback speed multiplier; 0 = uncapped (default 1, or 0 headless)",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run without a window",
+    )
+    settings.add_arguments(parser)
+    args = parser.parse_args(argv)
+    settings.configure_from_args(parser, args)
+    speed = args.speed
+    if speed is None:
+        speed = 0.0 if args.headless else 1.0
+    result = play(args.path, speed, args.headless)
+    if result:
+        print(
+            f"{result['frames']} frames in {result['seconds']:.2f}s "
+            f"({result['fps']:.0f} fps)  score {result['score']}  "
+            f"lives {result['lives']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Module `settings.py` — read-only snapshot of `config.py` used by hot paths.
+# Values are validated once at startup and may be overridden from a JSON/TOML
+# file or `--set NAME=VALUE` flags, so tuning does not require editing source.
+# `configure()` replaces the snapshot rather than changing it, so game code
+# reads `settings.S.NAME` (never `from settings import S` or `config` values).
+import argparse
+import json
+
+import config as C
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+# Defaults for optional keys that `config.py` may leave out
+_DEFAULTS = {
+    "BARREL_RADIUS": 12,
+}
+
+# Keys that must be strictly positive numbers
+_POSITIVE = {
+    "WIDTH",
+    "HEIGHT",
+    "FPS",
+    "SHIP_PIXEL_SCALE",
+    "UFO_PIXEL_SCALE",
+    "BARREL_PIXEL_SCALE",
+    "BARREL_HP",
+    "BARREL_RADIUS",
+    "BARREL_TNT_EXPLOSION_RADIUS",
+    "BARREL_TNT_EXPLOSION_TIME",
+    "AST_DIFFICULTY_SCORE_SCALE",
+    "AST_SCORE_SPAWN_FACTOR",
+    "AST_SPAWN_INTERVAL_BASE",
+    "AST_SPAWN_INTERVAL_MIN",
+    "UFO_SPAWN_EVERY",
+    "UFO_SPAWN_COUNT",
+    "BARREL_SPAWN_INTERVAL_MIN",
+    "BARREL_SPAWN_INTERVAL_MAX",
+    "GRID_CELL_SIZE",
+    "LOD_NEAR_DIST",
+    "LOD_FAR_EVERY",
+    "UFO_STEER_DIST",
+    "PARTICLE_LIFE",
+    "PARTICLE_SPEED",
+}
+
+
+def _config_values() -> dict:
+    values = dict(_DEFAULTS)
+    values.update(
+        (name, getattr(C, name)) for name in dir(C) if name.isupper()
+    )
+    return values
+
+
+# Values of `config.py` (plus defaults): the base every snapshot is built from
+_BASE = _config_values()
+
+
+# Frozen attribute bag: one slot per config key, no per-lookup defaults.
+class Settings:
+    __slots__ = tuple(sorted(_BASE))
+
+    def __init__(self, values: dict):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Settings is read-only; use settings.configure()")
+
+    def __delattr__(self, name):
+        raise AttributeError("Settings is read-only; use settings.configure()")
+
+    # Function `as_dict()` — plain dict copy, e.g. for logging or pickling.
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Function `_coerce(name, value, default)` — validate `value` against the type of `default`.
+def _coerce(name: str, value, default):
+    if default is None:
+        # RANDOM_SEED / WORLD_* style keys: None or an int
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, int)
+        ):
+            raise ValueError(f"{name} must be an int or null, got {value!r}")
+        return value
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ValueError(f"{name} must be a bool, got {value!r}")
+        return value
+    if isinstance(default, (int, float)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be a number, got {value!r}")
+        if isinstance(default, int) and not isinstance(value, int):
+            if not float(value).is_integer():
+                raise ValueError(f"{name} must be an integer, got {value!r}")
+            value = int(value)
+        value = type(default)(value)
+        if name in _POSITIVE and value <= 0:
+            raise ValueError(f"{name} must be positive, got {value!r}")
+        return value
+    if isinstance(default, tuple):
+        if not isinstance(value, (list, tuple)) or len(value) != len(default):
+            raise ValueError(
+                f"{name} must be a sequence of {len(default)} items, got {value!r}"
+            )
+        return tuple(value)
+    if not isinstance(value, type(default)):
+        raise ValueError(
+            f"{name} must be of type {type(default).__name__}, got {value!r}"
+        )
+    return value
+
+
+# Function `build(overrides)` — validated snapshot of config.py plus `overrides`.
+def build(overrides: dict | None = None) -> Settings:
+    base = _BASE
+    values = dict(base)
+    for raw_name, value in (overrides or {}).items():
+        name = raw_name.upper()
+        if name not in base:
+            raise ValueError(f"Unknown setting {raw_name!r}")
+        values[name] = value
+    for name in values:
+        values[name] = _coerce(name, values[name], base[name])
+    for world, screen in (("WORLD_WIDTH", "WIDTH"), ("WORLD_HEIGHT", "HEIGHT")):
+        if values[world] is not None and values[world] < values[screen]:
+            raise ValueError(f"{world} must be at least {screen} (or null)")
+    if values["PARTICLE_BUDGET"] < 0:
+        raise ValueError("PARTICLE_BUDGET must not be negative")
+    if values["BARREL_SPAWN_INTERVAL_MIN"] > values["BARREL_SPAWN_INTERVAL_MAX"]:
+        raise ValueError(
+            "BARREL_SPAWN_INTERVAL_MIN must not exceed BARREL_SPAWN_INTERVAL_MAX"
+        )
+    return Settings(values)
+
+
+# Function `load_file(path)` — read overrides from a .json or .toml file.
+def load_file(path: str) -> dict:
+    if path.lower().endswith(".toml"):
+        if tomllib is None:
+            raise RuntimeError("TOML overrides need Python 3.11+ (tomllib)")
+        with open(path, "rb") as fh:
+            return tomllib.load(fh)
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+# Function `parse_assignments(items)` — turn ["NAME=VALUE", ...] into a dict.
+# Values are parsed as JSON when possible ("3", "0.5", "[1, 2, 3]", "null").
+def parse_assignments(items) -> dict:
+    out = {}
+    for item in items or ():
+        name, sep, raw = item.partition("=")
+        if not sep or not name:
+            raise ValueError(f"Expected NAME=VALUE, got {item!r}")
+        try:
+            out[name.strip()] = json.loads(raw)
+        except ValueError:
+            out[name.strip()] = raw
+    return out
+
+
+# Function `add_arguments(parser)` — register --config/--set on an argparse parser.
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--config",
+        metavar="PATH",
+        help="JSON or TOML file with setting overrides",
+    )
+    parser.add_argument(
+        "--set",
+        metavar="NAME=VALUE",
+        action="append",
+        default=[],
+        help="override one setting (repeatable)",
+    )
+
+
+# Function `configure(path, assignments)` — build a fresh snapshot and make it the shared `S`.
+def configure(path: str | None = None, assignments=()) -> Settings:
+    global S
+    overrides = load_file(path) if path else {}
+    overrides.update(parse_assignments(assignments))
+    S = build(overrides)
+    return S
+
+
+# Function `configure_from_args(parser, args)` — `configure` from --config/--set,
+# reporting a bad file or value through `parser.error` instead of a traceback.
+def configure_from_args(parser: argparse.ArgumentParser, args) -> Settings:
+    try:
+        return configure(args.config, args.set)
+    except (OSError, ValueError, RuntimeError) as exc:
+        parser.error(str(exc))
+
+
+# Shared snapshot imported by the game modules
+S = build()
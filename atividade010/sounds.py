@@ -1,55 +1,190 @@
 #!/usr/bin/env python3
-# Module `sounds.py` — short description of this module.
+# Module `sounds.py` — procedural sound effects: definitions, synthesis, playback.
+# Every effect is an entry in SOUND_BANK and is rendered by the same
+# renderer; `python sounds.py OUTDIR` exports the whole bank as WAV files.
+import argparse
 import os
 import io
 import math
+import multiprocessing as mp
 import random
 import struct
 import wave
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 import pygame as pg
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # Internal state: whether the sound system has been initialized
+# (sounds installed, or given up because there is no mixer)
 _initialized = False
 # Cache for synthesized/loaded sound objects by key
 _sfx = {}
+# Private RNG for synthesis noise so sound init never disturbs the game's
+# global `random` stream (recorded replays rely on it being reproducible)
+_rng = random.Random()
+# Background synthesis: the executor and the future of {key: WAV bytes}
+_executor = None
+_pending = None
 
+FRAMERATE = 22050
+AMPLITUDE = 16000
 
-# Function `init()` — initialize the pygame mixer and prepare SFX in memory.
-def init():
-    global _initialized, _sfx
-    if _initialized:
+# Sound definitions. Each sample at time t (u = t / duration) is
+#   f     = freq[0] + (freq[1] - freq[0]) * u          linear sweep
+#   wave  = osc_gain * osc(2*pi*f*t)                    "sine" or "pulse"
+#         + sum(gain * sin(2*pi*ratio*f*t) for ratio, gain in harmonics)
+#         + noise[0] * white * exp(-noise[1] * u)
+#   value = envelope(u) * wave, then snapped to `quantize` levels (0 = off)
+#   out   = AMPLITUDE * gain * value, as a 16-bit sample
+# Envelopes: ("exp", k) = exp(-k*u), ("linear", a) = 1 - a*u,
+# ("power", p) = max(0, 1 - u) ** p. Missing fields take _DEFAULT_SOUND.
+# Adding an effect means adding an entry here.
+SOUND_BANK = {
+    # short player shot: swept pulse + harmonic + decaying noise, lo-fi
+    "shot": {
+        "duration": 0.06,
+        "freq": (1200.0, 3000.0),
+        "osc": "pulse",
+        "osc_gain": 0.85,
+        "harmonics": ((1.8, 0.45),),
+        "envelope": ("exp", 22.0),
+        "noise": (0.25, 60.0),
+        "quantize": 256,
+        "gain": 0.9,
+    },
+    # low-frequency sine with a quadratic falloff
+    "explosion": {
+        "freq": (80.0, 80.0),
+        "envelope": ("power", 2.0),
+    },
+    # mid-frequency tone for the UFO entrance
+    "ufo_spawn": {
+        "freq": (600.0, 600.0),
+        "envelope": ("linear", 0.6),
+    },
+    # mid/high tone for enemy shots
+    "ufo_shot": {
+        "freq": (1000.0, 1000.0),
+        "envelope": ("linear", 0.6),
+    },
+}
+_DEFAULT_SOUND = {
+    "duration": 0.25,
+    "freq": (440.0, 440.0),
+    "osc": "sine",
+    "osc_gain": 1.0,
+    "harmonics": (),
+    "envelope": ("linear", 0.0),
+    "noise": (0.0, 0.0),
+    "quantize": 0,
+    "gain": 1.0,
+}
+KEYS = tuple(SOUND_BANK)
+
+
+# Function `_synthesize_all(keys)` — WAV bytes for every key; runs in the worker.
+def _synthesize_all(keys) -> dict:
+    return {key: wav_bytes(key) for key in keys}
+
+
+# Function `_submit()` — start the synthesis worker; returns (executor, future).
+# A separate process keeps the synthesis (per-sample without NumPy) off the
+# game's GIL.
+# Where no child process can be started (e.g. inside a daemonic pool
+# worker) a thread does the work instead.
+def _submit():
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=mp.get_context("spawn")
+        )
+        try:
+            return executor, executor.submit(_synthesize_all, KEYS)
+        except Exception:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    except Exception:
+        executor = ThreadPoolExecutor(max_workers=1)
+        return executor, executor.submit(_synthesize_all, KEYS)
+
+
+# Function `start()` — open the mixer and synthesize the SFX in the background.
+# Call early (the menu is showing meanwhile); `_play` stays silent until the
+# sounds are installed. Safe to call more than once.
+def start():
+    global _initialized, _executor, _pending
+    if _initialized or _pending is not None:
         return
     try:
         pg.mixer.init()
     except Exception:
         _initialized = True
         return
+    _executor, _pending = _submit()
 
-    keys = ["shot", "explosion", "ufo_spawn", "ufo_shot"]
-    # Available sound keys: map these names to synthesized SFX used by the game.
-    # - 'shot': short player shot sound (brief pulse + harmonics + noise)
-    # - 'explosion': low-frequency damped sine to simulate an explosion
-    # - 'ufo_spawn': mid-frequency brief tone for UFO entrance
-    # - 'ufo_shot': mid/high tone for enemy shot
 
-    for key in keys:
+# Function `_install()` — if synthesis has finished, build the Sound objects and swap them in.
+# Never blocks; the new table replaces `_sfx` in a single assignment.
+def _install():
+    global _initialized, _sfx, _executor, _pending
+    if _pending is None or not _pending.done():
+        return
+    try:
+        data = _pending.result()
+    except Exception:
+        data = {}
+    sfx = {}
+    for key in KEYS:
         sound_obj = None
         try:
-            buf = _synthesize_wav_bytes(key)
-            buf.seek(0)
-            sound_obj = pg.mixer.Sound(file=buf)
+            sound_obj = pg.mixer.Sound(file=io.BytesIO(data[key]))
         except Exception:
             sound_obj = None
-        _sfx[key] = sound_obj
+        sfx[key] = sound_obj
+    _sfx = sfx
+    _initialized = True
+    _pending = None
+    _executor.shutdown(wait=False)
+    _executor = None
+
+
+# Function `init()` — initialize the pygame mixer and prepare SFX in memory.
+# Unlike `start`, this waits for the synthesis to finish.
+def init():
+    start()
+    if _pending is not None:
+        wait([_pending])
+    _install()
+
 
+# Function `disable()` — stay silent for good: no mixer and no synthesis worker.
+# For headless runs (e.g. batch.py workers) that would never hear the sounds.
+def disable():
+    global _initialized, _sfx
+    shutdown()
+    _sfx = {}
     _initialized = True
 
 
-# Function `_play(key, volume)` — play a cached sound by key, initializing system if needed.
+# Function `shutdown()` — drop any unfinished synthesis (e.g. when quitting).
+def shutdown():
+    global _executor, _pending
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _pending = None
+
+
+# Function `_play(key, volume)` — play a cached sound by key.
+# Before the background synthesis is done this is silent instead of blocking.
 def _play(key: str, volume: float = 0.8):
     if not _initialized:
-        init()
+        start()
+        _install()
     snd = _sfx.get(key)
     if snd:
         try:
@@ -59,149 +194,102 @@ def _play(key: str, volume: float = 0.8):
             pass
 
 
-# Function `_synthesize_wav(path, key)` — synthesize a WAV file on disk for the given key.
-# This is primarily used for debugging or exporting generated sounds.
-def _synthesize_wav(path: str, key: str):
-    framerate = 22050
-    amplitude = 16000
-    # framerate: samples per second; amplitude is max sample magnitude (16-bit)
-    if key == "shot":
-        duration = 0.06
-        freq_start = 800.0
-        freq_end = 3000.0
-    else:
-        duration = 0.25
-
-    freqs = {
-        "explosion": 80,
-        "ufo_spawn": 600,
-        "ufo_shot": 1000,
-    }
-    base_freq = freqs.get(key, 440)
-    nframes = int(duration * framerate)
+# Function `definition(key)` — the bank entry for `key` with defaults filled in.
+def definition(key: str) -> dict:
+    if key not in SOUND_BANK:
+        raise ValueError(f"Unknown sound {key!r}; choose from {sorted(SOUND_BANK)}")
+    return {**_DEFAULT_SOUND, **SOUND_BANK[key]}
 
-    with wave.open(path, "w") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(framerate)
-        for i in range(nframes):
-            t = i / framerate
-            if key == "shot":
-                # Slide frequency from freq_start to freq_end over the short duration
-                f = freq_start + (freq_end - freq_start) * (t / duration)
-                # Fast exponential decay envelope to create a percussive pulse
-                env = math.exp(-20.0 * (t / duration))
-                # Pulse-wave base (simple bipolar square-ish pulse)
-                base = 1.0 if math.sin(2 * math.pi * f * t) >= 0 else -1.0
-                # Add harmonic partials to enrich timbre
-                h1 = 0.6 * math.sin(2 * math.pi * (2 * f) * t)
-                h2 = 0.35 * math.sin(2 * math.pi * (3 * f) * t)
-                # Short, rapidly-decaying noise component for 'bite'
-                noise = (random.random() * 2.0 - 1.0) * math.exp(
-                    -80.0 * (t / duration)
-                )
-                # Mix components and apply small quantization to emulate lo-fi pulse
-                raw = 0.92 * base + h1 + h2 + 0.18 * noise
-                qlevels = 128.0
-                qval = (
-                    math.floor((raw + 1.0) * 0.5 * qlevels) / qlevels * 2.0
-                    - 1.0
-                )
-                sample = int(amplitude * env * 0.95 * qval)
-            elif key == "explosion":
-                # Explosion: low base frequency with a decaying amplitude
-                env = max(0.0, 1.0 - t / duration)
-                # Additional falloff term (1.0 - t/duration) emphasizes initial transient
-                sample = int(
-                    amplitude
-                    * env
-                    * math.sin(2 * math.pi * base_freq * t)
-                    * (1.0 - t / duration)
-                )
-            else:
-                # Default tone (ufo spawn/shot): simple sine with gentle linear decay
-                env = 1.0 - 0.6 * (t / duration)
-                sample = int(
-                    amplitude * env * math.sin(2 * math.pi * base_freq * t)
-                )
-
-            data = struct.pack("<h", max(-32767, min(32767, sample)))
-            wf.writeframesraw(data)
-        wf.writeframes(b"")
-
-
-def _synthesize_wav_bytes(key: str) -> io.BytesIO:
-    framerate = 22050
-    amplitude = 16000
-    if key == "shot":
-        duration = 0.06
-        freq_start = 1200.0
-        freq_end = 3000.0
-    else:
-        duration = 0.25
-
-    freqs = {
-        "explosion": 80,
-        "ufo_spawn": 600,
-        "ufo_shot": 1000,
-    }
-    base_freq = freqs.get(key, 440)
+
+# Function `render(key, framerate, rng)` — 16-bit little-endian PCM for one bank entry.
+# Whole-buffer NumPy math; without NumPy the same formula runs per sample.
+def render(key: str, framerate: int = FRAMERATE, rng=None) -> bytes:
+    d = definition(key)
+    rng = _rng if rng is None else rng
+    duration = d["duration"]
     nframes = int(duration * framerate)
-    buf = io.BytesIO()
+    noise_gain, noise_decay = d["noise"]
+    noise = [rng.random() * 2.0 - 1.0 for _ in range(nframes)] if noise_gain else None
+    if np is None:
+        return _render_samples(d, nframes, framerate, noise)
+    t = np.arange(nframes) / framerate
+    u = t / duration
+    f0, f1 = d["freq"]
+    phase = 2 * math.pi * (f0 + (f1 - f0) * u) * t
+    core = np.sin(phase)
+    if d["osc"] == "pulse":
+        core = np.where(core >= 0, 1.0, -1.0)
+    wave_ = d["osc_gain"] * core
+    for ratio, gain in d["harmonics"]:
+        wave_ += gain * np.sin(ratio * phase)
+    if noise is not None:
+        wave_ += noise_gain * np.array(noise) * np.exp(-noise_decay * u)
+    kind, k = d["envelope"]
+    if kind == "exp":
+        env = np.exp(-k * u)
+    elif kind == "power":
+        env = np.maximum(0.0, 1.0 - u) ** k
+    else:
+        env = 1.0 - k * u
+    value = env * wave_
+    levels = d["quantize"]
+    if levels:
+        value = np.floor((value + 1.0) * 0.5 * levels) / levels * 2.0 - 1.0
+    samples = np.clip((AMPLITUDE * d["gain"] * value).astype(np.int64), -32767, 32767)
+    return samples.astype("<i2").tobytes()
+
+
+# Function `_render_samples(d, nframes, framerate, noise)` — per-sample `render` without NumPy.
+def _render_samples(d: dict, nframes: int, framerate: int, noise) -> bytes:
+    duration = d["duration"]
+    f0, f1 = d["freq"]
+    noise_gain, noise_decay = d["noise"]
+    kind, k = d["envelope"]
+    levels = d["quantize"]
+    out = bytearray()
+    for i in range(nframes):
+        t = i / framerate
+        u = t / duration
+        phase = 2 * math.pi * (f0 + (f1 - f0) * u) * t
+        core = math.sin(phase)
+        if d["osc"] == "pulse":
+            core = 1.0 if core >= 0 else -1.0
+        wave_ = d["osc_gain"] * core
+        for ratio, gain in d["harmonics"]:
+            wave_ += gain * math.sin(ratio * phase)
+        if noise is not None:
+            wave_ += noise_gain * noise[i] * math.exp(-noise_decay * u)
+        if kind == "exp":
+            env = math.exp(-k * u)
+        elif kind == "power":
+            env = max(0.0, 1.0 - u) ** k
+        else:
+            env = 1.0 - k * u
+        value = env * wave_
+        if levels:
+            value = math.floor((value + 1.0) * 0.5 * levels) / levels * 2.0 - 1.0
+        sample = int(AMPLITUDE * d["gain"] * value)
+        out += struct.pack("<h", max(-32767, min(32767, sample)))
+    return bytes(out)
 
+
+# Function `wav_bytes(key, framerate)` — a complete mono 16-bit WAV file in memory.
+def wav_bytes(key: str, framerate: int = FRAMERATE) -> bytes:
+    buf = io.BytesIO()
     with wave.open(buf, "w") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(framerate)
-        for i in range(nframes):
-            t = i / framerate
-            if key == "shot":
-                # Sliding frequency and exponential decay to model a short shot
-                f = freq_start + (freq_end - freq_start) * (t / duration)
-                env = math.exp(-22.0 * (t / duration))
-                # Use a pulse-like core plus a secondary harmonic to add character
-                s = math.sin(2 * math.pi * f * t)
-                pulse = 1.0 if s >= 0 else -1.0
-                body = 0.85 * pulse + 0.45 * math.sin(
-                    2 * math.pi * 1.8 * f * t
-                )
-                # Decaying noise adds texture; decays faster than tone
-                noise = (random.random() * 2.0 - 1.0) * math.exp(
-                    -60.0 * (t / duration)
-                )
-                raw = body + 0.25 * noise
-                # Apply a small quantization to emulate sampled/retro sound
-                val = env * raw
-                levels = 256.0
-                q = math.floor((val + 1.0) * 0.5 * levels) / levels * 2.0 - 1.0
-                sample = int(amplitude * 0.9 * q)
-            elif key == "explosion":
-                # Explosion: low-frequency sinusoid with amplitude shaping
-                env = max(0.0, 1.0 - t / duration)
-                sample = int(
-                    amplitude
-                    * env
-                    * math.sin(2 * math.pi * base_freq * t)
-                    * (1.0 - t / duration)
-                )
-            else:
-                # Default UFO tone: sustain-like envelope with gentle falloff
-                env = 1.0 - 0.6 * (t / duration)
-                sample = int(
-                    amplitude * env * math.sin(2 * math.pi * base_freq * t)
-                )
-
-            data = struct.pack("<h", max(-32767, min(32767, sample)))
-            wf.writeframesraw(data)
-        wf.writeframes(b"")
-    buf.seek(0)
-    return buf
-
-
-def _synthesize_samples_numpy(key: str):
-    # Placeholder for an alternative synthesis path that would use numpy.
-    # Not available in this environment; raise an explicit error.
-    raise RuntimeError("numpy-based synthesis not available")
+        wf.writeframes(render(key, framerate))
+    return buf.getvalue()
+
+
+# Function `export(key, outdir, framerate)` — write `<outdir>/<key>.wav`; returns its path.
+def export(key: str, outdir: str, framerate: int = FRAMERATE) -> str:
+    path = os.path.join(outdir, f"{key}.wav")
+    with open(path, "wb") as fh:
+        fh.write(wav_bytes(key, framerate))
+    return path
 
 
 def play_shot():
@@ -222,3 +310,33 @@ def play_ufo_spawn():
 def play_ufo_shot():
     # Play the UFO's shot sound (reuses player shot sound by design).
     _play("shot", 0.6)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the sound bank as WAV files")
+    parser.add_argument("outdir", help="directory for the <key>.wav files")
+    parser.add_argument(
+        "--keys",
+        nargs="+",
+        choices=KEYS,
+        default=list(KEYS),
+        help="sounds to export (default: all)",
+    )
+    parser.add_argument("--rate", type=int, default=FRAMERATE, help="sample rate")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    args = parser.parse_args(argv)
+    os.makedirs(args.outdir, exist_ok=True)
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, len(args.keys))) as pool:
+        paths = pool.map(
+            export,
+            args.keys,
+            [args.outdir] * len(args.keys),
+            [args.rate] * len(args.keys),
+        )
+        for path in paths:
+            print(path)
+
+
+if __name__ == "__main__":
+    main()
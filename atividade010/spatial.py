@@ -0,0 +1,82 @@
+# Module `spatial.py` — uniform grid over sprite centres for neighbour queries.
+# Rebuilt from a sprite group when needed; queries return candidates in group
+# order so collision passes resolve hits exactly like a full scan would.
+# The grid covers the toroidal world, so queries wrap around its edges.
+import math
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: float, size: tuple):
+        self.cell_size = cell_size
+        self._inv = 1.0 / cell_size
+        # world size and the number of cell columns/rows that cover it
+        self.width, self.height = size
+        self._cols = math.ceil(self.width / cell_size)
+        self._rows = math.ceil(self.height / cell_size)
+        self._cells = {}
+        # largest `r` among the indexed sprites, for callers' query reach
+        self.max_r = 0
+
+    # Function `rebuild(sprites)` — index `sprites` by the cell of their centre.
+    def rebuild(self, sprites):
+        cells = self._cells
+        cells.clear()
+        inv = self._inv
+        max_r = 0
+        for i, spr in enumerate(sprites):
+            pos = spr.pos
+            key = (int(pos.x * inv), int(pos.y * inv))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(i, spr)]
+            else:
+                bucket.append((i, spr))
+            if spr.r > max_r:
+                max_r = spr.r
+        self.max_r = max_r
+        return self
+
+    # Function `query(pos, reach, indexed)` — sprites whose centre may lie within `reach` of `pos`.
+    # This is a cell-box test, wrapped around the world edges; callers still
+    # apply their exact distance check.
+    # With `indexed` the result holds (position in the group, sprite) pairs.
+    def query(self, pos, reach: float, indexed: bool = False) -> list:
+        inv = self._inv
+        xs = _cell_span(pos.x - reach, pos.x + reach, self.width, self._cols, inv)
+        ys = _cell_span(pos.y - reach, pos.y + reach, self.height, self._rows, inv)
+        cells = self._cells
+        found = []
+        hits = 0
+        for cx in xs:
+            for cy in ys:
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+                    hits += 1
+        if hits > 1:
+            found.sort(key=_index)
+        if indexed:
+            return found
+        return [spr for _, spr in found]
+
+
+def _index(item):
+    return item[0]
+
+
+# Function `_cell_span(lo, hi, size, count, inv)` — cell indices covering [lo, hi]
+# on an axis of `count` cells that wraps at `size`.
+def _cell_span(lo: float, hi: float, size: float, count: int, inv: float):
+    span = hi - lo
+    if span >= size:
+        return range(count)
+    lo %= size
+    hi = lo + span
+    first = int(lo * inv)
+    if hi < size:
+        return range(first, min(count - 1, int(hi * inv)) + 1)
+    # the span crosses the edge: the cells up to it, then the ones after 0
+    last = min(count - 1, int((hi - size) * inv))
+    if last >= first:
+        return range(count)
+    return [*range(first, count), *range(last + 1)]
@@ -0,0 +1,108 @@
+# Module `spawner.py` — timed spawn events, cached difficulty and edge spawn positions.
+import heapq
+from random import randrange
+
+import settings
+from utils import Vec
+
+# Event kinds handled by the world's spawn dispatcher
+ASTEROID = "asteroid"
+UFO = "ufo"
+BARREL = "barrel"
+
+
+# Difficulty-derived spawn parameters, recomputed only when the score changes.
+class DifficultyCurve:
+    def __init__(self):
+        self._score = None
+        self.update(0)
+
+    # Function `update(score)` — refresh cached values if `score` differs from the last call.
+    def update(self, score: int):
+        if score == self._score:
+            return
+        self._score = score
+        # difficulty scales with score (higher score -> more frequent spawns)
+        self.value = 1.0 + (float(score) / settings.S.AST_DIFFICULTY_SCORE_SCALE)
+        extra = self.value - 1.0
+        inv = 1.0 / max(0.001, self.value)
+        # asteroid interval shortens as difficulty rises, never below the minimum
+        self.ast_interval = max(
+            settings.S.AST_SPAWN_INTERVAL_MIN, settings.S.AST_SPAWN_INTERVAL_BASE * inv
+        )
+        # how many asteroids per tick (increase slowly with score)
+        self.ast_count = min(
+            1 + int(score / settings.S.AST_SCORE_SPAWN_FACTOR),
+            settings.S.AST_MAX_SPAWN_COUNT,
+        )
+        self.ast_speed_scale = 1.0 + extra * settings.S.AST_SPEED_SCALE
+        # more small/medium asteroids at higher difficulty
+        self.ast_prob_m = min(0.4, extra * 0.15)
+        self.ast_prob_s = min(0.2, extra * 0.05)
+        # desired concurrent UFOs (scale slowly with difficulty)
+        self.ufo_concurrent = min(settings.S.UFO_SPAWN_COUNT, 1 + int(self.value / 2))
+        self.ufo_interval = settings.S.UFO_SPAWN_EVERY * inv
+        # barrel intervals are divided by difficulty when drawn
+        self.barrel_scale = inv
+
+
+# Precomputed positions spread evenly along the screen border.
+# The table has an even number of entries so that index i + n/2 is the
+# point mirrored through the screen centre; if the random pick is too close
+# to the player the mirrored point is used instead, with no retry loop.
+class EdgeSpawnTable:
+    def __init__(
+        self, count: int = 256, width: int | None = None, height: int | None = None
+    ):
+        width = settings.S.WIDTH if width is None else width
+        height = settings.S.HEIGHT if height is None else height
+        count += count % 2
+        perimeter = 2 * (width + height)
+        self.points = [
+            self._point_at(i * perimeter / count, width, height)
+            for i in range(count)
+        ]
+        self._half = count // 2
+
+    # Function `_point_at(s, width, height)` — map a perimeter offset to a border point.
+    @staticmethod
+    def _point_at(s: float, width: int, height: int) -> tuple:
+        if s < width:
+            return (s, 0.0)
+        s -= width
+        if s < height:
+            return (float(width), s)
+        s -= height
+        if s < width:
+            return (width - s, float(height))
+        s -= width
+        return (0.0, height - s)
+
+    # Function `pick(avoid, min_dist)` — random border position at least `min_dist` from `avoid` when possible.
+    def pick(self, avoid: Vec, min_dist: float) -> Vec:
+        i = randrange(len(self.points))
+        x, y = self.points[i]
+        if (x - avoid.x) ** 2 + (y - avoid.y) ** 2 < min_dist * min_dist:
+            x, y = self.points[(i + self._half) % len(self.points)]
+        return Vec(x, y)
+
+
+# Priority queue of pending spawn events keyed by their due time.
+class SpawnScheduler:
+    def __init__(self):
+        self.clock = 0.0
+        self._queue = []
+        self._seq = 0
+
+    # Function `schedule(delay, kind)` — queue an event `delay` seconds from now.
+    def schedule(self, delay: float, kind: str):
+        heapq.heappush(self._queue, (self.clock + delay, self._seq, kind))
+        self._seq += 1
+
+    # Function `advance(dt)` — move the clock forward and yield every due event kind.
+    # Events scheduled while iterating are honoured if they are already due.
+    def advance(self, dt: float):
+        self.clock += dt
+        queue = self._queue
+        while queue and queue[0][0] <= self.clock:
+            yield heapq.heappop(queue)[2]
@@ -4,9 +4,19 @@ from random import uniform
 
 import pygame as pg
 
-import config as C
-from utils import Vec, angle_to_vec, draw_circle, draw_poly, wrap_pos
+import settings
+from utils import (
+    Vec,
+    angle_to_vec,
+    draw_circle,
+    draw_poly,
+    world_size,
+    wrap_delta,
+    wrap_pos,
+)
 import assets
+import particles
+import render
 
 try:
     from frames.embedded_ship_frames import FRAMES as EMBED_FRAMES  # type: ignore
@@ -30,17 +40,51 @@ except ImportError:
     EXP_FRAMES = None
 
 
+# Function `_moved(rect, offset)` — `rect` shifted by a camera offset (None: unchanged).
+def _moved(rect, offset):
+    return rect if offset is None else rect.move(offset)
+
+
+# Function `_frame_pad(frame, scale, r)` — pixels a scaled frame reaches past a 2r×2r rect.
+# Sprites keep this as `cull_pad` so the renderer can cull on `rect` alone.
+def _frame_pad(frame, scale: float, r: float) -> int:
+    if not isinstance(frame, dict) or "w" not in frame or "h" not in frame:
+        return 1
+    half = max(int(frame["w"]), int(frame["h"])) * scale / 2
+    return max(0, math.ceil(half - r)) + 1
+
+
 # Class `Projectile` — describe responsibility and main methods.
 # Projectile base class to avoid duplication between Bullet and UFObullet
 class Projectile(pg.sprite.Sprite):
-    # Function `__init__(self, pos, vel, r, length, width, colors)` — describe purpose and behavior.
+    # Every field is declared up front and lives in a slot. Sprite has no
+    # __slots__, so instances keep a small __dict__ for its group set; the
+    # slots make attribute reads faster but do not shrink the instance.
+    __slots__ = (
+        "pos", "vel", "r", "rect", "length", "width", "colors",
+        "_spawn_tick", "_prev_pos", "cull_pad", "ttl",
+    )
+    layer = render.PROJECTILES
+
+    # Function `__init__(self, pos, vel, r, length, width, colors, ttl)` — describe purpose and behavior.
+    # Projectiles wrap around the world like everything else and expire
+    # after `ttl` seconds.
     def __init__(
-        self, pos: Vec, vel: Vec, r: int, length: int, width: int, colors
+        self,
+        pos: Vec,
+        vel: Vec,
+        r: int,
+        length: int,
+        width: int,
+        colors,
+        ttl: float,
     ):
         super().__init__()
         self.pos = Vec(pos)
         self.vel = Vec(vel)
         self.r = r
+        self.ttl = ttl
+        self._prev_pos = None
         try:
             self._spawn_tick = pg.time.get_ticks()
         except Exception:
@@ -49,28 +93,35 @@ class Projectile(pg.sprite.Sprite):
         self.length = length
         self.width = width
         self.colors = colors
+        # the streak polygon reaches past `rect` along the velocity
+        self.cull_pad = max(0, math.ceil((length + width) / 2 - r)) + 1
+        # centre the rect now, since culling reads it before the first update;
+        # Asteroid, UFO and Barrel do the same
+        self.rect.center = self.pos
 
     # Function `update(self, dt)` — describe purpose and behavior.
 
     def update(self, dt: float):
-        try:
-            self._prev_pos = Vec(self.pos)
-        except Exception:
-            self._prev_pos = Vec(self.pos)
-        self.pos += self.vel * dt
-        if (
-            self.pos.x < 0
-            or self.pos.x > C.WIDTH
-            or self.pos.y < 0
-            or self.pos.y > C.HEIGHT
-        ):
+        self.ttl -= dt
+        if self.ttl <= 0:
             self.kill()
             return
+        prev = Vec(self.pos)
+        self.pos += self.vel * dt
+        wrapped = wrap_pos(self.pos)
+        # keep the swept segment short: `_prev_pos` crosses the edge with `pos`
+        self._prev_pos = prev + (wrapped - self.pos)
+        self.pos = wrapped
         self.rect.center = self.pos
 
+    # Function `blit_args(self)` — None: the streak is a polygon, drawn by draw().
+    def blit_args(self):
+        return None
+
     # Function `draw(self, surf)` — describe purpose and behavior.
 
-    def draw(self, surf: pg.Surface):
+    def draw(self, surf: pg.Surface, offset=None):
+        pos = self.pos if offset is None else self.pos + offset
         if self.vel.length() > 0:
             dirv = self.vel.normalize()
         else:
@@ -78,11 +129,11 @@ class Projectile(pg.sprite.Sprite):
         perp = Vec(-dirv.y, dirv.x)
         halfL = self.length / 2
         halfW = self.width / 2
-        p1 = self.pos - dirv * halfL - perp * halfW
-        p2 = self.pos - dirv * halfL + perp * halfW
-        p3 = self.pos + dirv * halfL + perp * halfW
-        p4 = self.pos + dirv * halfL - perp * halfW
-        elapsed = pg.time.get_ticks() - getattr(self, "_spawn_tick", 0)
+        p1 = pos - dirv * halfL - perp * halfW
+        p2 = pos - dirv * halfL + perp * halfW
+        p3 = pos + dirv * halfL + perp * halfW
+        p4 = pos + dirv * halfL - perp * halfW
+        elapsed = pg.time.get_ticks() - self._spawn_tick
         idx = (elapsed // 40) % len(self.colors)
         color = self.colors[idx]
         pts = [p1, p2, p3, p4]
@@ -106,26 +157,48 @@ class Projectile(pg.sprite.Sprite):
 # Classes que representam os sprites do jogo
 # Cada classe guarda posicao, velocidade, raio e metodos de movimento e desenho
 class Bullet(Projectile):
+    __slots__ = ()
+
     # Function `__init__(self, pos, vel)` — describe purpose and behavior.
     def __init__(self, pos: Vec, vel: Vec):
-        colors = [C.WHITE, (0, 200, 255), (255, 80, 80)]
+        colors = [settings.S.WHITE, (0, 200, 255), (255, 80, 80)]
         # Classe `Asteroid` — descreva responsabilidade e método(s) principais.
         super().__init__(
-            pos, vel, C.BULLET_RADIUS, length=12, width=4, colors=colors
+            pos,
+            vel,
+            settings.S.BULLET_RADIUS,
+            length=12,
+            width=4,
+            colors=colors,
+            ttl=settings.S.BULLET_TTL,
         )
 
 
 # Function `__init__(self, pos, vel, size)` — describe purpose and behavior.
 class Asteroid(pg.sprite.Sprite):
+    __slots__ = (
+        "pos", "vel", "size", "r", "poly", "rect", "_prev_pos", "cull_pad",
+        "lod_dt", "lod_phase",
+    )
+    layer = render.ASTEROIDS
+
     # Function `__init__(self, pos, vel, size)` — describe purpose and behavior.
     def __init__(self, pos: Vec, vel: Vec, size: str):
         super().__init__()
         self.pos = Vec(pos)
         self.vel = Vec(vel)
         self.size = size
-        self.r = C.AST_SIZES[size]["r"]
+        self._prev_pos = None
+        self.r = settings.S.AST_SIZES[size]["r"]
         self.poly = self._make_poly()
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
+        # jittered vertices can sit up to 20% outside the radius
+        reach = max(v.length() for v in self.poly)
+        self.cull_pad = max(0, math.ceil(reach - self.r)) + 1
+        # level-of-detail state (see lod.py): owed time and update phase
+        self.lod_dt = 0.0
+        self.lod_phase = -1
+        self.rect.center = self.pos
 
     # Function `_make_poly(self)` — describe purpose and behavior.
 
@@ -144,20 +217,22 @@ class Asteroid(pg.sprite.Sprite):
 
     def update(self, dt: float):
         # store previous position for collision checks
-        try:
-            self._prev_pos = Vec(self.pos)
-        except Exception:
-            self._prev_pos = Vec(self.pos)
+        self._prev_pos = Vec(self.pos)
         self.pos += self.vel * dt
         # restore wrap-around behaviour so UFOs re-enter screen edges
         self.pos = wrap_pos(self.pos)
         self.rect.center = self.pos
 
+    # Function `blit_args(self)` — None: asteroids are outlines, drawn by draw().
+    def blit_args(self):
+        return None
+
     # Function `draw(self, surf)` — describe purpose and behavior.
 
-    def draw(self, surf: pg.Surface):
-        pts = [(self.pos + p) for p in self.poly]
-        pg.draw.polygon(surf, C.WHITE, pts, width=1)
+    def draw(self, surf: pg.Surface, offset=None):
+        pos = self.pos if offset is None else self.pos + offset
+        pts = [(pos + p) for p in self.poly]
+        pg.draw.polygon(surf, settings.S.WHITE, pts, width=1)
 
     # Function `get_mask(self)` — describe purpose and behavior.
 
@@ -175,10 +250,103 @@ class Asteroid(pg.sprite.Sprite):
         return (mask, rect)
 
 
+# Class `ShipFrames` — frame selection table for the ship, built once per pixel scale.
+# Maps each direction to its prepared frames (palette surfaces plus a full
+# rectangular mask) and keeps the idle 'base' entry, so drawing and collision
+# each resolve the current frame with a single lookup.
+class ShipFrames:
+    # Function `__init__(self, frames, scale)` — resolve idle/direction frames from `frames`.
+    def __init__(self, frames, scale: int):
+        self.scale = max(1, scale)
+        frames = frames or {}
+        self.by_dir = {
+            key: [_ShipFrame(fr, self.scale) for fr in lst]
+            for key, lst in frames.items()
+        }
+        # unknown directions fall back to 'down', as the frame sets did before
+        self.default = self.by_dir.get("down", [])
+        # idle frame: explicit 'base' key, else any frame named '*base*'
+        self.idle = None
+        if self.by_dir.get("base"):
+            self.idle = self.by_dir["base"][0]
+        else:
+            for lst in self.by_dir.values():
+                for entry in lst:
+                    if "base" in entry.name:
+                        self.idle = entry
+                        break
+                if self.idle is not None:
+                    break
+        # frame that sizes the collision radius: 'base' first, else the first one
+        self.sample = None
+        if self.by_dir.get("base"):
+            self.sample = self.by_dir["base"][0]
+        else:
+            for lst in self.by_dir.values():
+                if lst:
+                    self.sample = lst[0]
+                    break
+
+    # Function `select(self, dir_key, moving, anim_frame)` — entry to show, or None.
+    def select(self, dir_key: str, moving: bool, anim_frame: int):
+        if not moving and self.idle is not None:
+            return self.idle
+        lst = self.by_dir.get(dir_key, self.default)
+        if not lst:
+            return None
+        return lst[int(anim_frame) % len(lst)]
+
+
+# One prepared ship frame: legacy ASCII rows, or a palette frame plus mask.
+class _ShipFrame:
+    __slots__ = ("frame", "name", "palette", "mask", "w", "h")
+
+    def __init__(self, frame, scale: int):
+        self.frame = frame
+        self.palette = None
+        self.mask = None
+        self.w = self.h = None
+        if isinstance(frame, dict):
+            self.name = frame.get("name", "").lower()
+            if "pixels" in frame:
+                self.w = int(frame["w"])
+                self.h = int(frame["h"])
+                self.palette = assets.palette_frame(frame, scale)
+                # full rectangular mask for the ship (ignore transparency)
+                self.mask = pg.mask.Mask(
+                    (self.w * scale, self.h * scale), fill=True
+                )
+        else:
+            self.name = ""
+
+
+_SHIP_FRAMES = {}
+
+
+# Function `ship_frames(scale)` — cached ShipFrames for `scale`.
+def ship_frames(scale: int) -> ShipFrames:
+    table = _SHIP_FRAMES.get(scale)
+    if table is None:
+        table = _SHIP_FRAMES[scale] = ShipFrames(EMBED_FRAMES, scale)
+    return table
+
+
+# Built at import for the configured scale; other scales are built on demand
+ship_frames(settings.S.SHIP_PIXEL_SCALE)
+
+
 # Class `Ship` — describe responsibility and main methods.
 
 
 class Ship(pg.sprite.Sprite):
+    __slots__ = (
+        "pos", "vel", "angle", "cool", "invuln", "is_alive", "r", "rect",
+        "_anim_timer", "_anim_frame", "_dir", "_prev_pos", "_frames",
+        "cull_pad",
+    )
+    layer = render.SHIP
+    BLINK_COLORS = (settings.S.WHITE, (0, 255, 0), (0, 0, 255), (255, 255, 0))
+
     # Function `__init__(self, pos)` — describe purpose and behavior.
     def __init__(self, pos: Vec):
         super().__init__()
@@ -187,37 +355,31 @@ class Ship(pg.sprite.Sprite):
         self.angle = -90.0
         self.cool = 0.0
         self.invuln = 0.0
-        self.alive = True
+        self.is_alive = True
+        self._prev_pos = None
+        self._frames = ship_frames(settings.S.SHIP_PIXEL_SCALE)
         # Determine hit radius from embedded frames when available so
         # the collision circle matches the visual sprite size.
-        scale = int(getattr(C, "SHIP_PIXEL_SCALE", 1))
-        if EMBED_FRAMES:
-            # prefer an explicit 'base' frame, otherwise pick first available
-            sample_frame = None
-            if "base" in EMBED_FRAMES and EMBED_FRAMES["base"]:
-                sample_frame = EMBED_FRAMES["base"][0]
-            else:
-                for lst in EMBED_FRAMES.values():
-                    if lst:
-                        sample_frame = lst[0]
-                        break
-
-            if (
-                isinstance(sample_frame, dict)
-                and "w" in sample_frame
-                and "h" in sample_frame
-            ):
-                w = int(sample_frame["w"]) * scale
-                h = int(sample_frame["h"]) * scale
-                # Use roughly 45% of the smaller dimension as collision radius
-                # to keep the hitbox inside the visible sprite.
-                self.r = max(6, int(min(w, h) * 0.45))
-            else:
-                self.r = C.SHIP_RADIUS
+        sample = self._frames.sample
+        if sample is not None and sample.w is not None:
+            scale = settings.S.SHIP_PIXEL_SCALE
+            w = sample.w * scale
+            h = sample.h * scale
+            # Use roughly 45% of the smaller dimension as collision radius
+            # to keep the hitbox inside the visible sprite.
+            self.r = max(6, int(min(w, h) * 0.45))
         else:
-            self.r = C.SHIP_RADIUS
+            self.r = settings.S.SHIP_RADIUS
 
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
+        # frames are taller than the hitbox; the invulnerability ring is r + 6
+        pad = 7
+        for lst in self._frames.by_dir.values():
+            for entry in lst:
+                pad = max(
+                    pad, _frame_pad(entry.frame, self._frames.scale, self.r)
+                )
+        self.cull_pad = pad
         # animation: use a timer and current frame index so stopping returns
         # immediately to the base frame
         self._anim_timer = 0.0
@@ -239,7 +401,7 @@ class Ship(pg.sprite.Sprite):
 
         if mv.length_squared() > 0:
             mv = mv.normalize()
-            self.vel = mv * C.SHIP_SPEED
+            self.vel = mv * settings.S.SHIP_SPEED
             if abs(mv.x) > abs(mv.y):
                 self._dir = "left" if mv.x < 0 else "right"
             else:
@@ -249,24 +411,26 @@ class Ship(pg.sprite.Sprite):
 
     # Function `fire(self)` — describe purpose and behavior.
 
-    def fire(self) -> Bullet | None:
+    def fire(self, target=None) -> Bullet | None:
+        # `target` is the aim point; defaults to the live mouse position
         if self.cool > 0:
             return None
         try:
-            mx, my = pg.mouse.get_pos()
+            mx, my = pg.mouse.get_pos() if target is None else target
             to_mouse = Vec(mx, my) - self.pos
             dirv = to_mouse.normalize() if to_mouse.length() > 0 else Vec(1, 0)
         except Exception:
             dirv = Vec(1, 0)
         pos = self.pos + dirv * (self.r + 4)
-        vel = dirv * C.BULLET_SPEED
-        self.cool = C.SHIP_FIRE_RATE
+        vel = dirv * settings.S.BULLET_SPEED
+        self.cool = settings.S.SHIP_FIRE_RATE
         return Bullet(pos, vel)
 
     # Function `hyperspace(self)` — describe purpose and behavior.
 
     def hyperspace(self):
-        self.pos = Vec(uniform(0, C.WIDTH), uniform(0, C.HEIGHT))
+        width, height = world_size()
+        self.pos = Vec(uniform(0, width), uniform(0, height))
         self.vel.xy = (0, 0)
         self.invuln = 1.0
 
@@ -292,105 +456,57 @@ class Ship(pg.sprite.Sprite):
             self._anim_timer = 0.0
             self._anim_frame = 0
         # store previous position to allow collision resolution that blocks movement
-        try:
-            self._prev_pos = Vec(self.pos)
-        except Exception:
-            self._prev_pos = Vec(self.pos)
+        self._prev_pos = Vec(self.pos)
         self.pos += self.vel * dt
         self.pos = wrap_pos(self.pos)
         self.rect.center = self.pos
 
     # Function `draw(self, surf)` — describe purpose and behavior.
 
-    def draw(self, surf: pg.Surface):
-        # Use embedded frames if available (generated from imagens),
-        # otherwise fall back to small built-in placeholder.
-        # If embedded frames are color frames (dicts with 'pixels'), use them.
-        # Use only embedded frames; remove the ASCII fallback per project decision.
-        FRAMES = EMBED_FRAMES
+    # Function `blit_args(self)` — (surface, dest) for batched blitting, or None.
+    # None means the renderer must call draw(), e.g. while the ring blinks.
+    def blit_args(self):
+        if self.invuln > 0 and int(self.invuln * 10) % 2 == 0:
+            return None
+        return self._frame_blit()
 
-        # blinking main color: cycle white -> green -> blue -> yellow
-        colors_blink = [C.WHITE, (0, 255, 0), (0, 0, 255), (255, 255, 0)]
-        elapsed = pg.time.get_ticks()
-        blink_idx = (elapsed // 100) % len(colors_blink)
-        main_col = colors_blink[blink_idx]
-        dark = (30, 30, 30)
-
-        dir_key = getattr(self, "_dir", "down")
-        # FRAMES is expected to be EMBED_FRAMES. Be safe if it's None.
-        if FRAMES:
-            frames_for_dir = FRAMES.get(dir_key, FRAMES.get("down", []))
-        else:
-            frames_for_dir = []
-
-        # If ship is not moving, prefer an explicit 'base' frame if present.
-        idle_frame = None
-        if EMBED_FRAMES is not None:
-            # direct 'base' key
-            if "base" in EMBED_FRAMES and EMBED_FRAMES["base"]:
-                idle_frame = EMBED_FRAMES["base"][0]
-            else:
-                # search all embedded frames for a source named 'base' (case-insensitive)
-                for k, lst in EMBED_FRAMES.items():
-                    for fr in lst:
-                        name = (
-                            fr.get("name", "").lower()
-                            if isinstance(fr, dict)
-                            else ""
-                        )
-                        if "base" in name:
-                            idle_frame = fr
-                            break
-                    if idle_frame is not None:
-                        break
+    # Function `_frame_blit(self)` — current frame in the current blink colour.
+    def _frame_blit(self):
+        entry = self._frames.select(
+            self._dir, self.vel.length_squared() != 0, self._anim_frame
+        )
+        if entry is None or entry.palette is None:
+            return None
+        # palette variant for the blink colour (white entries are the swap slots)
+        spr = entry.palette.recolor(self._blink_color())
+        return (spr, spr.get_rect(center=(int(self.pos.x), int(self.pos.y))))
 
-        # choose frame: if stopped and idle_frame found, use it; otherwise animate
-        if self.vel.length_squared() == 0 and idle_frame is not None:
-            frame = idle_frame
-        else:
-            # pick frame index from the integer anim counter (wrap by available frames)
-            if isinstance(frames_for_dir, list) and len(frames_for_dir) > 0:
-                frame_idx = int(self._anim_frame) % len(frames_for_dir)
-            else:
-                frame_idx = 0
-            frame = frames_for_dir[frame_idx]
-
-        # If frame is a dict with 'pixels', render color pixels preserving size
-        if isinstance(frame, dict) and "pixels" in frame:
-            w = int(frame["w"])
-            h = int(frame["h"])
-            pixels = frame["pixels"]
-            scale = int(getattr(C, "SHIP_PIXEL_SCALE", 1))
-            scale = max(1, scale)
-            spr = pg.Surface((w * scale, h * scale), pg.SRCALPHA)
-            for y, row in enumerate(pixels):
-                for x, col in enumerate(row):
-                    r, g, b, a = col
-                    if a == 0:
-                        continue
-                    # If the pixel is (near) white, replace it with the blinking main color
-                    if r >= 220 and g >= 220 and b >= 220:
-                        draw_color = (
-                            (*main_col, a)
-                            if len(main_col) == 3
-                            else (*main_col[:3], a)
-                        )
-                    else:
-                        draw_color = (r, g, b, a)
-                    rect = pg.Rect(x * scale, y * scale, scale, scale)
-                    # draw with alpha-supporting surface
-                    pg.draw.rect(spr, draw_color, rect)
-            rect = spr.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-            surf.blit(spr, rect)
-        else:
+    # Function `_blink_color(self)` — main colour cycling white -> green -> blue -> yellow.
+    def _blink_color(self):
+        colors_blink = Ship.BLINK_COLORS
+        elapsed = pg.time.get_ticks()
+        return colors_blink[(elapsed // 100) % len(colors_blink)]
+
+    def draw(self, surf: pg.Surface, offset=None):
+        # Frames come from the embedded images via the ShipFrames table.
+        pos = self.pos if offset is None else self.pos + offset
+        args = self._frame_blit()
+        # non-palette entries are legacy ASCII frames, rendered per draw
+        entry = None if args is not None else self._frames.select(
+            self._dir, self.vel.length_squared() != 0, self._anim_frame
+        )
+        if args is not None:
+            surf.blit(args[0], _moved(args[1], offset))
+        elif entry is not None:
+            main_col = self._blink_color()
+            dark = (30, 30, 30)
             # Fallback: ascii-style frames (legacy)
             GRID = 8
-            pixel_size = int(getattr(C, "SHIP_PIXEL_SCALE", 3))
-            pixel_size = max(1, pixel_size)
+            pixel_size = max(1, settings.S.SHIP_PIXEL_SCALE)
             w = GRID * pixel_size
             h = GRID * pixel_size
             spr = pg.Surface((w, h), pg.SRCALPHA)
-            for y, row in enumerate(frame):
+            for y, row in enumerate(entry.frame):
                 for x, ch in enumerate(row):
                     if ch == "1":
                         rect = pg.Rect(
@@ -408,11 +524,12 @@ class Ship(pg.sprite.Sprite):
                             pixel_size,
                         )
                         pg.draw.rect(spr, dark, rect)
-            rect = spr.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-            surf.blit(spr, rect)
+            surf.blit(
+                spr, spr.get_rect(center=(int(pos.x), int(pos.y)))
+            )
 
         if self.invuln > 0 and int(self.invuln * 10) % 2 == 0:
-            draw_circle(surf, self.pos, self.r + 6)
+            draw_circle(surf, pos, self.r + 6)
 
     # Function `get_mask(self)` — describe purpose and behavior.
 
@@ -421,91 +538,52 @@ class Ship(pg.sprite.Sprite):
 
         If no embedded color frame is available, returns (None, None).
         """
-        # Recreate the frame selection logic from draw()
-        FRAMES = EMBED_FRAMES
-        dir_key = getattr(self, "_dir", "down")
-        if FRAMES:
-            frames_for_dir = FRAMES.get(dir_key, FRAMES.get("down", []))
-        else:
-            frames_for_dir = []
-
-        # choose frame (prefer base when idle)
-        idle_frame = None
-        if EMBED_FRAMES is not None:
-            if "base" in EMBED_FRAMES and EMBED_FRAMES["base"]:
-                idle_frame = EMBED_FRAMES["base"][0]
-            else:
-                for k, lst in EMBED_FRAMES.items():
-                    for fr in lst:
-                        name = (
-                            fr.get("name", "").lower()
-                            if isinstance(fr, dict)
-                            else ""
-                        )
-                        if "base" in name:
-                            idle_frame = fr
-                            break
-                    if idle_frame is not None:
-                        break
-
-        if self.vel.length_squared() == 0 and idle_frame is not None:
-            frame = idle_frame
-        else:
-            if isinstance(frames_for_dir, list) and len(frames_for_dir) > 0:
-                frame_idx = int(self._anim_frame) % len(frames_for_dir)
-            else:
-                return (None, None)
-            frame = frames_for_dir[frame_idx]
-
-        if isinstance(frame, dict) and "pixels" in frame:
-            w = int(frame["w"])
-            h = int(frame["h"])
-            pixels = frame["pixels"]
-            scale = int(getattr(C, "SHIP_PIXEL_SCALE", 1))
-            scale = max(1, scale)
-            # Use full rectangular mask for the ship (ignore transparency)
-            spr = pg.Surface((w * scale, h * scale), pg.SRCALPHA)
-            rect_full = pg.Rect(0, 0, w * scale, h * scale)
-            pg.draw.rect(spr, (255, 255, 255, 255), rect_full)
-            mask = pg.mask.from_surface(spr)
-            rect = spr.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-            return (mask, rect)
-
-        return (None, None)
+        entry = self._frames.select(
+            self._dir, self.vel.length_squared() != 0, self._anim_frame
+        )
+        if entry is None or entry.mask is None:
+            return (None, None)
+        rect = entry.mask.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+        return (entry.mask, rect)
 
 
 # Class `UFO` — describe responsibility and main methods.
 
 
 class UFO(pg.sprite.Sprite):
+    __slots__ = (
+        "pos", "small", "r", "speed", "rect", "dir", "fire_cool",
+        "fire_rate", "aim", "_show_shot", "_shot_timer",
+        "orbit_tangential", "orbit_radial", "orbit_max_turn", "cull_pad",
+        "lod_dt", "lod_phase",
+    )
+    layer = render.UFOS
+
     # Function `__init__(self, pos, small)` — describe purpose and behavior.
     def __init__(self, pos: Vec, small: bool):
         super().__init__()
         self.pos = Vec(pos)
         self.small = small
-        self.r = C.UFO_SMALL["r"] if small else C.UFO_BIG["r"]
-        self.speed = C.UFO_SPEED
+        self.r = settings.S.UFO_SMALL["r"] if small else settings.S.UFO_BIG["r"]
+        self.speed = settings.S.UFO_SPEED
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
         self.dir = Vec(1, 0) if uniform(0, 1) < 0.5 else Vec(-1, 0)
         # cooldown para disparo do UFO
         self.fire_cool = 0.0
         self.fire_rate = 2.5 if small else 4.0
         # fator de mira do UFO
-        self.aim = C.UFO_SMALL["aim"] if small else C.UFO_BIG["aim"]
+        self.aim = settings.S.UFO_SMALL["aim"] if small else settings.S.UFO_BIG["aim"]
         # animation state for embedded ovni frames
         self._show_shot = False
         self._shot_timer = 0.0
+        # level-of-detail state (see lod.py): owed time and update phase
+        self.lod_dt = 0.0
+        self.lod_phase = -1
         # Per-UFO orbit behavior: randomize around global config values
-        try:
-            var = float(getattr(C, "UFO_ORBIT_VARIANCE", 0.25))
-        except Exception:
-            var = 0.25
-        try:
-            base_t = float(getattr(C, "UFO_ORBIT_TANGENTIAL", 0.85))
-            base_r = float(getattr(C, "UFO_ORBIT_RADIAL", 0.15))
-            base_turn = float(getattr(C, "UFO_ORBIT_MAX_TURN", 3.0))
-        except Exception:
-            base_t, base_r, base_turn = 0.85, 0.15, 3.0
+        var = settings.S.UFO_ORBIT_VARIANCE
+        base_t = settings.S.UFO_ORBIT_TANGENTIAL
+        base_r = settings.S.UFO_ORBIT_RADIAL
+        base_turn = settings.S.UFO_ORBIT_MAX_TURN
         # random +/-var multiplicative perturbation
         self.orbit_tangential = max(0.0, base_t * (1.0 + uniform(-var, var)))
         self.orbit_radial = max(0.0, base_r * (1.0 + uniform(-var, var)))
@@ -517,10 +595,7 @@ class UFO(pg.sprite.Sprite):
         self.orbit_max_turn = max(0.1, base_turn * (1.0 + uniform(-var, var)))
         # If we have embedded ovni frames, derive a collision radius from
         # the visual frame size so the hitbox matches the larger sprite.
-        try:
-            scale = int(getattr(C, "UFO_PIXEL_SCALE", 1))
-        except Exception:
-            scale = 1
+        scale = settings.S.UFO_PIXEL_SCALE
         if OVNI_FRAMES:
             sample = None
             if "base" in OVNI_FRAMES and OVNI_FRAMES["base"]:
@@ -536,12 +611,23 @@ class UFO(pg.sprite.Sprite):
                 # use ~45% of the smaller dimension as collision radius
                 self.r = max(self.r, max(6, int(min(w, h) * 0.45)))
                 # collision radius already derived from visual size and pixel scale
+        self.cull_pad = 1
+        for lst in (OVNI_FRAMES or {}).values():
+            for fr in lst:
+                self.cull_pad = max(
+                    self.cull_pad, _frame_pad(fr, max(0.1, scale), self.r)
+                )
+        self.rect.center = self.pos
 
     def update(self, dt: float, ship_pos: Vec = None):
         # If ship_pos is provided, attempt to orbit around the ship while
         # maintaining forward motion. Otherwise behave as before.
-        if ship_pos is not None:
-            to_player = ship_pos - self.pos
+        # Beyond UFO_STEER_DIST the orbit steering is suspended.
+        to_player = None if ship_pos is None else wrap_delta(ship_pos, self.pos)
+        steer_dist = settings.S.UFO_STEER_DIST
+        if to_player is not None and (
+            to_player.length_squared() <= steer_dist * steer_dist
+        ):
             if to_player.length() == 0:
                 to_player = Vec(1, 0)
             radial = to_player.normalize()
@@ -552,27 +638,15 @@ class UFO(pg.sprite.Sprite):
             tangential = tangential * sign
             # weighting from config
             # use per-UFO randomized weights
-            t_w = getattr(
-                self,
-                "orbit_tangential",
-                float(getattr(C, "UFO_ORBIT_TANGENTIAL", 0.85)),
-            )
-            r_w = getattr(
-                self,
-                "orbit_radial",
-                float(getattr(C, "UFO_ORBIT_RADIAL", 0.15)),
-            )
+            t_w = self.orbit_tangential
+            r_w = self.orbit_radial
             desired = tangential * t_w + radial * r_w
             if desired.length_squared() == 0:
                 desired = tangential
             else:
                 desired = desired.normalize()
             # smooth turning towards desired direction
-            max_turn = getattr(
-                self,
-                "orbit_max_turn",
-                float(getattr(C, "UFO_ORBIT_MAX_TURN", 3.0)),
-            )
+            max_turn = self.orbit_max_turn
             # simple lerp of direction based on dt*max_turn
             lerp = min(1.0, dt * max_turn)
             self.dir = (self.dir * (1.0 - lerp) + desired * lerp).normalize()
@@ -603,7 +677,7 @@ class UFO(pg.sprite.Sprite):
                     # Use full rectangular mask for UFO (ignore transparency)
                     w = int(frame["w"])
                     h = int(frame["h"])
-                    base_scale = float(getattr(C, "UFO_PIXEL_SCALE", 1))
+                    base_scale = settings.S.UFO_PIXEL_SCALE
                     float_scale = max(0.1, base_scale)
                     target_w = max(1, int(w * float_scale))
                     target_h = max(1, int(h * float_scale))
@@ -625,9 +699,8 @@ class UFO(pg.sprite.Sprite):
         rect = surf.get_rect(center=(int(self.pos.x), int(self.pos.y)))
         return (mask, rect)
 
-    # Function `draw(self, surf)` — describe purpose and behavior.
-    # Desenha o corpo do UFO como elipse
-    def draw(self, surf: pg.Surface):
+    # Function `blit_args(self)` — (surface, dest) of the current frame, or None.
+    def blit_args(self):
         # prefer embedded OVNI frames when available
         if OVNI_FRAMES:
             key = (
@@ -639,45 +712,53 @@ class UFO(pg.sprite.Sprite):
                 if isinstance(frame, dict) and "pixels" in frame:
                     w = int(frame["w"])
                     h = int(frame["h"])
-                    pixels = frame["pixels"]
-                    base_scale = float(getattr(C, "UFO_PIXEL_SCALE", 1))
-                    float_scale = max(0.1, base_scale)
-                    # draw original unscaled sprite into surf0 then scale smoothly
-                    surf0 = pg.Surface((w, h), pg.SRCALPHA)
-                    for y, row in enumerate(pixels):
-                        for x, col in enumerate(row):
-                            r, g, b, a = col
-                            if a == 0:
-                                continue
-                            surf0.set_at((x, y), (r, g, b, a))
+                    float_scale = max(0.1, settings.S.UFO_PIXEL_SCALE)
                     target_w = max(1, int(w * float_scale))
                     target_h = max(1, int(h * float_scale))
-                    spr = pg.transform.smoothscale(surf0, (target_w, target_h))
+                    # scaled once and cached by the asset helpers
+                    spr = assets.frame_to_surface(frame, target_w, target_h)
                     rect = spr.get_rect(
                         center=(int(self.pos.x), int(self.pos.y))
                     )
-                    surf.blit(spr, rect)
-                    return
+                    return (spr, rect)
+        return None
+
+    # Function `draw(self, surf)` — describe purpose and behavior.
+    # Desenha o corpo do UFO como elipse
+    def draw(self, surf: pg.Surface, offset=None):
+        pos = self.pos if offset is None else self.pos + offset
+        args = self.blit_args()
+        if args is not None:
+            surf.blit(args[0], _moved(args[1], offset))
+            return
 
         # fallback: draw simple ellipse if no embedded frames
         w, h = self.r * 2, self.r
         rect = pg.Rect(0, 0, w, h)
-        rect.center = self.pos
-        pg.draw.ellipse(surf, C.WHITE, rect, width=1)
+        rect.center = pos
+        pg.draw.ellipse(surf, settings.S.WHITE, rect, width=1)
         cup = pg.Rect(0, 0, w * 0.5, h * 0.7)
-        cup.center = (self.pos.x, self.pos.y - h * 0.3)
-        pg.draw.ellipse(surf, C.WHITE, cup, width=1)
+        cup.center = (pos.x, pos.y - h * 0.3)
+        pg.draw.ellipse(surf, settings.S.WHITE, cup, width=1)
 
 
 # Class `UFObullet` — describe responsibility and main methods.
 
 
 class UFObullet(Projectile):
+    __slots__ = ()
+
     # Function `__init__(self, pos, vel)` — describe purpose and behavior.
     def __init__(self, pos: Vec, vel: Vec):
-        colors = [C.WHITE, (0, 200, 255), (255, 80, 80)]
+        colors = [settings.S.WHITE, (0, 200, 255), (255, 80, 80)]
         super().__init__(
-            pos, vel, C.BULLET_RADIUS, length=10, width=3, colors=colors
+            pos,
+            vel,
+            settings.S.BULLET_RADIUS,
+            length=10,
+            width=3,
+            colors=colors,
+            ttl=settings.S.BULLET_TTL * 1.5,
         )
 
 
@@ -685,19 +766,28 @@ class UFObullet(Projectile):
 
 
 class Barrel(pg.sprite.Sprite):
-    # Function `__init__(self, x, target_y)` — describe purpose and behavior.
-    def __init__(self, x: float, target_y: float):
+    __slots__ = (
+        "pos", "target_y", "vel", "landed", "hp", "r", "kind", "damaged",
+        "rect", "exploded", "explosion_timer", "explosion_duration",
+        "explosion_radius", "_explosion_applied", "_explosion_surfaces",
+        "_explosion_masks", "cull_pad",
+    )
+    layer = render.BARRELS
+
+    # Function `__init__(self, x, target_y, top)` — describe purpose and behavior.
+    # The barrel starts at `top` (just above the visible area) and falls.
+    def __init__(self, x: float, target_y: float, top: float = -10):
         super().__init__()
         from random import uniform
 
-        self.pos = Vec(x, -10)
+        self.pos = Vec(x, top)
         self.target_y = target_y
-        self.vel = Vec(0, C.BARREL_FALL_SPEED)
+        self.vel = Vec(0, settings.S.BARREL_FALL_SPEED)
         self.landed = False
         # HP: how many hits it can take before destroyed
-        self.hp = int(getattr(C, "BARREL_HP", 2))
+        self.hp = settings.S.BARREL_HP
         # radius for collisions; default, may be overridden from frame size
-        self.r = int(getattr(C, "BARREL_RADIUS", 12))
+        self.r = settings.S.BARREL_RADIUS
         # choose barrel kind at spawn (e.g. 'base' or 'tnt') so each barrel
         # has its own visual type from the beginning
         if BARREL_FRAMES:
@@ -712,6 +802,14 @@ class Barrel(pg.sprite.Sprite):
             self.kind = "base"
         # damaged flag for visual state (does not change the kind)
         self.damaged = False
+        # TNT explosion state, filled in by hit()
+        self.exploded = False
+        self.explosion_timer = 0.0
+        self.explosion_duration = settings.S.BARREL_TNT_EXPLOSION_TIME
+        self.explosion_radius = settings.S.BARREL_TNT_EXPLOSION_RADIUS
+        self._explosion_applied = False
+        self._explosion_surfaces = None
+        self._explosion_masks = None
         # if we have an embedded frame for this kind, derive radius from it
         try:
             if (
@@ -725,7 +823,7 @@ class Barrel(pg.sprite.Sprite):
                     and "w" in sample
                     and "h" in sample
                 ):
-                    scale = int(getattr(C, "BARREL_PIXEL_SCALE", 1))
+                    scale = settings.S.BARREL_PIXEL_SCALE
                     scale = max(1, scale)
                     w = int(sample["w"]) * scale
                     h = int(sample["h"]) * scale
@@ -734,6 +832,14 @@ class Barrel(pg.sprite.Sprite):
             pass
         # rect used by sprite groups
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
+        self.cull_pad = 1
+        if BARREL_FRAMES and BARREL_FRAMES.get(self.kind):
+            self.cull_pad = _frame_pad(
+                BARREL_FRAMES[self.kind][0],
+                max(1, settings.S.BARREL_PIXEL_SCALE),
+                self.r,
+            )
+        self.rect.center = self.pos
 
     # Function `update(self, dt)` — describe purpose and behavior.
 
@@ -745,10 +851,8 @@ class Barrel(pg.sprite.Sprite):
                 self.vel = Vec(0, 0)
                 self.landed = True
         # manage explosion timer if triggered (for TNT barrels)
-        if getattr(self, "exploded", False):
-            self.explosion_timer = max(
-                0.0, getattr(self, "explosion_timer", 0.0) - dt
-            )
+        if self.exploded:
+            self.explosion_timer = max(0.0, self.explosion_timer - dt)
             if self.explosion_timer <= 0.0:
                 # end of visual explosion, remove barrel
                 self.kill()
@@ -757,122 +861,101 @@ class Barrel(pg.sprite.Sprite):
 
     # Function `draw(self, surf)` — describe purpose and behavior.
 
-    def draw(self, surf: pg.Surface):
+    # Function `blit_args(self)` — (surface, dest) for batched blitting, or None.
+    def blit_args(self):
+        center = (int(self.pos.x), int(self.pos.y))
+        if self.exploded and self.kind == "tnt":
+            # precomputed explosion frames (generated at hit time)
+            frames = self._explosion_surfaces
+            if not (EXP_FRAMES and EXP_FRAMES.get("explosao") and frames):
+                return None
+            dur = self.explosion_duration
+            elapsed = max(0.0, dur - self.explosion_timer)
+            t = 0.0 if dur <= 0 else min(1.0, elapsed / dur)
+            idx = int(t * (len(frames) - 1))
+            spr = frames[max(0, min(idx, len(frames) - 1))]
+            return (spr, spr.get_rect(center=center))
+        # prefer embedded barrel frames
+        if BARREL_FRAMES:
+            frames = BARREL_FRAMES.get(self.kind, [])
+            if frames:
+                frame = frames[0]
+                if isinstance(frame, dict) and "pixels" in frame:
+                    scale = max(1, settings.S.BARREL_PIXEL_SCALE)
+                    spr = assets.palette_frame(frame, scale, swap=None).surface
+                    return (spr, spr.get_rect(center=center))
+        return None
+
+    def draw(self, surf: pg.Surface, offset=None):
+        pos = self.pos if offset is None else self.pos + offset
+        args = self.blit_args()
+        if args is not None:
+            surf.blit(args[0], _moved(args[1], offset))
+            return
         # If this barrel is exploding (TNT), draw explosion circle and skip normal sprite
-        if getattr(self, "exploded", False) and self.kind == "tnt":
-            radius = int(
-                getattr(
-                    self,
-                    "explosion_radius",
-                    getattr(C, "BARREL_TNT_EXPLOSION_RADIUS", 80),
-                )
-            )
+        if self.exploded and self.kind == "tnt":
+            radius = self.explosion_radius
             # If we have embedded explosion frames, render the appropriate frame
             if (
                 EXP_FRAMES
                 and "explosao" in EXP_FRAMES
                 and EXP_FRAMES["explosao"]
             ):
-                # Prefer precomputed surfaces if available (generated at hit time)
-                frames = getattr(self, "_explosion_surfaces", None)
-                dur = float(
-                    getattr(
-                        self,
-                        "explosion_duration",
-                        getattr(C, "BARREL_TNT_EXPLOSION_TIME", 0.28),
-                    )
-                )
-                elapsed = max(
-                    0.0, dur - float(getattr(self, "explosion_timer", 0.0))
-                )
+                dur = self.explosion_duration
+                elapsed = max(0.0, dur - self.explosion_timer)
                 t = 0.0 if dur <= 0 else min(1.0, elapsed / dur)
-                if frames and len(frames) > 0:
-                    idx = int(t * (len(frames) - 1))
-                    idx = max(0, min(idx, len(frames) - 1))
-                    spr = frames[idx]
+                # on-the-fly rendering when precompute was not available
+                frames_src = EXP_FRAMES["explosao"]
+                idx = (
+                    int(t * (len(frames_src) - 1))
+                    if len(frames_src) > 0
+                    else 0
+                )
+                fr = frames_src[max(0, min(idx, len(frames_src) - 1))]
+                if isinstance(fr, dict) and "pixels" in fr:
+                    w = int(fr["w"])
+                    h = int(fr["h"])
+                    pixels = fr["pixels"]
+                    spr0 = pg.Surface((w, h), pg.SRCALPHA)
+                    for yy, row in enumerate(pixels):
+                        for xx, col in enumerate(row):
+                            r, g, b, a = col
+                            if a == 0:
+                                continue
+                            spr0.set_at((xx, yy), (r, g, b, a))
+                    target = max(1, int(radius * 2))
+                    try:
+                        spr = pg.transform.smoothscale(
+                            spr0, (target, target)
+                        )
+                    except Exception:
+                        spr = pg.transform.scale(spr0, (target, target))
                     rect = spr.get_rect(
-                        center=(int(self.pos.x), int(self.pos.y))
+                        center=(int(pos.x), int(pos.y))
                     )
                     surf.blit(spr, rect)
                     return
-                else:
-                    # fallback to previous on-the-fly rendering if precompute not available
-                    frames_src = EXP_FRAMES["explosao"]
-                    idx = (
-                        int(t * (len(frames_src) - 1))
-                        if len(frames_src) > 0
-                        else 0
-                    )
-                    fr = frames_src[max(0, min(idx, len(frames_src) - 1))]
-                    if isinstance(fr, dict) and "pixels" in fr:
-                        w = int(fr["w"])
-                        h = int(fr["h"])
-                        pixels = fr["pixels"]
-                        spr0 = pg.Surface((w, h), pg.SRCALPHA)
-                        for yy, row in enumerate(pixels):
-                            for xx, col in enumerate(row):
-                                r, g, b, a = col
-                                if a == 0:
-                                    continue
-                                spr0.set_at((xx, yy), (r, g, b, a))
-                        target = max(1, int(radius * 2))
-                        try:
-                            spr = pg.transform.smoothscale(
-                                spr0, (target, target)
-                            )
-                        except Exception:
-                            spr = pg.transform.scale(spr0, (target, target))
-                        rect = spr.get_rect(
-                            center=(int(self.pos.x), int(self.pos.y))
-                        )
-                        surf.blit(spr, rect)
-                        return
             # fallback: draw simple orange circle outline
             color = (255, 140, 0)
             try:
                 pg.draw.circle(
                     surf,
                     color,
-                    (int(self.pos.x), int(self.pos.y)),
+                    (int(pos.x), int(pos.y)),
                     radius,
                     width=3,
                 )
             except Exception:
                 from utils import draw_circle
 
-                draw_circle(surf, self.pos, radius)
+                draw_circle(surf, pos, radius)
             return
-        # prefer embedded barrel frames
-        if BARREL_FRAMES:
-            key = self.kind
-            frames = BARREL_FRAMES.get(key, [])
-            if frames:
-                frame = frames[0]
-                if isinstance(frame, dict) and "pixels" in frame:
-                    w = int(frame["w"])
-                    h = int(frame["h"])
-                    pixels = frame["pixels"]
-                    scale = int(getattr(C, "BARREL_PIXEL_SCALE", 2))
-                    scale = max(1, scale)
-                    spr = pg.Surface((w * scale, h * scale), pg.SRCALPHA)
-                    for y, row in enumerate(pixels):
-                        for x, col in enumerate(row):
-                            r, g, b, a = col
-                            if a == 0:
-                                continue
-                            rect = pg.Rect(x * scale, y * scale, scale, scale)
-                            pg.draw.rect(spr, (r, g, b, a), rect)
-                    rect = spr.get_rect(
-                        center=(int(self.pos.x), int(self.pos.y))
-                    )
-                    surf.blit(spr, rect)
-                    return
 
         # fallback: draw simple brown rectangle
         w = self.r * 2
         h = self.r * 2
         rect = pg.Rect(0, 0, w, h)
-        rect.center = self.pos
+        rect.center = pos
         pg.draw.rect(surf, (150, 90, 20), rect)
 
     # Function `get_mask(self)` — describe purpose and behavior.
@@ -888,7 +971,7 @@ class Barrel(pg.sprite.Sprite):
                     # Use a full rectangular mask (ignore transparency)
                     w = int(frame["w"])
                     h = int(frame["h"])
-                    scale = int(getattr(C, "BARREL_PIXEL_SCALE", 2))
+                    scale = settings.S.BARREL_PIXEL_SCALE
                     scale = max(1, scale)
                     surf = pg.Surface((w * scale, h * scale), pg.SRCALPHA)
                     # Fill entire surface as solid for simpler collisions
@@ -909,14 +992,22 @@ class Barrel(pg.sprite.Sprite):
         rect = surf.get_rect(center=(int(self.pos.x), int(self.pos.y)))
         return (mask, rect)
 
-    # Function `hit(self)` — describe purpose and behavior.
+    # Function `hit(self, effects)` — take one point of damage; `effects` is the
+    # world's ParticleSystem (optional) for splinters and the TNT fireball.
 
-    def hit(self):
+    def hit(self, effects=None):
         # Called when struck by a bullet
         self.hp -= 1
         if self.hp <= 0:
             # If this is a TNT barrel, trigger an explosion visual instead
-            if getattr(self, "kind", "base") == "tnt":
+            if self.kind == "tnt":
+                if effects is not None:
+                    effects.burst(
+                        self.pos,
+                        48,
+                        particles.FIRE,
+                        speed=settings.S.BARREL_TNT_EXPLOSION_RADIUS * 2.5,
+                    )
                 try:
                     import sounds
 
@@ -924,15 +1015,13 @@ class Barrel(pg.sprite.Sprite):
                 except Exception:
                     pass
                 self.exploded = True
-                self.explosion_timer = float(
-                    getattr(C, "BARREL_TNT_EXPLOSION_TIME", 0.28)
-                )
+                self.explosion_timer = float(settings.S.BARREL_TNT_EXPLOSION_TIME)
                 # store full duration so drawing can compute frame index
-                self.explosion_duration = float(
-                    getattr(C, "BARREL_TNT_EXPLOSION_TIME", 0.28)
-                )
-                self.explosion_radius = int(
-                    getattr(C, "BARREL_TNT_EXPLOSION_RADIUS", 80)
+                self.explosion_duration = float(settings.S.BARREL_TNT_EXPLOSION_TIME)
+                self.explosion_radius = int(settings.S.BARREL_TNT_EXPLOSION_RADIUS)
+                # the blast (frames or 3px outline) covers the explosion radius
+                self.cull_pad = max(
+                    self.cull_pad, self.explosion_radius - self.r + 2
                 )
                 # Precompute explosion frames as surfaces scaled to desired radius
                 try:
@@ -968,6 +1057,12 @@ class Barrel(pg.sprite.Sprite):
                 sounds.play_explosion()
             except Exception:
                 pass
+            if effects is not None:
+                effects.burst(self.pos, 16, particles.WOOD)
             self.kill()
         else:
             self.damaged = True
+            if effects is not None:
+                effects.burst(
+                    self.pos, 4, particles.WOOD, speed=settings.S.PARTICLE_SPEED * 0.6
+                )
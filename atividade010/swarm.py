@@ -0,0 +1,188 @@
+# Module `swarm.py` — batched UFO steering, cooldowns and fire directions.
+# UFO state lives in parallel arrays that are rebuilt only when the set of
+# live UFOs changes; each frame runs one vectorized step for all of them and
+# writes the results back to the sprites (which still own drawing/collision).
+# The math mirrors `UFO.update` and the original per-UFO firing loop
+# operation by operation, so results match the per-object code exactly.
+# Without NumPy the same interface falls back to the per-object code.
+import settings
+from utils import Vec, rand_unit_vec, world_size, wrap_delta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Function `_wrap_rows(delta)` — row-wise `wrap_delta`: take each (dx, dy) the short way around the world.
+def _wrap_rows(delta):
+    for axis, size in enumerate(world_size()):
+        col = delta[:, axis]
+        half = size / 2
+        delta[:, axis] = np.where(
+            col > half, col - size, np.where(col < -half, col + size, col)
+        )
+    return delta
+
+
+class UFOSwarm:
+    def __init__(self):
+        self._members = []
+
+    # Function `_sync(ufos)` — reload arrays from the sprites if membership changed.
+    def _sync(self, ufos) -> list:
+        members = ufos.sprites()
+        if members == self._members:
+            return members
+        self._members = members
+        self.pos = np.array([(u.pos.x, u.pos.y) for u in members], dtype=float)
+        self.dir = np.array([(u.dir.x, u.dir.y) for u in members], dtype=float)
+        self.pos.shape = self.dir.shape = (len(members), 2)
+        self.speed = np.array([u.speed for u in members], dtype=float)
+        self.t_w = np.array([u.orbit_tangential for u in members], dtype=float)
+        self.r_w = np.array([u.orbit_radial for u in members], dtype=float)
+        self.max_turn = np.array([u.orbit_max_turn for u in members], dtype=float)
+        self.aim = np.array([u.aim for u in members], dtype=float)
+        self.r = np.array([u.r for u in members], dtype=float)
+        self.fire_rate = np.array([u.fire_rate for u in members], dtype=float)
+        self.fire_cool = np.array([u.fire_cool for u in members], dtype=float)
+        self.shot_timer = np.array([u._shot_timer for u in members], dtype=float)
+        return members
+
+    # Function `steer(ufos, dt, ship_pos, steps)` — orbit the ship, move, wrap and tick shot frames.
+    # `steps` optionally gives each UFO (in group order) its own time step from
+    # the level-of-detail tiers; UFOs with a 0.0 step are left untouched.
+    def steer(self, ufos, dt: float, ship_pos: Vec, steps=None):
+        if np is None:
+            for i, ufo in enumerate(ufos.sprites()):
+                step = dt if steps is None else steps[i]
+                if step:
+                    ufo.update(step, ship_pos)
+            return
+        members = self._sync(ufos)
+        if not members:
+            return
+        if steps is None:
+            rows = slice(None)
+            dt_row = dt
+            dt_col = dt
+        else:
+            step = np.array(steps, dtype=float)
+            rows = np.flatnonzero(step > 0)
+            if not len(rows):
+                return
+            dt_row = step[rows]
+            dt_col = dt_row[:, None]
+        pos = self.pos[rows]
+        to_player = _wrap_rows(np.array((ship_pos.x, ship_pos.y)) - pos)
+        length = np.sqrt(to_player[:, 0] * to_player[:, 0] + to_player[:, 1] * to_player[:, 1])
+        zero = length == 0
+        if zero.any():
+            to_player[zero] = (1.0, 0.0)
+            length[zero] = 1.0
+        radial = to_player / length[:, None]
+        # perpendicular vector for tangential/orbit motion, keeping the current side
+        tangential = np.stack((-radial[:, 1], radial[:, 0]), axis=1)
+        old = self.dir[rows]
+        dot = old[:, 0] * tangential[:, 0] + old[:, 1] * tangential[:, 1]
+        tangential *= np.where(dot >= 0, 1.0, -1.0)[:, None]
+        desired = tangential * self.t_w[rows][:, None] + radial * self.r_w[rows][:, None]
+        dlen2 = desired[:, 0] * desired[:, 0] + desired[:, 1] * desired[:, 1]
+        flat = dlen2 == 0
+        dlen2[flat] = 1.0
+        desired /= np.sqrt(dlen2)[:, None]
+        desired[flat] = tangential[flat]
+        # smooth turning: lerp towards desired direction, then renormalize
+        lerp = np.minimum(1.0, dt_row * self.max_turn[rows])[:, None]
+        d = old * (1.0 - lerp) + desired * lerp
+        d /= np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1])[:, None]
+        # too far from the ship: keep flying straight (UFO_STEER_DIST)
+        far = length > settings.S.UFO_STEER_DIST
+        if far.any():
+            d[far] = old[far]
+        self.dir[rows] = d
+        pos += d * self.speed[rows][:, None] * dt_col
+        width, height = world_size()
+        np.remainder(pos[:, 0], width, out=pos[:, 0])
+        np.remainder(pos[:, 1], height, out=pos[:, 1])
+        self.pos[rows] = pos
+        timer = self.shot_timer[rows]
+        ticking = timer > 0
+        timer[ticking] = np.maximum(0.0, (timer - dt_row)[ticking])
+        ended = ticking & (timer == 0.0)
+        self.shot_timer[rows] = timer
+        if steps is not None:
+            members = [members[i] for i in rows.tolist()]
+        for ufo, (px, py), (dx, dy), t, end in zip(
+            members, pos.tolist(), d.tolist(), timer.tolist(), ended.tolist()
+        ):
+            ufo.pos.update(px, py)
+            ufo.dir.update(dx, dy)
+            ufo.rect.center = ufo.pos
+            ufo._shot_timer = t
+            if end:
+                ufo._show_shot = False
+
+    # Function `fire(ufos, dt, ship_pos)` — tick cooldowns; return [(ufo, fire_dir)] for UFOs that fire.
+    # Firing UFOs get their shot frame shown and cooldown reset here.
+    def fire(self, ufos, dt: float, ship_pos: Vec) -> list:
+        if np is None:
+            return self._fire_objects(ufos, dt, ship_pos)
+        members = self._sync(ufos)
+        if not members:
+            return []
+        cool = np.maximum(0.0, self.fire_cool - dt)
+        ready = np.flatnonzero(cool <= 0)
+        shots = []
+        if len(ready):
+            to_player = _wrap_rows(
+                np.array((ship_pos.x, ship_pos.y)) - self.pos[ready]
+            )
+            length = np.sqrt(
+                to_player[:, 0] * to_player[:, 0] + to_player[:, 1] * to_player[:, 1]
+            )
+            zero = length == 0
+            length[zero] = 1.0
+            to_player /= length[:, None]
+            # zero-length rows draw a random direction, in UFO order like the original loop
+            for row in np.flatnonzero(zero).tolist():
+                v = rand_unit_vec()
+                to_player[row] = (v.x, v.y)
+            aim = self.aim[ready][:, None]
+            fire_dir = self.dir[ready] * (1 - aim) + to_player * aim
+            fire_dir /= np.sqrt(
+                fire_dir[:, 0] * fire_dir[:, 0] + fire_dir[:, 1] * fire_dir[:, 1]
+            )[:, None]
+            cool[ready] = self.fire_rate[ready]
+            self.shot_timer[ready] = settings.S.UFO_SHOT_TIMER
+            for i, (fx, fy) in zip(ready.tolist(), fire_dir.tolist()):
+                ufo = members[i]
+                ufo._show_shot = True
+                ufo._shot_timer = settings.S.UFO_SHOT_TIMER
+                shots.append((ufo, Vec(fx, fy)))
+        self.fire_cool = cool
+        for ufo, c in zip(members, cool.tolist()):
+            ufo.fire_cool = c
+        return shots
+
+    # Function `_fire_objects(ufos, dt, ship_pos)` — per-object fallback for `fire`.
+    @staticmethod
+    def _fire_objects(ufos, dt: float, ship_pos: Vec) -> list:
+        shots = []
+        for ufo in ufos.sprites():
+            ufo.fire_cool = max(0.0, ufo.fire_cool - dt)
+            if ufo.fire_cool <= 0:
+                dir_to_player = wrap_delta(ship_pos, ufo.pos)
+                if dir_to_player.length() == 0:
+                    dir_to_player = rand_unit_vec()
+                else:
+                    dir_to_player = dir_to_player.normalize()
+                aim = ufo.aim
+                fire_dir = (
+                    ufo.dir * (1 - aim) + dir_to_player * aim
+                ).normalize()
+                ufo._show_shot = True
+                ufo._shot_timer = settings.S.UFO_SHOT_TIMER
+                ufo.fire_cool = ufo.fire_rate
+                shots.append((ufo, fire_dir))
+        return shots
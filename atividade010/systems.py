@@ -3,42 +3,98 @@ from random import uniform
 
 import pygame as pg
 
-import config as C
+import settings
 from sprites import Asteroid, Ship, UFO, Barrel
-from utils import Vec, rand_edge_pos, rand_unit_vec
+from utils import Vec, rand_unit_vec, world_size, wrap_delta, wrap_pos
 from sprites import UFObullet
+import particles
+import render
 import sounds
+import spawner
+from camera import Camera
+from lod import LODTiers
+from spatial import SpatialGrid
+from swarm import UFOSwarm
 from utils import get_logger
 
 logger = get_logger("systems")
 
 
+# Function `_wrap_shift(lo, hi, view_lo, view_hi, size)` — 1-D span test on a wrapping axis.
+# Returns the shift (0 or ±size) that brings [lo, hi) into the view, or None.
+def _wrap_shift(lo, hi, view_lo, view_hi, size):
+    if hi > view_lo and lo < view_hi:
+        return 0
+    if hi - size > view_lo and lo - size < view_hi:
+        return -size
+    if hi + size > view_lo and lo + size < view_hi:
+        return size
+    return None
+
+
+# Function `_seam_shift(a, b, size)` — how far `a` moves when paired with `b` across the world edge.
+# Zero unless the shortest way from `b` to `a` crosses the edge; rect and mask
+# offsets add it so sprites on both sides of the seam still touch.
+def _seam_shift(a: Vec, b: Vec, size) -> Vec:
+    return wrap_delta(a, b, size) - (a - b)
+
+
+# Function `_pair_order(pair)` — sort key for (asteroid index, bullet index, ...) pairs.
+def _pair_order(pair):
+    return pair[0], pair[1]
+
+
 # Game world that manages entities, scoring and global game logic.
 class World:
     # Initialize the world state: player, sprite groups, timers and difficulty state.
 
     def __init__(self):
         # Create the player's ship, sprite groups and game variables
-        self.ship = Ship(Vec(C.WIDTH / 2, C.HEIGHT / 2))
+        width, height = world_size()
+        self.ship = Ship(Vec(width / 2, height / 2))
         self.bullets = pg.sprite.Group()
         self.ufo_bullets = pg.sprite.Group()
         self.asteroids = pg.sprite.Group()
         self.ufos = pg.sprite.Group()
+        # UFO steering/firing runs as one batched step over all UFOs
+        self.ufo_swarm = UFOSwarm()
         self.all_sprites = pg.sprite.Group(self.ship)
         self.score = 0
-        self.lives = C.START_LIVES
-        # continuous spawn: timers to control asteroid spawning
-        self.asteroid_spawn_timer = 0.0
-        self.asteroid_spawn_interval = float(
-            getattr(C, "AST_SPAWN_INTERVAL_BASE", 1.5)
-        )
-        self.safe = C.SAFE_SPAWN_TIME
-        self.ufo_timer = C.UFO_SPAWN_EVERY
-        self.last_barrel_spawn = 0.0
-        self.next_barrel_spawn = uniform(
-            C.BARREL_SPAWN_INTERVAL_MIN, C.BARREL_SPAWN_INTERVAL_MAX
+        self.lives = settings.S.START_LIVES
+        self.safe = settings.S.SAFE_SPAWN_TIME
+        # continuous spawn: asteroid, UFO and barrel timers live in one queue
+        self.difficulty = spawner.DifficultyCurve()
+        self.edge_spawns = spawner.EdgeSpawnTable()
+        self.spawns = spawner.SpawnScheduler()
+        self.spawns.schedule(0.0, spawner.ASTEROID)
+        self.spawns.schedule(settings.S.UFO_SPAWN_EVERY, spawner.UFO)
+        self.spawns.schedule(
+            uniform(
+                settings.S.BARREL_SPAWN_INTERVAL_MIN,
+                settings.S.BARREL_SPAWN_INTERVAL_MAX,
+            ),
+            spawner.BARREL,
         )
+        self._spawn_handlers = {
+            spawner.ASTEROID: self.spawn_asteroid_wave,
+            spawner.UFO: self.spawn_ufo_wave,
+            spawner.BARREL: self.spawn_barrel,
+        }
         self.barrels = pg.sprite.Group()
+        # area of the (toroidal) world shown on screen, and what the last
+        # draw() call rendered or culled
+        self.camera = Camera()
+        self.camera.follow(self.ship.pos)
+        self.view = self.camera.rect
+        self.render_stats = {"drawn": 0, "culled": 0}
+        self.renderer = render.LayeredRenderer()
+        # neighbour queries for collision passes, rebuilt where they are used
+        self.asteroid_grid = SpatialGrid(settings.S.GRID_CELL_SIZE, world_size())
+        self.bullet_grid = SpatialGrid(settings.S.GRID_CELL_SIZE, world_size())
+        # asteroids/UFOs far from the ship update at a reduced rate
+        self.lod = LODTiers()
+        # debris, sparks and bullet trails (not sprites; see particles.py)
+        self.particles = particles.ParticleSystem()
 
     # (Wave system removed) asteroids now spawn continuously; difficulty scales with score
 
@@ -55,12 +111,12 @@ class World:
         # Spawn a UFO (small or large) at a random screen edge.
         # Small UFOs are biased to aim toward the player; large ones travel straight.
         small = uniform(0, 1) < 0.5
-        y = uniform(0, C.HEIGHT)
-        x = 0 if uniform(0, 1) < 0.5 else C.WIDTH
-        ufo = UFO(Vec(x, y), small)
+        y = uniform(0, settings.S.HEIGHT)
+        x = 0 if uniform(0, 1) < 0.5 else settings.S.WIDTH
+        ufo = UFO(self.camera.to_world(Vec(x, y), self.ship.pos), small)
         # Adjust initial direction so small UFOs aim toward the player
         if small:
-            to_player = self.ship.pos - ufo.pos
+            to_player = wrap_delta(self.ship.pos, ufo.pos)
             if to_player.length() > 0:
                 to_player = to_player.normalize()
             ufo.dir = (
@@ -74,10 +130,82 @@ class World:
         self.all_sprites.add(ufo)
 
 
-    def try_fire(self):
-        # Attempt to fire a bullet from the player's ship.
+    def spawn_asteroid_wave(self):
+        # Spawn asteroids at the screen edge, away from the player, and
+        # reschedule the next wave (interval shortens with difficulty).
+        diff = self.difficulty
+        self.spawns.schedule(diff.ast_interval, spawner.ASTEROID)
+        for _ in range(diff.ast_count):
+            # edge of the visible area, in world coordinates
+            pos = self.camera.to_world(
+                self.edge_spawns.pick(
+                    self.camera.to_screen(self.ship.pos), settings.S.AST_SPAWN_MIN_DIST
+                ),
+                self.ship.pos,
+            )
+            ang = uniform(0, math.tau)
+            # scale speed modestly with difficulty
+            speed = (
+                uniform(settings.S.AST_VEL_MIN, settings.S.AST_VEL_MAX)
+                * diff.ast_speed_scale
+            )
+            vel = Vec(math.cos(ang), math.sin(ang)) * speed
+            # select size probabilistically: more small/medium at higher difficulty
+            r = uniform(0, 1)
+            if r < diff.ast_prob_s:
+                size = "S"
+            elif r < (diff.ast_prob_s + diff.ast_prob_m):
+                size = "M"
+            else:
+                size = "L"
+            self.spawn_asteroid(pos, vel, size)
+
+
+    def spawn_ufo_wave(self):
+        # Spawn only up to the difference between desired and active UFOs.
+        diff = self.difficulty
+        for _ in range(max(0, diff.ufo_concurrent - len(self.ufos))):
+            self.spawn_ufo()
+        self.spawns.schedule(diff.ufo_interval, spawner.UFO)
+
+
+    def spawn_barrel(self):
+        # Create a barrel that falls from above the view to `target_y`.
+        x = uniform(20, settings.S.WIDTH - 20)
+        target_y = uniform(settings.S.HEIGHT * 0.5, settings.S.HEIGHT - 40)
+        view = self.view
+        top = view.top - 10
+        if self.camera.scrolling:
+            width, height = world_size()
+            x = (view.left + x) % width
+            target_y += view.top
+            if target_y >= height:
+                # keep the landing point inside the world
+                target_y -= height
+                top -= height
+        barrel = Barrel(x, target_y, top)
+        self.all_sprites.add(barrel)
+        self.barrels.add(barrel)
+        self.spawns.schedule(
+            uniform(
+                settings.S.BARREL_SPAWN_INTERVAL_MIN,
+                settings.S.BARREL_SPAWN_INTERVAL_MAX,
+            )
+            * self.difficulty.barrel_scale,
+            spawner.BARREL,
+        )
+
+
+    def try_fire(self, target=None):
+        # Attempt to fire a bullet from the player's ship towards `target`
+        # (the mouse position when omitted, e.g. a replayed aim point otherwise).
         # The ship's internal cooldown (`Ship.fire`) controls rate of fire.
-        b = self.ship.fire()
+        # `target` is in screen coordinates; map it into the world when scrolling.
+        if self.camera.scrolling:
+            if target is None:
+                target = pg.mouse.get_pos()
+            target = self.camera.to_world(target, self.ship.pos)
+        b = self.ship.fire(target)
         if b:
             self.bullets.add(b)
             self.all_sprites.add(b)
@@ -91,18 +219,27 @@ class World:
         # Teleport the player's ship to a random position and apply score penalty.
         # This is a risky but useful defensive mechanic.
         self.ship.hyperspace()
-        self.score = max(0, self.score - C.HYPERSPACE_COST)
+        self.score = max(0, self.score - settings.S.HYPERSPACE_COST)
 
 
     def update(self, dt: float, keys):
         # Update all sprites and main timers.
-        # Note: UFO.update accepts (dt, ship_pos) so we pass the player's position;
-        # other sprites implement update(dt) only.
+        # UFOs are skipped here: the swarm steers all of them at once around
+        # the player's (already updated) position. Asteroids and UFOs far
+        # from the ship take the (possibly skipped) step their LOD tier gives.
+        lod = self.lod
+        lod.begin(self.ship.pos)
         for spr in list(self.all_sprites):
-            if isinstance(spr, UFO):
-                spr.update(dt, self.ship.pos)
-            else:
+            if isinstance(spr, Asteroid):
+                step = lod.step(spr, dt)
+                if step:
+                    spr.update(step)
+            elif not isinstance(spr, UFO):
                 spr.update(dt)
+        steps = [lod.step(ufo, dt) for ufo in self.ufos.sprites()]
+        if all(step == dt for step in steps):
+            steps = None
+        self.ufo_swarm.steer(self.ufos, dt, self.ship.pos, steps)
         self.ufo_bullets.update(dt)
         self.ship.control(keys, dt)
         # The ship is updated via `all_sprites.update`
@@ -111,138 +248,87 @@ class World:
         if self.safe > 0:
             self.safe -= dt
             self.ship.invuln = 0.5
-        self.ufo_timer -= dt
-        if self.ufo_timer <= 0:
-            # difficulty scales with score (higher score -> more frequent spawns)
-            difficulty = 1.0 + (float(self.score) / C.AST_DIFFICULTY_SCORE_SCALE)
-            
-            configured_count = getattr(C, "UFO_SPAWN_COUNT", 1)
-            
-            # determine desired concurrent UFOs (scale slowly with difficulty)
-            desired_concurrent = min(configured_count, 1 + int(difficulty / 2))
-            # spawn only up to the difference between desired and current active UFOs
-            spawn_count = max(0, desired_concurrent - len(self.ufos))
-            for _ in range(spawn_count):
-                # Spawn up to `spawn_count` UFOs to reach desired concurrency.
-                self.spawn_ufo()
-            # shorten interval as difficulty rises
-            self.ufo_timer = float(getattr(C, "UFO_SPAWN_EVERY", 20.0)) / max(0.001, difficulty)
-
-        # barrel spawn (intervals scale with difficulty)
-        # Barrel spawn management: spawn barrels periodically (interval may scale with difficulty)
-        self.last_barrel_spawn += dt
-        if self.last_barrel_spawn >= self.next_barrel_spawn:
-            self.last_barrel_spawn = 0.0
-            difficulty = 1.0 + (float(self.score) / C.AST_DIFFICULTY_SCORE_SCALE)
-            self.next_barrel_spawn = uniform(
-                C.BARREL_SPAWN_INTERVAL_MIN, C.BARREL_SPAWN_INTERVAL_MAX
-            ) / max(0.001, difficulty)
-            # Create a barrel that falls from above to `target_y`.
-            x = uniform(20, C.WIDTH - 20)
-            target_y = uniform(C.HEIGHT * 0.5, C.HEIGHT - 40)
-            barrel = Barrel(x, target_y)
-            self.all_sprites.add(barrel)
-            self.barrels.add(barrel)
-
-        # UFO firing logic
-        for ufo in list(self.ufos):
-            if hasattr(ufo, "fire_cool"):
-                ufo.fire_cool = max(0.0, ufo.fire_cool - dt)
-                if ufo.fire_cool <= 0:
-                    dir_to_player = self.ship.pos - ufo.pos
-                    if dir_to_player.length() == 0:
-                        dir_to_player = rand_unit_vec()
-                    else:
-                        dir_to_player = dir_to_player.normalize()
-                    aim = ufo.aim if hasattr(ufo, "aim") else 0.3
-                    fire_dir = (
-                        ufo.dir * (1 - aim) + dir_to_player * aim
-                    ).normalize()
-                    # Use a scaled bullet speed for UFO shots (slightly slower than player)
-                    vel = fire_dir * (C.BULLET_SPEED * 0.8)
-                    b = UFObullet(ufo.pos + fire_dir * (ufo.r + 6), vel)
-                    self.ufo_bullets.add(b)
-                    self.all_sprites.add(b)
-                    # mark ufo to display 'shot' frame briefly (if it supports embedded frames)
-                    # mark ufo to display 'shot' frame briefly (if it supports embedded frames)
-                    ufo._show_shot = True
-                    ufo._shot_timer = C.UFO_SHOT_TIMER
-                    
-                    # reset the UFO fire cooldown
-                    ufo.fire_cool = ufo.fire_rate
-                    try:
-                        sounds.play_ufo_shot()
-                    except Exception as e:
-                        logger.warning(f"Failed to play UFO shot sound: {e}")
+
+        # Fire due spawn events; difficulty values are only recomputed on score change.
+        # Asteroid waves keep their old place after collision resolution, so a
+        # fresh asteroid cannot be hit on the tick it appears.
+        self.difficulty.update(self.score)
+        asteroid_waves = 0
+        for kind in self.spawns.advance(dt):
+            if kind == spawner.ASTEROID:
+                asteroid_waves += 1
+            else:
+                self._spawn_handlers[kind]()
+
+        # UFO firing logic: cooldowns and aim for all UFOs in one batched step
+        for ufo, fire_dir in self.ufo_swarm.fire(self.ufos, dt, self.ship.pos):
+            # Use a scaled bullet speed for UFO shots (slightly slower than player)
+            vel = fire_dir * (settings.S.BULLET_SPEED * 0.8)
+            b = UFObullet(ufo.pos + fire_dir * (ufo.r + 6), vel)
+            self.ufo_bullets.add(b)
+            self.all_sprites.add(b)
+            try:
+                sounds.play_ufo_shot()
+            except Exception as e:
+                logger.warning(f"Failed to play UFO shot sound: {e}")
 
         # Resolve collisions after updates (bullets, asteroids, UFOs, barrels)
         self.handle_collisions()
 
         # Continuous asteroid spawning (difficulty scales with score)
-        # `difficulty` already computed above from score
-        difficulty = 1.0 + (float(self.score) / C.AST_DIFFICULTY_SCORE_SCALE)
-        self.asteroid_spawn_timer -= dt
-        if self.asteroid_spawn_timer <= 0:
-            # compute next interval (shortens as difficulty increases)
-            interval = max(
-                float(getattr(C, "AST_SPAWN_INTERVAL_MIN", 0.4)),
-                float(getattr(C, "AST_SPAWN_INTERVAL_BASE", 1.5))
-                / max(0.001, difficulty),
-            )
-            self.asteroid_spawn_timer = interval
-            # determine how many to spawn this tick (increase slowly with score)
-            spawn_count = 1 + int(self.score / C.AST_SCORE_SPAWN_FACTOR)
-            spawn_count = min(spawn_count, C.AST_MAX_SPAWN_COUNT)
-            for _ in range(spawn_count):
-                # Spawn asteroid at a random screen edge, avoiding the player
-                pos = rand_edge_pos()
-                # avoid spawns too close to the player
-                tries = 0
-                while (pos - self.ship.pos).length() < C.AST_SPAWN_MIN_DIST and tries < C.AST_SPAWN_MAX_TRIES:
-                    pos = rand_edge_pos()
-                    tries += 1
-                ang = uniform(0, math.tau)
-                base_speed = uniform(C.AST_VEL_MIN, C.AST_VEL_MAX)
-                # scale speed modestly with difficulty
-                speed = base_speed * (1.0 + (difficulty - 1.0) * C.AST_SPEED_SCALE)
-                vel = Vec(math.cos(ang), math.sin(ang)) * speed
-                # select size probabilistically: more small/medium at higher difficulty
-                prob_m = min(0.4, (difficulty - 1.0) * 0.15)
-                prob_s = min(0.2, (difficulty - 1.0) * 0.05)
-                r = uniform(0, 1)
-                if r < prob_s:
-                    size = "S"
-                elif r < (prob_s + prob_m):
-                    size = "M"
-                else:
-                    size = "L"
-                self.spawn_asteroid(pos, vel, size)
+        if asteroid_waves:
+            self.difficulty.update(self.score)
+            for _ in range(asteroid_waves):
+                self.spawn_asteroid_wave()
+        if settings.S.PARTICLE_TRAILS:
+            self.particles.trail(self.bullets)
+        self.particles.update(dt)
+        self.camera.follow(self.ship.pos)
 
 
     def handle_collisions(self):
-        # Collision: player bullets vs asteroids
-        hits = pg.sprite.groupcollide(
-            self.asteroids,
-            self.bullets,
-            False,
-            True,
-            collided=lambda a, b: (a.pos - b.pos).length() < a.r,
-        )
-        for ast, _ in hits.items():
+        # Collision: player bullets vs asteroids. Each asteroid consumes the
+        # bullets inside its radius. Candidate pairs come from the asteroids
+        # around each bullet, so the cost follows the bullets (which stay near
+        # the ship) rather than the asteroid count; pairs are then resolved in
+        # asteroid order, as a scan over all asteroids would. Every distance is
+        # the shortest one around the toroidal world.
+        size = world_size()
+        grid = self.asteroid_grid.rebuild(self.asteroids)
+        pairs = []
+        for bi, b in enumerate(self.bullets.sprites()):
+            for ai, ast in grid.query(b.pos, grid.max_r, indexed=True):
+                if wrap_delta(ast.pos, b.pos, size).length() < ast.r:
+                    pairs.append((ai, bi, ast, b))
+        hits = []
+        if pairs:
+            pairs.sort(key=_pair_order)
+            for _, _, ast, b in pairs:
+                if b.alive():
+                    b.kill()
+                    if not hits or hits[-1] is not ast:
+                        hits.append(ast)
+        for ast in hits:
             self.split_asteroid(ast)
+        if hits:
+            grid.rebuild(self.asteroids)
 
         # Collision: player ship vs objects when not invulnerable
         if self.ship.invuln <= 0 and self.safe <= 0:
             # try pixel-perfect collision using masks when available
             ship_mask, ship_rect = self.ship.get_mask()
             if ship_mask is not None:
-                for ast in list(self.asteroids):
+                # masks can only overlap when the bounding rects do
+                grid = self.asteroid_grid
+                reach = max(ship_rect.width, ship_rect.height) / 2 + grid.max_r + 1
+                for ast in grid.query(self.ship.pos, reach):
                     ast_mask, ast_rect = ast.get_mask()
                     if ast_mask is None:
                         continue
+                    shift = _seam_shift(ast.pos, self.ship.pos, size)
                     offset = (
-                        int(ast_rect.left - ship_rect.left),
-                        int(ast_rect.top - ship_rect.top),
+                        int(ast_rect.left - ship_rect.left + shift.x),
+                        int(ast_rect.top - ship_rect.top + shift.y),
                     )
                     if ship_mask.overlap(ast_mask, offset):
                         self.ship_die()
@@ -252,9 +338,10 @@ class World:
                         ufo_mask, ufo_rect = ufo.get_mask()
                         if ufo_mask is None:
                             continue
+                        shift = _seam_shift(ufo.pos, self.ship.pos, size)
                         offset = (
-                            int(ufo_rect.left - ship_rect.left),
-                            int(ufo_rect.top - ship_rect.top),
+                            int(ufo_rect.left - ship_rect.left + shift.x),
+                            int(ufo_rect.top - ship_rect.top + shift.y),
                         )
                         if ship_mask.overlap(ufo_mask, offset):
                             self.ship_die()
@@ -264,25 +351,26 @@ class World:
                         bar_mask, bar_rect = barrel.get_mask()
                         if bar_mask is None:
                             continue
+                        shift = _seam_shift(barrel.pos, self.ship.pos, size)
                         offset = (
-                            int(bar_rect.left - ship_rect.left),
-                            int(bar_rect.top - ship_rect.top),
+                            int(bar_rect.left - ship_rect.left + shift.x),
+                            int(bar_rect.top - ship_rect.top + shift.y),
                         )
                         if ship_mask.overlap(bar_mask, offset):
                             # block traversal: revert ship to previous position if available
                             # block traversal: revert ship to previous position if available
-                            if hasattr(self.ship, "_prev_pos") and self.ship._prev_pos is not None:
+                            if self.ship._prev_pos is not None:
                                 self.ship.pos = Vec(self.ship._prev_pos)
                             else:
                                 # fallback: push outside slightly
-                                dirv = self.ship.pos - barrel.pos
+                                dirv = wrap_delta(self.ship.pos, barrel.pos, size)
                                 if dirv.length() == 0:
                                     from utils import rand_unit_vec
 
                                     dirv = rand_unit_vec()
                                 dirv_norm = dirv.normalize()
                                 desired_dist = (barrel.r + self.ship.r) + 1
-                                self.ship.pos = (
+                                self.ship.pos = wrap_pos(
                                     barrel.pos + dirv_norm * desired_dist
                                 )
                             self.ship.vel = Vec(0, 0)
@@ -290,65 +378,71 @@ class World:
             else:
                 # fallback to distance checks if masks are not available
                 for ast in self.asteroids:
-                    if (ast.pos - self.ship.pos).length() < (
+                    if wrap_delta(ast.pos, self.ship.pos, size).length() < (
                         ast.r + self.ship.r
                     ):
                         self.ship_die()
                         break
                 for ufo in self.ufos:
-                    if (ufo.pos - self.ship.pos).length() < (
+                    if wrap_delta(ufo.pos, self.ship.pos, size).length() < (
                         ufo.r + self.ship.r
                     ):
                         self.ship_die()
                         break
                 # fallback: barrels by radius (non-lethal response)
                 for barrel in self.barrels:
-                    if (barrel.pos - self.ship.pos).length() < (
+                    if wrap_delta(barrel.pos, self.ship.pos, size).length() < (
                         barrel.r + self.ship.r
                     ):
-                        if hasattr(self.ship, "_prev_pos") and self.ship._prev_pos is not None:
+                        if self.ship._prev_pos is not None:
                             self.ship.pos = Vec(self.ship._prev_pos)
                         else:
-                            dirv = self.ship.pos - barrel.pos
+                            dirv = wrap_delta(self.ship.pos, barrel.pos, size)
                             if dirv.length() == 0:
                                 from utils import rand_unit_vec
 
                                 dirv = rand_unit_vec()
                             dirv_norm = dirv.normalize()
                             desired_dist = (barrel.r + self.ship.r) + 1
-                            self.ship.pos = (
+                            self.ship.pos = wrap_pos(
                                 barrel.pos + dirv_norm * desired_dist
                             )
                         self.ship.vel = Vec(0, 0)
                         break
 
         # Destroy UFOs that collide with asteroids
+        grid = self.asteroid_grid
         for ufo in list(self.ufos):
-            for ast in list(self.asteroids):
-                if (ast.pos - ufo.pos).length() < (ast.r + ufo.r):
+            for ast in grid.query(ufo.pos, ufo.r + grid.max_r):
+                if wrap_delta(ast.pos, ufo.pos, size).length() < (ast.r + ufo.r):
                     try:
                         sounds.play_explosion()
                     except Exception as e:
                         logger.warning(f"Failed to play explosion sound: {e}")
+                    self.ufo_burst(ufo)
                     ufo.kill()
                     break
 
         # Collision: player bullets vs UFOs
+        grid = self.bullet_grid.rebuild(self.bullets)
         for ufo in list(self.ufos):
-            for b in list(self.bullets):
-                if (ufo.pos - b.pos).length() < (ufo.r + b.r):
+            for b in grid.query(ufo.pos, ufo.r + grid.max_r):
+                if b.alive() and wrap_delta(ufo.pos, b.pos, size).length() < (
+                    ufo.r + b.r
+                ):
                     score = (
-                        C.UFO_SMALL["score"]
+                        settings.S.UFO_SMALL["score"]
                         if ufo.small
-                        else C.UFO_BIG["score"]
+                        else settings.S.UFO_BIG["score"]
                     )
                     self.score += score
+                    self.ufo_burst(ufo)
                     ufo.kill()
                     b.kill()
 
         # Check if enemy shots hit the player's ship
         for b in list(self.ufo_bullets):
-            if (b.pos - self.ship.pos).length() < (
+            if wrap_delta(b.pos, self.ship.pos, size).length() < (
                 b.r + self.ship.r
             ) and self.ship.invuln <= 0:
                 b.kill()
@@ -358,11 +452,7 @@ class World:
         for b in list(self.bullets):
             for barrel in list(self.barrels):
                 # attempt to get masks; bullets may not provide masks
-                get_b_mask = getattr(b, "get_mask", None)
-                if callable(get_b_mask):
-                    m_b = get_b_mask()
-                else:
-                    m_b = (None, None)
+                m_b = b.get_mask()
                 m_bar = barrel.get_mask()
                 collided = False
                 if (
@@ -373,24 +463,26 @@ class World:
                 ):
                     mask_b, rect_b = m_b
                     mask_bar, rect_bar = m_bar
+                    shift = _seam_shift(b.pos, barrel.pos, size)
                     offset = (
-                        rect_b.left - rect_bar.left,
-                        rect_b.top - rect_bar.top,
+                        int(rect_b.left - rect_bar.left + shift.x),
+                        int(rect_b.top - rect_bar.top + shift.y),
                     )
                     if mask_bar.overlap(mask_b, offset):
                         collided = True
                 else:
                     # fallback radius check — also test segment from previous to current
                     try:
-                        prev = getattr(b, "_prev_pos", None)
+                        prev = b._prev_pos
                         cur = b.pos
                         if prev is None:
-                            dist = (cur - barrel.pos).length()
+                            dist = wrap_delta(cur, barrel.pos, size).length()
                             if dist <= (b.r + barrel.r):
                                 collided = True
                         else:
-                            # distance from point to segment
-                            pa = barrel.pos
+                            # distance from point to segment (the barrel's
+                            # copy nearest the bullet, across the edge if need be)
+                            pa = cur + wrap_delta(barrel.pos, cur, size)
                             p1 = prev
                             p2 = cur
                             seg = p2 - p1
@@ -407,31 +499,25 @@ class World:
                             if d <= (b.r + barrel.r):
                                 collided = True
                     except Exception:
-                        if (b.pos - barrel.pos).length() <= (b.r + barrel.r):
+                        if wrap_delta(b.pos, barrel.pos, size).length() <= (
+                            b.r + barrel.r
+                        ):
                             collided = True
                 if collided:
                     b.kill()
-                    barrel.hit()
+                    barrel.hit(self.particles)
                     break
 
         # Handle TNT barrel explosion area damage (apply once per explosion)
         for barrel in list(self.barrels):
-            if getattr(barrel, "exploded", False) and not getattr(
-                barrel, "_explosion_applied", False
-            ):
-                try:
-                    radius = float(
-                        getattr(
-                            barrel,
-                            "explosion_radius",
-                            getattr(C, "BARREL_TNT_EXPLOSION_RADIUS", 80),
-                        )
-                    )
-                except Exception:
-                    radius = getattr(C, "BARREL_TNT_EXPLOSION_RADIUS", 80)
+            if barrel.exploded and not barrel._explosion_applied:
+                radius = float(barrel.explosion_radius)
                 # Affect asteroids: call split_asteroid to simulate destruction
-                for ast in list(self.asteroids):
-                    if (ast.pos - barrel.pos).length() <= (radius + ast.r):
+                grid = self.asteroid_grid.rebuild(self.asteroids)
+                for ast in grid.query(barrel.pos, radius + grid.max_r):
+                    if wrap_delta(ast.pos, barrel.pos, size).length() <= (
+                        radius + ast.r
+                    ):
                         try:
                             self.split_asteroid(ast)
                         except Exception:
@@ -441,23 +527,26 @@ class World:
                                 pass
                 # Affect UFOs: kill and award score
                 for ufo in list(self.ufos):
-                    if (ufo.pos - barrel.pos).length() <= (radius + ufo.r):
+                    if wrap_delta(ufo.pos, barrel.pos, size).length() <= (
+                        radius + ufo.r
+                    ):
                         try:
                             score = (
-                                C.UFO_SMALL["score"]
+                                settings.S.UFO_SMALL["score"]
                                 if ufo.small
-                                else C.UFO_BIG["score"]
+                                else settings.S.UFO_BIG["score"]
                             )
                             self.score += score
                         except Exception:
                             pass
                         try:
+                            self.ufo_burst(ufo)
                             ufo.kill()
                         except Exception:
                             pass
                 # Affect ship: apply damage (like a bullet) if within radius
                 try:
-                    if (self.ship.pos - barrel.pos).length() <= (
+                    if wrap_delta(self.ship.pos, barrel.pos, size).length() <= (
                         radius + self.ship.r
                     ) and self.ship.invuln <= 0:
                         self.ship_die()
@@ -467,50 +556,99 @@ class World:
                 for other in list(self.barrels):
                     if other is barrel:
                         continue
-                    if (other.pos - barrel.pos).length() <= (radius + other.r):
-                        other.hit()
+                    if wrap_delta(other.pos, barrel.pos, size).length() <= (
+                        radius + other.r
+                    ):
+                        other.hit(self.particles)
                 # mark applied so it doesn't reapply each frame
                 barrel._explosion_applied = True
 
 
     def split_asteroid(self, ast: Asteroid):
         # Fragment asteroid and award points
-        self.score += C.AST_SIZES[ast.size]["score"]
-        split = C.AST_SIZES[ast.size]["split"]
+        self.score += settings.S.AST_SIZES[ast.size]["score"]
+        split = settings.S.AST_SIZES[ast.size]["split"]
         pos = Vec(ast.pos)
         ast.kill()
+        self.particles.burst(pos, ast.r // 3 + 4, particles.DEBRIS)
         for s in split:
             dirv = rand_unit_vec()
-            speed = uniform(C.AST_VEL_MIN, C.AST_VEL_MAX) * 1.2
+            speed = uniform(settings.S.AST_VEL_MIN, settings.S.AST_VEL_MAX) * 1.2
             self.spawn_asteroid(pos, dirv * speed, s)
 
 
+    def ufo_burst(self, ufo: UFO):
+        # Sparks and fire for a destroyed UFO (once, even if hit twice)
+        if ufo.alive():
+            self.particles.burst(ufo.pos, 16, particles.SPARK)
+            self.particles.burst(ufo.pos, 8, particles.FIRE)
+
+
     def ship_die(self):
         # Handle player ship death
         self.lives -= 1
-        self.ship.pos.xy = (C.WIDTH / 2, C.HEIGHT / 2)
+        width, height = world_size()
+        self.ship.pos.xy = (width / 2, height / 2)
         self.ship.vel.xy = (0, 0)
         self.ship.angle = -90
-        self.ship.invuln = C.SAFE_SPAWN_TIME
-        self.safe = C.SAFE_SPAWN_TIME
+        self.ship.invuln = settings.S.SAFE_SPAWN_TIME
+        self.safe = settings.S.SAFE_SPAWN_TIME
         if self.lives < 0:
             # Reset the world when the player loses all lives
             self.__init__()
 
 
+    # Function `screen_offset(spr)` — world-to-screen shift for `spr`, or None if off view.
+    # The world wraps around, so a rect that pokes past one edge is also tested
+    # as its wrapped copy, shifted by the world size.
+    def screen_offset(self, spr):
+        rect = spr.rect
+        pad = spr.cull_pad
+        view = self.view
+        camera = self.camera
+        sx = _wrap_shift(
+            rect.left - pad, rect.right + pad, view.left, view.right, camera.world_w
+        )
+        if sx is None:
+            return None
+        sy = _wrap_shift(
+            rect.top - pad, rect.bottom + pad, view.top, view.bottom, camera.world_h
+        )
+        if sy is None:
+            return None
+        return (sx - view.left, sy - view.top)
+
+    # Function `visible(spr)` — does the sprite's padded rect overlap the view?
+    def visible(self, spr) -> bool:
+        return self.screen_offset(spr) is not None
+
     def draw(self, surf: pg.Surface, font: pg.font.Font):
-        # Draw all sprites and HUD
+        # Queue visible sprites on their layers (off-view sprites are
+        # skipped), then the HUD, and render everything back to front
+        renderer = self.renderer
+        drawn = culled = 0
         for spr in self.all_sprites:
-            spr.draw(surf)
+            offset = self.screen_offset(spr)
+            if offset is None:
+                culled += 1
+                continue
+            renderer.add_sprite(spr, offset if offset[0] or offset[1] else None)
+            drawn += 1
+        self.render_stats["drawn"] = drawn
+        self.render_stats["culled"] = culled
+        self.particles.queue(renderer, self.view)
+
+        renderer.add_draw(render.HUD, _draw_hud_line)
+        self.difficulty.update(self.score)
+        txt = (
+            f"SCORE {self.score:06d}   LIVES {self.lives}   "
+            f"DIFF {self.difficulty.value:.2f}"
+        )
+        label = font.render(txt, True, settings.S.WHITE)
+        renderer.add_blit(render.HUD, label, (10, 10))
+        renderer.flush(surf)
 
-        pg.draw.line(surf, (60, 60, 60), (0, 50), (C.WIDTH, 50), width=1)
-        try:
-            difficulty = 1.0 + (
-                float(self.score)
-                / float(getattr(C, "AST_DIFFICULTY_SCORE_SCALE", 1000.0))
-            )
-            txt = f"SCORE {self.score:06d}   LIVES {self.lives}   DIFF {difficulty:.2f}"
-        except Exception:
-            txt = f"SCORE {self.score:06d}   LIVES {self.lives}"
-        label = font.render(txt, True, C.WHITE)
-        surf.blit(label, (10, 10))
+
+# Function `_draw_hud_line(surf)` — separator under the HUD text.
+def _draw_hud_line(surf: pg.Surface):
+    pg.draw.line(surf, (60, 60, 60), (0, 50), (settings.S.WIDTH, 50), width=1)
@@ -5,7 +5,7 @@ from typing import Iterable, Tuple
 
 import pygame as pg
 
-import config as C
+import settings
 import logging
 
 def get_logger(name):
@@ -22,9 +22,33 @@ def get_logger(name):
 Vec = pg.math.Vector2
 
 
+def world_size() -> Tuple[int, int]:
+    # Size of the toroidal playfield; defaults to the screen size.
+    S = settings.S
+    return (S.WORLD_WIDTH or S.WIDTH, S.WORLD_HEIGHT or S.HEIGHT)
+
+
 def wrap_pos(pos: Vec) -> Vec:
-    # Wrap a position around the screen edges (toroidal coordinates).
-    return Vec(pos.x % C.WIDTH, pos.y % C.HEIGHT)
+    # Wrap a position around the world edges (toroidal coordinates).
+    width, height = world_size()
+    return Vec(pos.x % width, pos.y % height)
+
+
+def wrap_delta(a: Vec, b: Vec, size: Tuple[int, int] | None = None) -> Vec:
+    # Shortest vector from `b` to `a` on the toroidal world: `a - b`, taken
+    # across the world edge when that way is shorter. Hot loops pass `size`.
+    width, height = world_size() if size is None else size
+    dx = a.x - b.x
+    dy = a.y - b.y
+    if dx > width / 2:
+        dx -= width
+    elif dx < -width / 2:
+        dx += width
+    if dy > height / 2:
+        dy -= height
+    elif dy < -height / 2:
+        dy += height
+    return Vec(dx, dy)
 
 
 def angle_to_vec(deg: float) -> Vec:
@@ -40,29 +64,30 @@ def rand_unit_vec() -> Vec:
 
 
 def rand_edge_pos() -> Vec:
-    # Return a random position located on one of the screen edges.
+    # Return a random position located on one of the world edges.
     # Used to spawn objects that enter from the border.
+    width, height = world_size()
     if random() < 0.5:
-        x = uniform(0, C.WIDTH)
-        y = 0 if random() < 0.5 else C.HEIGHT
+        x = uniform(0, width)
+        y = 0 if random() < 0.5 else height
     else:
-        x = 0 if random() < 0.5 else C.WIDTH
-        y = uniform(0, C.HEIGHT)
+        x = 0 if random() < 0.5 else width
+        y = uniform(0, height)
     return Vec(x, y)
 
 
 def draw_poly(surface: pg.Surface, pts: Iterable[Tuple[int, int]]):
     # Draw a polygon outline using the default game color.
-    pg.draw.polygon(surface, C.WHITE, list(pts), width=1)
+    pg.draw.polygon(surface, settings.S.WHITE, list(pts), width=1)
 
 
 def draw_circle(surface: pg.Surface, pos: Vec, r: int):
     # Draw a circle outline at `pos` with radius `r` using the default color.
-    pg.draw.circle(surface, C.WHITE, pos, r, width=1)
+    pg.draw.circle(surface, settings.S.WHITE, pos, r, width=1)
 
 
 def text(surface: pg.Surface, font: pg.font.Font, s: str, x: int, y: int):
     # Render `s` with `font` and blit it at (x, y) on `surface`.
-    surf = font.render(s, True, C.WHITE)
+    surf = font.render(s, True, settings.S.WHITE)
     rect = surf.get_rect(topleft=(x, y))
     surface.blit(surf, rect)
@@ -0,0 +1,55 @@
+# Tests for the WeaselRun API in the shared weasel package (`weaselcore`)
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+np = pytest.importorskip("numpy")
+
+from weaselcore import ElitistTopK, WeaselRun  # noqa: E402
+
+
+def best_rows(scores, count, rng):
+    # A plain selection function, with no `keeps_parents` attribute
+    return np.argsort(-scores, kind="stable")[:count]
+
+
+def test_plain_function_selection_runs():
+    result = WeaselRun(
+        target="HELLO", population_size=50, selection=best_rows, seed=1
+    ).run()
+    assert result.found
+    assert result.best == "HELLO"
+
+
+def test_plain_function_matches_truncation():
+    # without `keeps_parents` a plain function behaves like Truncation
+    plain = WeaselRun(target="HELLO", selection=best_rows, parents=3, seed=2).run()
+    default = WeaselRun(target="HELLO", parents=3, seed=2).run()
+    assert (plain.best, plain.generations) == (default.best, default.generations)
+
+
+def test_keeps_parents_attribute_is_honoured():
+    seen = []
+
+    class Recording(ElitistTopK):
+        def __call__(self, scores, count, rng):
+            seen.append(scores.size)
+            return super().__call__(scores, count, rng)
+
+    result = WeaselRun(
+        target="HELLO", population_size=20, selection=Recording(), parents=2, seed=3
+    ).run()
+    assert result.found
+    # the current parents compete with the 20 children: one random phrase
+    # in the first generation, then the two selected parents
+    assert seen[0] == 21
+    assert set(seen[1:]) <= {22}
+
+
+def test_zero_generations_reports_the_starting_phrase():
+    result = WeaselRun(target="HELLO", seed=4, max_generations=0).run()
+    assert result.generations == 0
+    assert len(result.best) == 5
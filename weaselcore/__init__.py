@@ -0,0 +1,47 @@
+# Shared weasel package: Dawkins' weasel with one registry of engines (pure
+# Python, incremental, sparse, NumPy, bit-packed, multiprocess), the
+# configurable WeaselRun API, the streaming runner and the CLI. The
+# atividade001 and atividade002 programs are thin front-ends over it.
+from .defaults import (
+    CHARACTERS,
+    CHECKPOINT_SECONDS,
+    CHUNK_ROWS,
+    MUTATION_RATE,
+    POPULATION_SIZE,
+    TARGET_PHRASE,
+)
+from .engines import ENGINES, Engine
+from .packed import pack, score_packed, unpack
+from .reference import mutate, random_character, random_phrase, score
+from .runner import (
+    ConsoleSink,
+    FileSink,
+    Generation,
+    NullSink,
+    Tee,
+    compare,
+    evolve,
+    generations,
+    load_checkpoint,
+    save_checkpoint,
+    time_generation,
+)
+from .strategies import (
+    ElitistTopK,
+    FixedCount,
+    Hamming,
+    PerGene,
+    Roulette,
+    Sparse,
+    Tournament,
+    Truncation,
+    WeaselResult,
+    WeaselRun,
+    Weighted,
+)
+from .vectorized import decode, encode
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
@@ -0,0 +1,92 @@
+# Command line of the shared weasel: `python -m weaselcore --engine numpy ...`
+import argparse
+
+from .defaults import (
+    CHARACTERS,
+    CHECKPOINT_SECONDS,
+    MUTATION_RATE,
+    POPULATION_SIZE,
+    TARGET_PHRASE,
+)
+from .engines import ENGINES
+from .runner import ConsoleSink, FileSink, Tee, compare, evolve, load_checkpoint
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dawkins' weasel program")
+    parser.add_argument("--engine", choices=ENGINES, default="loop")
+    parser.add_argument("--population", type=int, default=POPULATION_SIZE)
+    parser.add_argument("--rate", type=float, default=MUTATION_RATE)
+    parser.add_argument("--target", default=TARGET_PHRASE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--max-generations",
+        type=int,
+        default=None,
+        help="stop after this many generations even if the target was not found",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="time both engines for populations from 100 to 1,000,000",
+    )
+    parser.add_argument(
+        "--every", type=int, default=1, help="print every N generations (0: none)"
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=None, help="also print after T seconds"
+    )
+    parser.add_argument("--log", metavar="PATH", help="write every generation here")
+    parser.add_argument("--quiet", action="store_true", help="print nothing")
+    parser.add_argument("--checkpoint", metavar="PATH", help="save the run here")
+    parser.add_argument(
+        "--checkpoint-seconds",
+        type=float,
+        default=CHECKPOINT_SECONDS,
+        help="seconds between checkpoints",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="PATH",
+        help="continue the run saved in this checkpoint (its settings win)",
+    )
+    args = parser.parse_args(argv)
+    state = None
+    if args.resume:
+        state = load_checkpoint(args.resume)
+        config = state["config"]
+        args.engine = config["engine"]
+        args.checkpoint = args.checkpoint or args.resume
+    if (ENGINES[args.engine].uses_numpy or args.compare) and np is None:
+        parser.error(f"the {args.engine} engine needs NumPy installed")
+    if set(args.target) - set(CHARACTERS):
+        parser.error("the target must use only " + repr(CHARACTERS))
+    if args.compare:
+        compare()
+    else:
+        sinks = []
+        if not args.quiet:
+            sinks.append(ConsoleSink(args.every, args.seconds))
+        if args.log:
+            sinks.append(FileSink(args.log))
+        if state is None:
+            config = {
+                "engine": args.engine,
+                "population_size": args.population,
+                "seed": args.seed,
+                "rate": args.rate,
+                "target": args.target,
+                "max_generations": args.max_generations,
+            }
+        evolve(
+            **config,
+            sink=Tee(*sinks),
+            checkpoint=args.checkpoint,
+            checkpoint_seconds=args.checkpoint_seconds,
+            state=state,
+        )
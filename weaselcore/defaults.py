@@ -0,0 +1,9 @@
+# Settings shared by every engine and front-end
+TARGET_PHRASE = "METHINKS IT IS LIKE A WEASEL"
+POPULATION_SIZE = 100
+MUTATION_RATE = 0.05
+CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+# Rows per block in the NumPy engines: bounds the temporary arrays for huge populations
+CHUNK_ROWS = 1 << 16
+# Seconds between checkpoints of a run given a checkpoint path
+CHECKPOINT_SECONDS = 30.0
@@ -0,0 +1,157 @@
+# Engine registry: every way of running one generation, by name.
+# An engine is built from the current parent phrase and the run settings
+# (`rng` is the run's NumPy generator, None unless `uses_numpy`); `step()`
+# runs one generation, keeps its best copy as the next parent and returns
+# (best phrase, best score). Python engines draw from the `random` module.
+import multiprocessing as mp
+import os
+
+from .defaults import CHUNK_ROWS
+from .packed import next_generation_packed, pack, unpack
+from .reference import (
+    child_mutations,
+    match_bitmap,
+    next_generation,
+    next_generation_incremental,
+    sparse_mutations,
+)
+from .vectorized import decode, encode, next_generation_numpy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Engine:
+    uses_numpy = False
+
+    def __init__(self, phrase, population_size, rate, target, rng=None):
+        self.phrase = phrase
+        self.population_size = population_size
+        self.rate = rate
+        self.target = target
+        self.rng = rng
+
+    def close(self):
+        pass
+
+
+class LoopEngine(Engine):
+    # Pure-Python reference: a coin flip per character, every child rescored
+    def step(self):
+        self.phrase, score = next_generation(
+            self.phrase, self.population_size, self.rate, self.target
+        )
+        return self.phrase, score
+
+
+class IncrementalEngine(Engine):
+    # Children as edit lists scored from the parent's match bitmap
+    sampler = staticmethod(child_mutations)
+
+    def __init__(self, phrase, population_size, rate, target, rng=None):
+        super().__init__(phrase, population_size, rate, target, rng)
+        self.matches = match_bitmap(phrase, target)
+        self.score = sum(self.matches)
+
+    def step(self):
+        self.phrase, self.score, self.matches = next_generation_incremental(
+            self.phrase,
+            self.score,
+            self.matches,
+            self.population_size,
+            self.rate,
+            self.target,
+            self.sampler,
+        )
+        return self.phrase, self.score
+
+
+class SparseEngine(IncrementalEngine):
+    # The incremental engine drawing geometric skips instead of coin flips
+    sampler = staticmethod(sparse_mutations)
+
+
+class NumpyEngine(Engine):
+    # A generation as uint8 array operations, in blocks of CHUNK_ROWS
+    uses_numpy = True
+
+    def __init__(self, phrase, population_size, rate, target, rng=None):
+        super().__init__(phrase, population_size, rate, target, rng)
+        self.parent = encode(phrase)
+
+    def step(self):
+        self.parent, score = next_generation_numpy(
+            self.parent, self.rng, self.population_size, self.rate, self.target
+        )
+        return decode(self.parent), score
+
+
+class PackedEngine(Engine):
+    # Genes as 5-bit fields of uint64 words
+    uses_numpy = True
+
+    def __init__(self, phrase, population_size, rate, target, rng=None):
+        super().__init__(phrase, population_size, rate, target, rng)
+        self.parent = pack(phrase)
+
+    def step(self):
+        self.parent, score = next_generation_packed(
+            self.parent, self.rng, self.population_size, self.rate, self.target
+        )
+        return unpack(self.parent, len(self.target)), score
+
+
+def _block_generation(job):
+    # One block of a multiprocess generation, in a worker process
+    parent, rows, rate, target, seed = job
+    return next_generation_numpy(
+        parent, np.random.default_rng(seed), rows, rate, target
+    )
+
+
+class MultiprocessEngine(NumpyEngine):
+    # The NumPy engine with the blocks of a generation spread over a process
+    # pool. Each block gets its own seed from the run's generator, so the
+    # results do not depend on the number of workers; a population of one
+    # block is run in this process. Pays off from a few blocks per worker.
+    workers = None
+
+    def __init__(self, phrase, population_size, rate, target, rng=None):
+        super().__init__(phrase, population_size, rate, target, rng)
+        self._pool = None
+
+    def step(self):
+        size = self.population_size
+        rows = [min(CHUNK_ROWS, size - lo) for lo in range(0, size, CHUNK_ROWS)]
+        seeds = self.rng.integers(0, 2**63, len(rows)).tolist()
+        jobs = [
+            (self.parent, n, self.rate, self.target, seed)
+            for n, seed in zip(rows, seeds)
+        ]
+        if len(jobs) == 1:
+            results = [_block_generation(jobs[0])]
+        else:
+            if self._pool is None:
+                self._pool = mp.Pool(self.workers or os.cpu_count() or 1)
+            results = self._pool.map(_block_generation, jobs)
+        # the first best block wins, as with the other engines
+        self.parent, score = max(results, key=lambda result: result[1])
+        return decode(self.parent), score
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+ENGINES = {
+    "loop": LoopEngine,
+    "incremental": IncrementalEngine,
+    "sparse": SparseEngine,
+    "numpy": NumpyEngine,
+    "packed": PackedEngine,
+    "multiprocess": MultiprocessEngine,
+}
@@ -0,0 +1,326 @@
+# Island model: K populations of the configurable API evolving side by side in
+# a process pool, exchanging their best copies every few generations.
+# `python -m weaselcore.islands --length 1000 --islands 8 --scale`
+import argparse
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+
+from .defaults import CHARACTERS
+from .strategies import WeaselRun
+from .vectorized import decode
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TOPOLOGIES = ("ring", "all")
+ISLAND_POPULATION = 100
+MIGRATE_EVERY = 50
+MAX_GENERATIONS = 20_000
+
+# Per-process state set by `_init_worker`: the shared arrays and the epoch barrier
+_shared = {}
+
+
+def long_target(length, seed=0):
+    # Random target phrase of any length (the island model is meant for long ones)
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(CHARACTERS), length)
+    return "".join(CHARACTERS[i] for i in picks)
+
+
+def island_seeds(seed, islands):
+    # Independent seeds for every island, derived from one run seed
+    state = np.random.SeedSequence(seed).generate_state(islands)
+    return [int(s) for s in state]
+
+
+def _create_shared(islands, length):
+    # Blocks every island publishes to after each epoch:
+    # best row, best score and the generation the target was found (0 = not yet)
+    return {
+        "bests": shared_memory.SharedMemory(create=True, size=islands * length),
+        "scores": shared_memory.SharedMemory(create=True, size=islands * 8),
+        "found": shared_memory.SharedMemory(create=True, size=islands * 8),
+    }
+
+
+def _views(blocks, islands, length):
+    return (
+        np.ndarray((islands, length), np.uint8, blocks["bests"].buf),
+        np.ndarray(islands, np.float64, blocks["scores"].buf),
+        np.ndarray(islands, np.int64, blocks["found"].buf),
+    )
+
+
+def _init_worker(names, islands, length, barrier):
+    # Remember where the shared blocks are; `_attach` maps them inside the job,
+    # where a failure can still abort the barrier
+    _shared["names"] = names
+    _shared["shape"] = islands, length
+    _shared["barrier"] = barrier
+
+
+def _attach():
+    # Attach to the parent's shared blocks once per process
+    if "views" not in _shared:
+        blocks = {
+            key: shared_memory.SharedMemory(name=name)
+            for key, name in _shared["names"].items()
+        }
+        _shared["blocks"] = blocks
+        _shared["views"] = _views(blocks, *_shared["shape"])
+    return _shared["views"]
+
+
+def _migrant_source(island, islands, topology, scores):
+    # ring: the previous island; all: the best other island
+    if topology == "ring":
+        return (island - 1) % islands
+    others = scores.copy()
+    others[island] = -np.inf
+    return int(others.argmax())
+
+
+def _run_islands(job):
+    # A failing worker aborts the barrier, so the others raise
+    # BrokenBarrierError instead of waiting forever and the pool reports the error
+    try:
+        return _evolve_islands(job, *_attach())
+    except BaseException:
+        _shared["barrier"].abort()
+        raise
+
+
+def _evolve_islands(job, bests, scores, found):
+    # Evolve the islands owned by one worker in epochs of `migrate_every` generations.
+    # Between epochs every worker publishes its bests, waits for the others, stops if
+    # any island found the target, then takes in its migrants and waits again.
+    mine, settings = job
+    barrier = _shared["barrier"]
+    islands = len(scores)
+    runs = {}
+    states = {}
+    for island in mine:
+        runs[island] = WeaselRun(
+            target=settings["target"],
+            population_size=settings["population"],
+            mutation_rate=settings["rate"],
+            parents=settings["parents"],
+            seed=settings["seeds"][island],
+        )
+        states[island] = runs[island].start()
+    generation = 0
+    while generation < settings["max_generations"]:
+        epoch = min(settings["migrate_every"], settings["max_generations"] - generation)
+        for island in mine:
+            run = runs[island]
+            parents, rng = states[island]
+            for offset in range(1, epoch + 1):
+                best, score, hit, parents = run.step(parents, rng)
+                if hit:
+                    found[island] = generation + offset
+                    break
+            states[island] = parents, rng
+            bests[island] = best
+            scores[island] = score
+        generation += epoch
+        barrier.wait()
+        if found.any():
+            break
+        for island in mine:
+            run = runs[island]
+            parents, rng = states[island]
+            source = _migrant_source(island, islands, settings["topology"], scores)
+            own = run.scoring(parents, run._target)
+            worst = int(own.argmin())
+            # a migrant only replaces the worst parent it beats
+            if scores[source] > own[worst]:
+                parents = parents.copy()
+                parents[worst] = bests[source]
+                states[island] = parents, rng
+        barrier.wait()
+    return generation
+
+
+def run_islands(
+    target,
+    islands=4,
+    population=ISLAND_POPULATION,
+    rate=None,
+    parents=1,
+    migrate_every=MIGRATE_EVERY,
+    topology="ring",
+    workers=None,
+    seed=0,
+    max_generations=MAX_GENERATIONS,
+):
+    # K island populations spread over `workers` processes; returns a report dict
+    if np is None:
+        raise RuntimeError("the island model needs NumPy installed")
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"unknown topology {topology!r}; choose from {TOPOLOGIES}")
+    workers = min(islands, workers or os.cpu_count() or 1)
+    # long targets need a low per-gene rate: about one mutation per child
+    rate = 1 / len(target) if rate is None else rate
+    settings = {
+        "target": target,
+        "population": population,
+        "rate": rate,
+        "parents": parents,
+        "migrate_every": migrate_every,
+        "topology": topology,
+        "seeds": island_seeds(seed, islands),
+        "max_generations": max_generations,
+    }
+    # islands are dealt round-robin, so each worker gets one job and one barrier slot
+    jobs = [(list(range(w, islands, workers)), settings) for w in range(workers)]
+    blocks = _create_shared(islands, len(target))
+    bests, scores, found = _views(blocks, islands, len(target))
+    found[:] = 0
+    start = time.perf_counter()
+    try:
+        pool = mp.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(
+                {key: block.name for key, block in blocks.items()},
+                islands,
+                len(target),
+                mp.Barrier(workers),
+            ),
+        )
+        try:
+            ran = pool.map(_run_islands, jobs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        seconds = time.perf_counter() - start
+        winner = int(scores.argmax())
+        hits = found[found > 0]
+        report = {
+            "islands": islands,
+            "workers": workers,
+            "population": population,
+            "mutation_rate": rate,
+            "migrate_every": migrate_every,
+            "topology": topology,
+            "length": len(target),
+            "seed": seed,
+            "found": bool(len(hits)),
+            "generations": int(hits.min()) if len(hits) else max(ran),
+            "best": decode(bests[winner]),
+            "score": float(scores[winner]),
+            "seconds": seconds,
+        }
+    finally:
+        del bests, scores, found
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+    return report
+
+
+def run_single(
+    target, population, rate=None, parents=1, seed=0, max_generations=MAX_GENERATIONS
+):
+    # The single-process engine on one population of the same total size
+    rate = 1 / len(target) if rate is None else rate
+    result = WeaselRun(
+        target=target,
+        population_size=population,
+        mutation_rate=rate,
+        parents=parents,
+        seed=seed,
+        max_generations=max_generations,
+    ).run()
+    return {
+        "workers": 0,
+        "found": result.found,
+        "generations": result.generations,
+        "score": float(result.score),
+        "seconds": result.seconds,
+    }
+
+
+def scale(target, islands, worker_counts, **options):
+    # Time the island model for each worker count against the single-process engine
+    single = run_single(
+        target,
+        islands * options.get("population", ISLAND_POPULATION),
+        options.get("rate"),
+        options.get("parents", 1),
+        options.get("seed", 0),
+        options.get("max_generations", MAX_GENERATIONS),
+    )
+    rows = [single]
+    print(f"{'workers':>8}  {'found':>5}  {'gens':>7}  {'seconds':>9}  {'speedup':>8}")
+    print(
+        f"{'single':>8}  {single['found']!s:>5}  {single['generations']:>7}"
+        f"  {single['seconds']:>9.2f}  {1.0:>7.1f}x"
+    )
+    for workers in worker_counts:
+        report = run_islands(target, islands, workers=workers, **options)
+        report["speedup"] = single["seconds"] / report["seconds"]
+        rows.append(report)
+        print(
+            f"{report['workers']:>8}  {report['found']!s:>5}  {report['generations']:>7}"
+            f"  {report['seconds']:>9.2f}  {report['speedup']:>7.1f}x"
+        )
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Island-model weasel on several processes")
+    parser.add_argument("--length", type=int, default=1_000, help="length of the random target")
+    parser.add_argument("--target", help="evolve this phrase instead of a random one")
+    parser.add_argument("--islands", type=int, default=4)
+    parser.add_argument("--population", type=int, default=ISLAND_POPULATION, help="per island")
+    parser.add_argument("--rate", type=float, default=None, help="default: 1 / target length")
+    parser.add_argument("--parents", type=int, default=1)
+    parser.add_argument("--migrate-every", type=int, default=MIGRATE_EVERY)
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="ring")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-generations", type=int, default=MAX_GENERATIONS)
+    parser.add_argument(
+        "--scale",
+        action="store_true",
+        help="compare 1, 2, 4, ... workers against the single-process engine",
+    )
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error("the island model needs NumPy installed")
+    target = args.target or long_target(args.length, args.seed)
+    if set(target) - set(CHARACTERS):
+        parser.error("the target must use only " + repr(CHARACTERS))
+    options = {
+        "population": args.population,
+        "rate": args.rate,
+        "parents": args.parents,
+        "migrate_every": args.migrate_every,
+        "topology": args.topology,
+        "seed": args.seed,
+        "max_generations": args.max_generations,
+    }
+    if args.scale:
+        limit = min(args.islands, args.workers or os.cpu_count() or 1)
+        counts = [1]
+        while counts[-1] * 2 <= limit:
+            counts.append(counts[-1] * 2)
+        scale(target, args.islands, counts, **options)
+        return
+    report = run_islands(target, args.islands, workers=args.workers, **options)
+    print(
+        f"{report['islands']} islands on {report['workers']} workers: "
+        f"{'found' if report['found'] else 'not found'} after {report['generations']} "
+        f"generations in {report['seconds']:.2f}s (best score {report['score']:.0f}"
+        f" of {report['length']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
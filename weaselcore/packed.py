@@ -0,0 +1,120 @@
+# Bit-packed engine: a gene is its 5-bit index into CHARACTERS and a uint64
+# word holds GENES_PER_WORD of them, so a row takes ceil(length / 12) words.
+# Scoring XORs whole words against the packed target and counts the 5-bit
+# fields that differ; mutation rewrites single fields through bit masks.
+from .defaults import (
+    CHARACTERS,
+    CHUNK_ROWS,
+    MUTATION_RATE,
+    POPULATION_SIZE,
+    TARGET_PHRASE,
+)
+from .vectorized import decode, encode
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GENE_BITS = 5
+GENES_PER_WORD = 64 // GENE_BITS
+GENE_MASK = (1 << GENE_BITS) - 1
+# the lowest bit of every gene field in a word
+FIELD_LOW_BITS = sum(1 << (GENE_BITS * i) for i in range(GENES_PER_WORD))
+
+
+def _shifts():
+    return np.arange(GENES_PER_WORD, dtype=np.uint64) * np.uint64(GENE_BITS)
+
+
+def pack(phrase):
+    # One phrase -> 1-D uint64 words (unused fields of the last word are 0)
+    genes = np.zeros(256, np.uint64)
+    genes[encode(CHARACTERS)] = np.arange(len(CHARACTERS), dtype=np.uint64)
+    words = -(-len(phrase) // GENES_PER_WORD)
+    fields = np.zeros(words * GENES_PER_WORD, np.uint64)
+    fields[: len(phrase)] = genes[encode(phrase)]
+    # the fields do not overlap, so their sum is their bitwise OR
+    return (fields.reshape(words, GENES_PER_WORD) << _shifts()).sum(
+        axis=1, dtype=np.uint64
+    )
+
+
+def unpack(words, length):
+    fields = (words[:, None] >> _shifts()) & np.uint64(GENE_MASK)
+    return decode(encode(CHARACTERS)[fields.reshape(-1)[:length]])
+
+
+def _popcount(words):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    # NumPy < 2.0: count the set bits byte by byte
+    table = np.array([bin(i).count("1") for i in range(256)], np.uint8)
+    octets = table[words.view(np.uint8)].reshape(*words.shape, 8)
+    return octets.sum(axis=-1, dtype=np.uint8)
+
+
+def score_packed(population, target_words, length):
+    # Matching genes per row of a (rows, words) packed population
+    diff = population ^ target_words
+    # fold every 5-bit field onto its lowest bit: set if the field differs
+    folded = diff | (diff >> np.uint64(1)) | (diff >> np.uint64(2))
+    folded |= (diff >> np.uint64(3)) | (diff >> np.uint64(4))
+    folded &= np.uint64(FIELD_LOW_BITS)
+    return length - _popcount(folded).sum(axis=1, dtype=np.int64)
+
+
+def _bernoulli_positions(total, rate, rng):
+    # The positions in range(total) that mutate, each independently with
+    # probability `rate`: the gaps between them are geometric, so this draws
+    # about one number per mutation instead of one per gene
+    if rate <= 0:
+        return np.empty(0, np.int64)
+    if rate >= 1:
+        return np.arange(total)
+    expected = total * rate
+    batch = int(expected + 4 * expected**0.5) + 16
+    positions = np.cumsum(rng.geometric(rate, batch)) - 1
+    while positions[-1] < total:
+        more = np.cumsum(rng.geometric(rate, batch)) + positions[-1]
+        positions = np.concatenate((positions, more))
+    return positions[: np.searchsorted(positions, total)]
+
+
+def mutate_packed(population, length, rate, rng):
+    # Every gene of the (rows, words) population mutates with probability `rate`
+    rows, words = population.shape
+    genes = _bernoulli_positions(rows * length, rate, rng)
+    row, col = np.divmod(genes, length)
+    word, field = np.divmod(col, GENES_PER_WORD)
+    shift = field.astype(np.uint64) * np.uint64(GENE_BITS)
+    new = rng.integers(0, len(CHARACTERS), genes.size).astype(np.uint64)
+    flat = population.reshape(-1)
+    index = row * words + word
+    # several mutations can land in the same word: ufunc.at applies them all
+    np.bitwise_and.at(flat, index, ~(np.uint64(GENE_MASK) << shift))
+    np.bitwise_or.at(flat, index, new << shift)
+
+
+def next_generation_packed(
+    parent,
+    rng,
+    population_size=POPULATION_SIZE,
+    rate=MUTATION_RATE,
+    target=TARGET_PHRASE,
+):
+    # Steps 2-5 on packed rows, in blocks of CHUNK_ROWS; `parent` is pack()ed.
+    # The first best row wins, as with the other engines.
+    target_words = pack(target)
+    best_row = None
+    best_score = -1
+    for start in range(0, population_size, CHUNK_ROWS):
+        rows = min(CHUNK_ROWS, population_size - start)
+        population = np.broadcast_to(parent, (rows, parent.size)).copy()
+        mutate_packed(population, len(target), rate, rng)
+        scores = score_packed(population, target_words, len(target))
+        i = int(scores.argmax())
+        if scores[i] > best_score:
+            best_score = int(scores[i])
+            best_row = population[i].copy()
+    return best_row, best_score
@@ -0,0 +1,116 @@
+# Pure-Python engines: the reference loop and the incremental/sparse variants
+import math
+import random
+
+from .defaults import CHARACTERS, MUTATION_RATE, POPULATION_SIZE, TARGET_PHRASE
+
+
+def random_character():
+    return random.choice(CHARACTERS)
+
+
+def random_phrase(length):
+    # Step 1: Generate a random phrase of the same length as the target
+    return ''.join(random_character() for _ in range(length))
+
+
+def mutate(phrase, rate=MUTATION_RATE):
+    # Step 3: Apply mutations to each character with 5% chance
+    return ''.join(
+        random_character() if random.random() < rate else c
+        for c in phrase
+    )
+
+
+def score(phrase, target=TARGET_PHRASE):
+    # Step 4: Score each copy by comparing with the target phrase
+    return sum(1 for a, b in zip(phrase, target) if a == b)
+
+
+def next_generation(
+    phrase, population_size=POPULATION_SIZE, rate=MUTATION_RATE, target=TARGET_PHRASE
+):
+    # Steps 2-5 with plain Python: copies, mutation, scoring and selection
+    population = [mutate(phrase, rate) for _ in range(population_size)]
+    scores = [score(p, target) for p in population]
+    best_score = max(scores)
+    return population[scores.index(best_score)], best_score
+
+
+# Incremental engine: a child is kept as its edits against the parent, and
+# scored from the parent's score and per-position match bitmap, so scoring
+# costs O(mutations) instead of O(length). Same draws as the loop engine.
+
+def mutations(length, rate=MUTATION_RATE):
+    # Step 3 as a list of (position, character) edits, drawn like mutate()
+    return [
+        (i, random_character())
+        for i in range(length)
+        if random.random() < rate
+    ]
+
+
+def child_mutations(length, count, rate=MUTATION_RATE):
+    # Step 3 for a whole generation: `count` edit lists, one mutations() each
+    return [mutations(length, rate) for _ in range(count)]
+
+
+def sparse_mutations(length, count, rate=MUTATION_RATE):
+    # Step 3 with geometric skips: jump straight to the next mutated position
+    # instead of flipping a coin per character. The skips run over the
+    # generation's `count` children laid end to end, so only one draw per
+    # generation (not per child) is spent stepping past the end. Each
+    # position still mutates independently with probability `rate`, so
+    # children are distributed exactly as with mutations().
+    if rate <= 0:
+        return [[] for _ in range(count)]
+    if rate >= 1:
+        return [
+            [(i, random_character()) for i in range(length)] for _ in range(count)
+        ]
+    log_keep = math.log1p(-rate)
+    children = [[] for _ in range(count)]
+    total = length * count
+    i = int(math.log(1.0 - random.random()) / log_keep)
+    while i < total:
+        child, pos = divmod(i, length)
+        children[child].append((pos, random_character()))
+        i += 1 + int(math.log(1.0 - random.random()) / log_keep)
+    return children
+
+
+def match_bitmap(phrase, target=TARGET_PHRASE):
+    return [a == b for a, b in zip(phrase, target)]
+
+
+def score_edits(edits, parent_score, matches, target=TARGET_PHRASE):
+    # Step 4 from the edited positions only
+    for i, c in edits:
+        parent_score += (c == target[i]) - matches[i]
+    return parent_score
+
+
+def next_generation_incremental(
+    phrase,
+    parent_score,
+    matches,
+    population_size=POPULATION_SIZE,
+    rate=MUTATION_RATE,
+    target=TARGET_PHRASE,
+    sampler=child_mutations,
+):
+    # Steps 2-5 on edit lists; only the best child is turned back into a phrase.
+    # `sampler(length, count, rate)` draws the edits of every child. Returns
+    # (best phrase, best score, its match bitmap)
+    best_edits = None
+    best_score = -1
+    for edits in sampler(len(phrase), population_size, rate):
+        child_score = score_edits(edits, parent_score, matches, target)
+        if child_score > best_score:
+            best_edits, best_score = edits, child_score
+    chars = list(phrase)
+    matches = list(matches)
+    for i, c in best_edits:
+        chars[i] = c
+        matches[i] = c == target[i]
+    return ''.join(chars), best_score, matches
@@ -0,0 +1,276 @@
+# Running the engines: the streaming generations() API with its checkpoints,
+# the output sinks, evolve() on top of both, and per-generation timing
+import os
+import pickle
+import random
+import time
+from dataclasses import dataclass
+
+from .defaults import (
+    CHECKPOINT_SECONDS,
+    MUTATION_RATE,
+    POPULATION_SIZE,
+    TARGET_PHRASE,
+)
+from .engines import ENGINES
+from .reference import random_phrase
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass
+class Generation:
+    # One record of the streaming API: the best copy of a generation
+    generation: int
+    best: str
+    score: int
+
+
+def save_checkpoint(path, config, generation, phrase, rng=None):
+    # Everything needed to continue a run exactly, pickled to a temporary file
+    # that then replaces `path`, so a crash never leaves a half-written file
+    state = {
+        "config": config,
+        "generation": generation,
+        "phrase": phrase,
+        "random": random.getstate(),
+        "rng": rng.bit_generator.state if rng is not None else None,
+    }
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as fh:
+        pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    # The state written by save_checkpoint (only load files you wrote yourself)
+    with open(path, "rb") as fh:
+        return pickle.load(fh)
+
+
+def generations(
+    engine="loop",
+    population_size=POPULATION_SIZE,
+    seed=None,
+    rate=MUTATION_RATE,
+    target=TARGET_PHRASE,
+    max_generations=None,
+    checkpoint=None,
+    checkpoint_seconds=CHECKPOINT_SECONDS,
+    state=None,
+):
+    # Yield a Generation per generation, lazily, until the target is found
+    # (that record is the last one) or max_generations have run.
+    # With a `checkpoint` path the run is saved there every checkpoint_seconds;
+    # `state` (from load_checkpoint) continues a saved run instead of a new one.
+    config = {
+        "engine": engine,
+        "population_size": population_size,
+        "seed": seed,
+        "rate": rate,
+        "target": target,
+        "max_generations": max_generations,
+    }
+    make = ENGINES[engine]
+    # without a seed the `random` module keeps its current state, so callers
+    # that seeded it themselves get their own sequence
+    if seed is not None:
+        random.seed(seed)
+    rng = np.random.default_rng(seed) if make.uses_numpy else None
+    # Step 1: Generate the initial random phrase
+    phrase = random_phrase(len(target))
+    generation = 0
+    if state is not None:
+        generation = state["generation"]
+        phrase = state["phrase"]
+        random.setstate(state["random"])
+        if rng is not None:
+            rng.bit_generator.state = state["rng"]
+    runner = make(phrase, population_size, rate, target, rng)
+    saved = time.perf_counter()
+    try:
+        while max_generations is None or generation < max_generations:
+            generation += 1
+            # Steps 2-5: copies, mutation, scoring, best copy becomes the parent
+            best_phrase, best_score = runner.step()
+            if checkpoint and time.perf_counter() - saved >= checkpoint_seconds:
+                save_checkpoint(checkpoint, config, generation, best_phrase, rng)
+                saved = time.perf_counter()
+            yield Generation(generation, best_phrase, best_score)
+            # Step 6: Check if the target phrase was found
+            if best_score == len(target):
+                return
+    finally:
+        runner.close()
+
+
+# Sinks take the records of a run: `emit(record)` for every generation and
+# `finish(record, found)` once at the end (`record` is None if nothing ran).
+
+
+class NullSink:
+    # Discards everything: the run pays for no output at all
+    def emit(self, record):
+        pass
+
+    def finish(self, record, found):
+        pass
+
+
+class ConsoleSink:
+    # Prints every `every` generations and/or after `seconds` have passed since
+    # the last line; the last generation is always printed. `line` and `done`
+    # are the messages, formatted with the fields of the record.
+    def __init__(
+        self,
+        every=1,
+        seconds=None,
+        stream=None,
+        line="Generation {generation}: {best} (Score: {score})",
+        done="Target phrase found in {generation} generations!",
+    ):
+        self.every = every
+        self.seconds = seconds
+        self.stream = stream
+        self.line = line
+        self.done = done
+        self._printed = 0
+        self._last = time.perf_counter()
+
+    def _print(self, record):
+        print(self.line.format(**vars(record)), file=self.stream)
+        self._printed = record.generation
+        self._last = time.perf_counter()
+
+    def emit(self, record):
+        if self.every and record.generation % self.every == 0:
+            self._print(record)
+        elif (
+            self.seconds is not None
+            and time.perf_counter() - self._last >= self.seconds
+        ):
+            self._print(record)
+
+    def finish(self, record, found):
+        if record is not None and self._printed != record.generation:
+            self._print(record)
+        if found:
+            print(self.done.format(**vars(record)), file=self.stream)
+
+
+class FileSink:
+    # Writes one tab-separated line per generation, `buffer` lines at a time
+    def __init__(self, path, buffer=1_000):
+        self.path = path
+        self.buffer = buffer
+        self._lines = []
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write("generation\tscore\tbest\n")
+
+    def _flush(self):
+        self._file.writelines(self._lines)
+        self._lines.clear()
+
+    def emit(self, record):
+        self._lines.append(f"{record.generation}\t{record.score}\t{record.best}\n")
+        if len(self._lines) >= self.buffer:
+            self._flush()
+
+    def finish(self, record, found):
+        self._flush()
+        self._file.close()
+
+
+class Tee:
+    # Hands every record to several sinks
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def emit(self, record):
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def finish(self, record, found):
+        for sink in self.sinks:
+            sink.finish(record, found)
+
+
+def evolve(
+    engine="loop",
+    population_size=POPULATION_SIZE,
+    seed=None,
+    verbose=True,
+    rate=MUTATION_RATE,
+    target=TARGET_PHRASE,
+    max_generations=None,
+    sink=None,
+    checkpoint=None,
+    checkpoint_seconds=CHECKPOINT_SECONDS,
+    state=None,
+):
+    # Run until the target is found (or max_generations have run), feeding
+    # every generation to `sink` (default: print all of them if verbose);
+    # returns (generations, found). See generations() for the checkpoints.
+    if sink is None:
+        sink = ConsoleSink() if verbose else NullSink()
+    record = None
+    for record in generations(
+        engine,
+        population_size,
+        seed,
+        rate,
+        target,
+        max_generations,
+        checkpoint,
+        checkpoint_seconds,
+        state,
+    ):
+        sink.emit(record)
+    found = record is not None and record.score == len(target)
+    sink.finish(record, found)
+    return (record.generation if record else 0), found
+
+
+def time_generation(engine, population_size, min_seconds=0.2):
+    # Seconds per generation, averaged over enough repeats to last min_seconds
+    # (after one untimed generation, which also starts any worker pool)
+    random.seed(0)
+    runner = ENGINES[engine](
+        random_phrase(len(TARGET_PHRASE)),
+        population_size,
+        MUTATION_RATE,
+        TARGET_PHRASE,
+        np.random.default_rng(0) if np is not None else None,
+    )
+    try:
+        runner.step()
+        runs = 0
+        start = time.perf_counter()
+        while True:
+            runner.step()
+            runs += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                return elapsed / runs
+    finally:
+        runner.close()
+
+
+def compare(sizes=(100, 1_000, 10_000, 100_000, 1_000_000)):
+    # Time one generation of each engine per population size and print the speedup
+    print(f"{'population':>10}  {'loop ms':>10}  {'numpy ms':>10}  {'speedup':>8}")
+    results = []
+    for size in sizes:
+        loop_s = time_generation("loop", size)
+        numpy_s = time_generation("numpy", size)
+        results.append((size, loop_s, numpy_s))
+        print(
+            f"{size:>10}  {loop_s * 1000:>10.3f}  {numpy_s * 1000:>10.3f}"
+            f"  {loop_s / numpy_s:>7.1f}x"
+        )
+    return results
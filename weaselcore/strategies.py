@@ -0,0 +1,235 @@
+# Configurable API: WeaselRun takes every setting in defaults as a parameter
+# plus pluggable strategies, and returns a WeaselResult instead of printing.
+# Strategies work on NumPy arrays: a population is a (size, length) uint8
+# array of character codes and scores are one number per row.
+#   selection(scores, count, rng) -> row indices of the next parents
+#     (a selection with `keeps_parents = True` also sees the current parents,
+#     appended after the children; plain functions are not elitist)
+#   mutation(population, rate, charset, rng) -> mutates the rows in place
+#   scoring(population, target) -> scores (higher is better)
+import random
+import time
+from dataclasses import dataclass, field
+
+from .defaults import (
+    CHARACTERS,
+    CHUNK_ROWS,
+    MUTATION_RATE,
+    POPULATION_SIZE,
+    TARGET_PHRASE,
+)
+from .vectorized import decode, encode
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Truncation:
+    # The `count` best rows, first best first (the classic weasel with count=1)
+    keeps_parents = False
+
+    def __call__(self, scores, count, rng):
+        if count == 1:
+            return np.array([scores.argmax()])
+        return np.argsort(-scores, kind="stable")[:count]
+
+
+class ElitistTopK(Truncation):
+    # Like Truncation, but the current parents compete with their children
+    keeps_parents = True
+
+
+class Tournament:
+    # Each parent is the best of `size` rows drawn at random
+    keeps_parents = False
+
+    def __init__(self, size=3):
+        self.size = size
+
+    def __call__(self, scores, count, rng):
+        entrants = rng.integers(0, scores.size, (count, self.size))
+        winners = scores[entrants].argmax(axis=1)
+        return entrants[np.arange(count), winners]
+
+
+class Roulette:
+    # Parents drawn with probability proportional to score (uniform if all zero)
+    keeps_parents = False
+
+    def __call__(self, scores, count, rng):
+        total = np.cumsum(scores, dtype=float)
+        if total[-1] <= 0:
+            return rng.integers(0, scores.size, count)
+        return np.searchsorted(total, rng.random(count) * total[-1], side="right")
+
+
+class PerGene:
+    # Every gene mutates independently with probability `rate`
+    def __call__(self, population, rate, charset, rng):
+        mask = rng.random(population.shape, dtype=np.float32) < rate
+        draws = rng.integers(0, charset.size, np.count_nonzero(mask))
+        population[mask] = charset[draws]
+
+
+class Sparse:
+    # Same distribution as PerGene without a draw per gene: the number of
+    # mutations is binomial, then that many distinct genes are picked
+    def __call__(self, population, rate, charset, rng):
+        count = rng.binomial(population.size, min(max(rate, 0.0), 1.0))
+        if not count:
+            return
+        genes = rng.choice(population.size, count, replace=False)
+        population.reshape(-1)[genes] = charset[rng.integers(0, charset.size, count)]
+
+
+class FixedCount:
+    # Exactly `count` distinct genes of every row mutate (`rate` is ignored)
+    def __init__(self, count=1):
+        self.count = count
+
+    def __call__(self, population, rate, charset, rng):
+        rows, length = population.shape
+        count = min(self.count, length)
+        if count == 1:
+            cols = rng.integers(0, length, (rows, 1))
+        else:
+            cols = np.argpartition(rng.random((rows, length)), count - 1, axis=1)
+            cols = cols[:, :count]
+        draws = charset[rng.integers(0, charset.size, (rows, count))]
+        population[np.arange(rows)[:, None], cols] = draws
+
+
+class Hamming:
+    # Number of genes equal to the target (length minus the Hamming distance)
+    def __call__(self, population, target):
+        return np.count_nonzero(population == target, axis=1)
+
+
+class Weighted:
+    # Sum of per-position weights over the genes equal to the target
+    def __init__(self, weights):
+        self.weights = np.asarray(weights, dtype=float)
+
+    def __call__(self, population, target):
+        if self.weights.size != target.size:
+            raise ValueError(
+                f"Weighted scoring needs {target.size} weights, got {self.weights.size}"
+            )
+        return (population == target) @ self.weights
+
+
+@dataclass
+class WeaselResult:
+    best: str
+    score: float
+    generations: int
+    found: bool
+    seconds: float
+    # best score of every generation, when the run was asked to record it
+    history: list = field(default_factory=list)
+
+
+class WeaselRun:
+    # One configured evolution run; `run()` can be called again to repeat it
+    def __init__(
+        self,
+        target=TARGET_PHRASE,
+        population_size=POPULATION_SIZE,
+        mutation_rate=MUTATION_RATE,
+        characters=CHARACTERS,
+        selection=None,
+        mutation=None,
+        scoring=None,
+        parents=1,
+        seed=None,
+        max_generations=None,
+        record_history=False,
+    ):
+        if np is None:
+            raise RuntimeError("WeaselRun needs NumPy installed")
+        if not target or set(target) - set(characters):
+            raise ValueError("target must be non-empty and use only `characters`")
+        if not 1 <= parents <= population_size:
+            raise ValueError("parents must be between 1 and population_size")
+        self.target = target
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.characters = characters
+        self.selection = Truncation() if selection is None else selection
+        self.mutation = PerGene() if mutation is None else mutation
+        self.scoring = Hamming() if scoring is None else scoring
+        self.parents = parents
+        self.seed = seed
+        self.max_generations = max_generations
+        self.record_history = record_history
+        self._charset = encode(characters)
+        self._target = encode(target)
+        # children buffer, allocated by the first `step`
+        self._population = None
+
+    def start(self):
+        # Fresh evolution state: (parents, rng) to hand to `step`
+        rng = np.random.default_rng(self.seed)
+        # Step 1: one random phrase (drawn like random_phrase with the same seed)
+        first = random.Random(self.seed)
+        phrase = "".join(first.choice(self.characters) for _ in self.target)
+        return encode(phrase)[None, :], rng
+
+    def step(self, parents, rng):
+        # One generation: returns (best row, best score, found, next parents)
+        size = self.population_size
+        target = self._target
+        population = self._population
+        if population is None:
+            population = self._population = np.empty((size, target.size), np.uint8)
+        # Steps 2-4: children cycle through the parents, then mutate and
+        # score in blocks of CHUNK_ROWS to bound the temporaries
+        population[:] = parents[np.arange(size) % len(parents)]
+        scores = None
+        for lo in range(0, size, CHUNK_ROWS):
+            block = population[lo:lo + CHUNK_ROWS]
+            self.mutation(block, self.mutation_rate, self._charset, rng)
+            part = self.scoring(block, target)
+            if scores is None:
+                scores = np.empty(size, dtype=part.dtype)
+            scores[lo:lo + CHUNK_ROWS] = part
+        best = int(scores.argmax())
+        best_row = population[best].copy()
+        best_score = scores[best].item()
+        # Step 6: Check if the target phrase was found
+        if np.array_equal(best_row, target):
+            return best_row, best_score, True, parents
+        # Step 5: Select the parents of the next generation
+        candidates, pool = population, scores
+        if getattr(self.selection, "keeps_parents", False):
+            candidates = np.concatenate((population, parents))
+            pool = np.concatenate((scores, self.scoring(parents, target)))
+        picked = self.selection(pool, min(self.parents, len(pool)), rng)
+        return best_row, best_score, False, candidates[picked]
+
+    def run(self):
+        start = time.perf_counter()
+        parents, rng = self.start()
+        history = []
+        generation = 0
+        found = False
+        # a run of zero generations reports its starting phrase
+        best = parents[0]
+        score = self.scoring(parents, self._target)[0].item()
+        while self.max_generations is None or generation < self.max_generations:
+            generation += 1
+            best, score, found, parents = self.step(parents, rng)
+            if self.record_history:
+                history.append(score)
+            if found:
+                break
+        return WeaselResult(
+            best=decode(best),
+            score=score,
+            generations=generation,
+            found=found,
+            seconds=time.perf_counter() - start,
+            history=history,
+        )
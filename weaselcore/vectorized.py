@@ -0,0 +1,51 @@
+# NumPy engine: phrases are rows of uint8 character codes, so a whole
+# generation is a handful of array operations instead of per-character calls.
+from .defaults import (
+    CHARACTERS,
+    CHUNK_ROWS,
+    MUTATION_RATE,
+    POPULATION_SIZE,
+    TARGET_PHRASE,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def encode(phrase):
+    return np.frombuffer(phrase.encode("ascii"), dtype=np.uint8).copy()
+
+
+def decode(row):
+    return row.tobytes().decode("ascii")
+
+
+def next_generation_numpy(
+    parent,
+    rng,
+    population_size=POPULATION_SIZE,
+    rate=MUTATION_RATE,
+    target=TARGET_PHRASE,
+):
+    # Steps 2-5 on a (population_size, len(TARGET_PHRASE)) uint8 array: one
+    # masked random draw mutates every copy, scoring is a row-wise equality
+    # sum against the encoded target. Large populations are processed in
+    # blocks of CHUNK_ROWS; the first best row wins, as with the loop engine.
+    charset = encode(CHARACTERS)
+    target = encode(target)
+    best_row = None
+    best_score = -1
+    for start in range(0, population_size, CHUNK_ROWS):
+        rows = min(CHUNK_ROWS, population_size - start)
+        population = np.broadcast_to(parent, (rows, parent.size)).copy()
+        mask = rng.random(population.shape, dtype=np.float32) < rate
+        draws = rng.integers(0, charset.size, np.count_nonzero(mask))
+        population[mask] = charset[draws]
+        scores = np.count_nonzero(population == target, axis=1)
+        i = int(scores.argmax())
+        if scores[i] > best_score:
+            best_score = int(scores[i])
+            best_row = population[i].copy()
+    return best_row, best_score